@@ -0,0 +1,251 @@
+"""Build the KQK, KRK and KPK distance-to-mate tables in server/data/endgame.
+
+Each ending is solved by retrograde analysis over every placement of the
+three pieces with either side to move, with the stronger side as White.
+Checkmates seed the search. From each position solved at ``n`` plies, the
+search steps one move backwards: a White-to-move predecessor wins in
+``n + 1``, and a Black-to-move predecessor is lost once every one of its
+moves leads to a solved win. Positions never reached are draws. KPK
+promotions look up the finished KQK and KRK tables. The full tables are
+then folded into the symmetric layout ``chess_endgame`` probes.
+
+    python scripts/build_endgame_tables.py
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+import chess
+
+SERVER_DIR = Path(__file__).resolve().parents[1] / "server"
+sys.path.insert(0, str(SERVER_DIR))
+
+from chess_endgame import (  # noqa: E402
+    DEFAULT_TABLES_DIR,
+    DRAW,
+    INVALID,
+    TABLE_PIECES,
+    TABLE_SIZES,
+    decode_index,
+)
+
+UNKNOWN = 253
+BLOCKED = 255  # counter for Black positions that can always draw
+WHITE_TO_MOVE, BLACK_TO_MOVE = 0, 1
+SLIDES = {
+    chess.QUEEN: ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)),
+    chess.ROOK: ((1, 0), (-1, 0), (0, 1), (0, -1)),
+}
+
+KING_STEPS = [
+    tuple(
+        target for target in chess.SQUARES if chess.square_distance(square, target) == 1
+    )
+    for square in chess.SQUARES
+]
+NEAR = [
+    [chess.square_distance(a, b) <= 1 for b in chess.SQUARES] for a in chess.SQUARES
+]
+
+
+def _ray(square: int, df: int, dr: int) -> list[int]:
+    file, rank = chess.square_file(square) + df, chess.square_rank(square) + dr
+    ray = []
+    while 0 <= file < 8 and 0 <= rank < 8:
+        ray.append(chess.square(file, rank))
+        file, rank = file + df, rank + dr
+    return ray
+
+
+RAYS = {
+    piece: [[_ray(square, df, dr) for df, dr in directions] for square in chess.SQUARES]
+    for piece, directions in SLIDES.items()
+}
+
+
+def _between(piece: int) -> list[list[tuple[int, ...] | None]]:
+    """Squares strictly between two squares the piece connects, else ``None``."""
+    table: list[list[tuple[int, ...] | None]] = [
+        [None] * 64 for _ in chess.SQUARES
+    ]
+    for square in chess.SQUARES:
+        for ray in RAYS[piece][square]:
+            for step, target in enumerate(ray):
+                table[square][target] = tuple(ray[:step])
+    return table
+
+
+BETWEEN = {piece: _between(piece) for piece in SLIDES}
+PAWN_ATTACKS = [
+    tuple(
+        target
+        for target in (square + 7, square + 9)
+        if target < 64 and chess.square_distance(square, target) == 1
+    )
+    for square in chess.SQUARES
+]
+
+
+def attacks(piece: int, origin: int, target: int, king: int) -> bool:
+    """Whether White's ``piece`` on ``origin`` attacks ``target``.
+
+    Only the White king can block, since the target holds the Black king.
+    """
+    if piece == chess.PAWN:
+        return target in PAWN_ATTACKS[origin]
+    between = BETWEEN[piece][origin][target]
+    return between is not None and king not in between
+
+
+def index(side: int, king: int, weak_king: int, piece: int) -> int:
+    return ((side * 64 + king) * 64 + weak_king) * 64 + piece
+
+
+def piece_squares(piece: int) -> range:
+    return range(8, 56) if piece == chess.PAWN else range(64)
+
+
+def solve(piece: int, solved: dict[int, bytearray]) -> bytearray:
+    """Full DTM table for King and ``piece`` against King, White strong."""
+    values = bytearray([INVALID]) * (2 * 64 * 64 * 64)
+    counters = bytearray(len(values))
+    levels: dict[int, list[int]] = {}
+    promotions: dict[int, list[int]] = {}
+
+    def schedule(level: int, position: int) -> None:
+        values[position] = level
+        levels.setdefault(level, []).append(position)
+
+    for king in chess.SQUARES:
+        for weak_king in chess.SQUARES:
+            if NEAR[king][weak_king]:
+                continue
+            for square in piece_squares(piece):
+                if square == king or square == weak_king:
+                    continue
+                check = attacks(piece, square, weak_king, king)
+                if not check:
+                    position = index(WHITE_TO_MOVE, king, weak_king, square)
+                    values[position] = UNKNOWN
+                    if piece == chess.PAWN and square >= chess.A7:
+                        promoted = square + 8
+                        if promoted != king and promoted != weak_king:
+                            after = index(BLACK_TO_MOVE, king, weak_king, promoted)
+                            best = min(
+                                (table[after] for table in solved.values()),
+                                default=DRAW,
+                            )
+                            if best < INVALID:
+                                promotions.setdefault(best + 1, []).append(position)
+
+                position = index(BLACK_TO_MOVE, king, weak_king, square)
+                values[position] = UNKNOWN
+                moves = 0
+                escapes = False
+                for target in KING_STEPS[weak_king]:
+                    if NEAR[target][king]:
+                        continue
+                    if target == square:
+                        escapes = escapes or not NEAR[king][square]
+                    elif not attacks(piece, square, target, king):
+                        moves += 1
+                if escapes or (moves == 0 and not check):
+                    counters[position] = BLOCKED
+                elif moves == 0:
+                    schedule(0, position)
+                else:
+                    counters[position] = moves
+
+    level = 0
+    while levels or promotions:
+        for position in promotions.pop(level, ()):
+            if values[position] == UNKNOWN:
+                schedule(level, position)
+        for position in levels.pop(level, ()):
+            rest, square = divmod(position, 64)
+            rest, weak_king = divmod(rest, 64)
+            side, king = divmod(rest, 64)
+            if side == WHITE_TO_MOVE:
+                # Black's last move was a king step; a predecessor is lost
+                # once all of its moves are.
+                for origin in KING_STEPS[weak_king]:
+                    if origin == square or NEAR[origin][king]:
+                        continue
+                    before = index(BLACK_TO_MOVE, king, origin, square)
+                    if counters[before] == BLOCKED or values[before] != UNKNOWN:
+                        continue
+                    counters[before] -= 1
+                    if counters[before] == 0:
+                        schedule(level + 1, before)
+                continue
+            # White's last move: any White-to-move predecessor wins.
+            origins = [
+                index(WHITE_TO_MOVE, origin, weak_king, square)
+                for origin in KING_STEPS[king]
+                if origin != square
+                and not NEAR[origin][weak_king]
+                and not attacks(piece, square, weak_king, origin)
+            ]
+            if piece == chess.PAWN:
+                pushes = []
+                if square - 8 >= chess.A2 and square - 8 not in (king, weak_king):
+                    pushes.append(square - 8)
+                    if chess.square_rank(square) == 3 and square - 16 not in (
+                        king,
+                        weak_king,
+                    ):
+                        pushes.append(square - 16)
+            else:
+                pushes = []
+                for ray in RAYS[piece][square]:
+                    for origin in ray:
+                        if origin == king or origin == weak_king:
+                            break
+                        pushes.append(origin)
+            origins.extend(
+                index(WHITE_TO_MOVE, king, weak_king, origin)
+                for origin in pushes
+                if not attacks(piece, origin, weak_king, king)
+            )
+            for before in origins:
+                if values[before] == UNKNOWN:
+                    schedule(level + 1, before)
+        level += 1
+
+    return values.translate(bytes(range(253)) + bytes([DRAW, INVALID, DRAW]))
+
+
+def fold(material: str, values: bytearray) -> bytes:
+    """The full table reduced to the symmetric layout used for probing."""
+    folded = bytearray(TABLE_SIZES[material])
+    for position in range(len(folded)):
+        strong_to_move, king, weak_king, piece = decode_index(material, position)
+        side = WHITE_TO_MOVE if strong_to_move else BLACK_TO_MOVE
+        folded[position] = values[index(side, king, weak_king, piece)]
+    return bytes(folded)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=DEFAULT_TABLES_DIR)
+    args = parser.parse_args()
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    solved: dict[int, bytearray] = {}
+    for material in ("KQK", "KRK", "KPK"):
+        piece = TABLE_PIECES[material]
+        values = solve(piece, solved)
+        if piece != chess.PAWN:
+            solved[piece] = values
+        path = args.output / f"{material.lower()}.bin"
+        path.write_bytes(fold(material, values))
+        longest = max(value for value in values if value < INVALID)
+        wins = sum(1 for value in values[: len(values) // 2] if value < INVALID)
+        print(f"{material}: longest mate {longest} plies, {wins} White-to-move wins")
+
+
+if __name__ == "__main__":
+    main()
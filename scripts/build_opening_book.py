@@ -0,0 +1,72 @@
+"""Build server/data/opening_book.bin from local engine self-play.
+
+Each game plays the engine against itself for the first ``--plies`` moves,
+picking at random among the moves within ``--margin`` centipawns of the best
+so the games branch. Every move played becomes a book entry whose weight is
+how often it was chosen from that position. Searches are depth-limited, so
+the same seed always produces the same book.
+
+    python scripts/build_opening_book.py --games 64 --plies 8
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import random
+import sys
+
+import chess
+
+SERVER_DIR = Path(__file__).resolve().parents[1] / "server"
+sys.path.insert(0, str(SERVER_DIR))
+
+from chess_book import DEFAULT_BOOK_PATH, positions_from_games, write_book  # noqa: E402
+from chess_engine import MAX_BUDGET_MS, ChessSearch  # noqa: E402
+
+
+def self_play_game(
+    searcher: ChessSearch, rng: random.Random, plies: int, depth: int, margin: int
+) -> list[str]:
+    board = chess.Board()
+    moves = []
+    for _ in range(plies):
+        if board.is_game_over():
+            break
+        result = searcher.search(board.fen(), MAX_BUDGET_MS, top_n=4, max_depth=depth)
+        best = result.moves[0].score
+        candidates = [
+            entry.uci for entry in result.moves if entry.score >= best - margin
+        ]
+        uci = rng.choice(candidates)
+        board.push_uci(uci)
+        moves.append(uci)
+    return moves
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=64)
+    parser.add_argument("--plies", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--margin", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--output", type=Path, default=DEFAULT_BOOK_PATH)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    searcher = ChessSearch()
+    games = []
+    for index in range(args.games):
+        games.append(
+            self_play_game(searcher, rng, args.plies, args.depth, args.margin)
+        )
+        print(f"game {index + 1}/{args.games}: {' '.join(games[-1])}", flush=True)
+
+    positions = positions_from_games(games, args.plies)
+    count = write_book(args.output, positions)
+    print(f"wrote {count} entries for {len(positions)} positions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,38 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+import time
 
 from fastmcp import FastMCP
 from fastmcp.exceptions import ResourceError
 from mcp.server.lowlevel.helper_types import ReadResourceContents
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
 
 try:
+    from .metrics import (
+        CONTENT_TYPE as METRICS_CONTENT_TYPE,
+        REGISTRY as METRICS,
+        UNKNOWN_RESOURCE,
+        ToolMetricsMiddleware,
+        record_resource_read,
+    )
+    from .session_store import create_session_store
+    from .tool_executor import create_tool_executor, parse_timeouts
     from .tools import register_tools
+    from .widget_bundles import WidgetBundleRegistry
 except ImportError:  # pragma: no cover - fallback for script execution
+    from metrics import (
+        CONTENT_TYPE as METRICS_CONTENT_TYPE,
+        REGISTRY as METRICS,
+        UNKNOWN_RESOURCE,
+        ToolMetricsMiddleware,
+        record_resource_read,
+    )
+    from session_store import create_session_store
+    from tool_executor import create_tool_executor, parse_timeouts
     from tools import register_tools
+    from widget_bundles import WidgetBundleRegistry
 
 CHESS_WIDGET_VERSION = "v1"
 CHECKERS_WIDGET_VERSION = "v1"
@@ -126,134 +149,200 @@ MANCALA_WIDGET_BUILD_DIR = WIDGET_BUILD_ROOT / "mancala" / "dist"
 MANCALA_WIDGET_JS_PATH = MANCALA_WIDGET_BUILD_DIR / "widget.js"
 MANCALA_WIDGET_CSS_PATH = MANCALA_WIDGET_BUILD_DIR / "widget.css"
 
-app = FastMCP("games-mcp")
-register_tools(app)
-
-
-def load_widget_template(template_path: Path, js_path: Path, css_path: Path) -> str:
-    if not template_path.exists():
-        raise ResourceError(
-            f"Widget template not found at {template_path}. "
-            "Ensure the template exists and the URI version matches."
-        )
-    if not js_path.exists() or not css_path.exists():
-        raise ResourceError(
-            "Widget build artifacts are missing. "
-            "Run `npm install && npm run build` in the web/ directory "
-            "to generate web/widgets/<game>/dist/widget.js and widget.css."
-        )
-
-    template = template_path.read_text(encoding="utf-8")
-    css = css_path.read_text(encoding="utf-8")
-    js = js_path.read_text(encoding="utf-8")
+WIDGET_BUNDLES = WidgetBundleRegistry(
+    revalidate_seconds=float(os.getenv("WIDGET_BUNDLE_REVALIDATE_SECONDS", "1.0"))
+)
+WIDGET_BUNDLES.register(
+    CHESS_WIDGET_URI,
+    CHESS_WIDGET_TEMPLATE_PATH,
+    CHESS_WIDGET_JS_PATH,
+    CHESS_WIDGET_CSS_PATH,
+)
+WIDGET_BUNDLES.register(
+    CHECKERS_WIDGET_URI,
+    CHECKERS_WIDGET_TEMPLATE_PATH,
+    CHECKERS_WIDGET_JS_PATH,
+    CHECKERS_WIDGET_CSS_PATH,
+)
+WIDGET_BUNDLES.register(
+    BLACKJACK_WIDGET_URI,
+    BLACKJACK_WIDGET_TEMPLATE_PATH,
+    BLACKJACK_WIDGET_JS_PATH,
+    BLACKJACK_WIDGET_CSS_PATH,
+)
+WIDGET_BUNDLES.register(
+    RPG_DICE_WIDGET_URI,
+    RPG_DICE_WIDGET_TEMPLATE_PATH,
+    RPG_DICE_WIDGET_JS_PATH,
+    RPG_DICE_WIDGET_CSS_PATH,
+)
+WIDGET_BUNDLES.register(
+    SEA_BATTLE_WIDGET_URI,
+    SEA_BATTLE_WIDGET_TEMPLATE_PATH,
+    SEA_BATTLE_WIDGET_JS_PATH,
+    SEA_BATTLE_WIDGET_CSS_PATH,
+)
+WIDGET_BUNDLES.register(
+    SLOT_WIDGET_URI,
+    SLOT_WIDGET_TEMPLATE_PATH,
+    SLOT_WIDGET_JS_PATH,
+    SLOT_WIDGET_CSS_PATH,
+)
+WIDGET_BUNDLES.register(
+    FOUR_IN_A_ROW_WIDGET_URI,
+    FOUR_IN_A_ROW_WIDGET_TEMPLATE_PATH,
+    FOUR_IN_A_ROW_WIDGET_JS_PATH,
+    FOUR_IN_A_ROW_WIDGET_CSS_PATH,
+)
+WIDGET_BUNDLES.register(
+    TIC_TAC_TOE_WIDGET_URI,
+    TIC_TAC_TOE_WIDGET_TEMPLATE_PATH,
+    TIC_TAC_TOE_WIDGET_JS_PATH,
+    TIC_TAC_TOE_WIDGET_CSS_PATH,
+)
+WIDGET_BUNDLES.register(
+    MANCALA_WIDGET_URI,
+    MANCALA_WIDGET_TEMPLATE_PATH,
+    MANCALA_WIDGET_JS_PATH,
+    MANCALA_WIDGET_CSS_PATH,
+)
+# Assemble whatever is already built; missing bundles are built on first read.
+WIDGET_BUNDLES.warm()
+WIDGET_URIS = frozenset(WIDGET_BUNDLES.uris())
+
+# "memory" keeps the latest state per gameId so tools can be called with just the
+# gameId; "sqlite" persists it in a WAL database shared by every worker; "none"
+# keeps every tool stateless (the full state must be passed).
+GAME_SESSION_BACKEND = os.getenv("GAME_SESSION_BACKEND", "memory")
+GAME_SESSIONS = create_session_store(
+    GAME_SESSION_BACKEND,
+    max_sessions=int(os.getenv("GAME_SESSION_MAX", "10000")),
+    ttl_seconds=float(os.getenv("GAME_SESSION_TTL_SECONDS", "21600")),
+    path=os.getenv("GAME_SESSION_DB", str(Path(__file__).resolve().parent / "game_sessions.db")),
+    batch_size=int(os.getenv("GAME_SESSION_BATCH_SIZE", "32")),
+    flush_interval=float(os.getenv("GAME_SESSION_FLUSH_SECONDS", "0.05")),
+)
 
-    if "/* INLINE_CSS */" not in template or "/* INLINE_JS */" not in template:
-        raise ResourceError(
-            "Widget template placeholders are missing. "
-            "Expected /* INLINE_CSS */ and /* INLINE_JS */ markers."
-        )
+# Search and simulation tools run on this pool: "thread" (default), "process"
+# for CPU parallelism across cores, or "inline" to run on the event loop.
+TOOL_EXECUTOR = create_tool_executor(
+    os.getenv("GAME_TOOL_EXECUTOR", "thread"),
+    max_workers=int(os.getenv("GAME_TOOL_WORKERS", "4")),
+    max_queue=int(os.getenv("GAME_TOOL_QUEUE", "32")),
+    default_timeout=float(os.getenv("GAME_TOOL_TIMEOUT_SECONDS", "10")),
+    timeouts=parse_timeouts(os.getenv("GAME_TOOL_TIMEOUTS", "")),
+)
 
-    return template.replace("/* INLINE_CSS */", css).replace("/* INLINE_JS */", js)
+app = FastMCP("games-mcp")
+app.add_middleware(ToolMetricsMiddleware(METRICS))
+register_tools(app, sessions=GAME_SESSIONS, executor=TOOL_EXECUTOR)
+HEALTH_PROBE_GAME_ID = "__healthz__"
+
+
+@app.custom_route("/healthz", methods=["GET"])
+async def healthz(request: Request) -> JSONResponse:
+    """Liveness and readiness for load balancers and the worker supervisor."""
+    payload = {
+        "status": "ok",
+        "pid": os.getpid(),
+        "sessionBackend": GAME_SESSION_BACKEND,
+        "toolExecutor": TOOL_EXECUTOR.kind,
+        "pendingTools": TOOL_EXECUTOR.pending,
+    }
+    if GAME_SESSIONS is not None:
+        try:
+            GAME_SESSIONS.get(HEALTH_PROBE_GAME_ID)
+        except Exception as exc:  # noqa: BLE001 - any store failure is unhealthy
+            payload.update(status="error", error=str(exc))
+            return JSONResponse(payload, status_code=503)
+    return JSONResponse(payload)
+
+
+@app.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Per-tool and per-widget counters and histograms for this worker."""
+    return Response(METRICS.render(), media_type=METRICS_CONTENT_TYPE)
 
 
 @app.resource(CHESS_WIDGET_URI, mime_type=WIDGET_MIME_TYPE)
 def chess_widget_template() -> str:
-    return load_widget_template(
-        CHESS_WIDGET_TEMPLATE_PATH, CHESS_WIDGET_JS_PATH, CHESS_WIDGET_CSS_PATH
-    )
+    return WIDGET_BUNDLES.html(CHESS_WIDGET_URI)
 
 
 @app.resource(CHECKERS_WIDGET_URI, mime_type=WIDGET_MIME_TYPE)
 def checkers_widget_template() -> str:
-    return load_widget_template(
-        CHECKERS_WIDGET_TEMPLATE_PATH,
-        CHECKERS_WIDGET_JS_PATH,
-        CHECKERS_WIDGET_CSS_PATH,
-    )
+    return WIDGET_BUNDLES.html(CHECKERS_WIDGET_URI)
 
 
 @app.resource(BLACKJACK_WIDGET_URI, mime_type=WIDGET_MIME_TYPE)
 def blackjack_widget_template() -> str:
-    return load_widget_template(
-        BLACKJACK_WIDGET_TEMPLATE_PATH,
-        BLACKJACK_WIDGET_JS_PATH,
-        BLACKJACK_WIDGET_CSS_PATH,
-    )
+    return WIDGET_BUNDLES.html(BLACKJACK_WIDGET_URI)
 
 
 @app.resource(RPG_DICE_WIDGET_URI, mime_type=WIDGET_MIME_TYPE)
 def rpg_dice_widget_template() -> str:
-    return load_widget_template(
-        RPG_DICE_WIDGET_TEMPLATE_PATH,
-        RPG_DICE_WIDGET_JS_PATH,
-        RPG_DICE_WIDGET_CSS_PATH,
-    )
+    return WIDGET_BUNDLES.html(RPG_DICE_WIDGET_URI)
 
 
 @app.resource(SEA_BATTLE_WIDGET_URI, mime_type=WIDGET_MIME_TYPE)
 def sea_battle_widget_template() -> str:
-    return load_widget_template(
-        SEA_BATTLE_WIDGET_TEMPLATE_PATH,
-        SEA_BATTLE_WIDGET_JS_PATH,
-        SEA_BATTLE_WIDGET_CSS_PATH,
-    )
+    return WIDGET_BUNDLES.html(SEA_BATTLE_WIDGET_URI)
 
 
 @app.resource(SLOT_WIDGET_URI, mime_type=WIDGET_MIME_TYPE)
 def slot_widget_template() -> str:
-    return load_widget_template(
-        SLOT_WIDGET_TEMPLATE_PATH,
-        SLOT_WIDGET_JS_PATH,
-        SLOT_WIDGET_CSS_PATH,
-    )
+    return WIDGET_BUNDLES.html(SLOT_WIDGET_URI)
 
 
 @app.resource(FOUR_IN_A_ROW_WIDGET_URI, mime_type=WIDGET_MIME_TYPE)
 def four_in_a_row_widget_template() -> str:
-    return load_widget_template(
-        FOUR_IN_A_ROW_WIDGET_TEMPLATE_PATH,
-        FOUR_IN_A_ROW_WIDGET_JS_PATH,
-        FOUR_IN_A_ROW_WIDGET_CSS_PATH,
-    )
+    return WIDGET_BUNDLES.html(FOUR_IN_A_ROW_WIDGET_URI)
 
 
 @app.resource(TIC_TAC_TOE_WIDGET_URI, mime_type=WIDGET_MIME_TYPE)
 def tic_tac_toe_widget_template() -> str:
-    return load_widget_template(
-        TIC_TAC_TOE_WIDGET_TEMPLATE_PATH,
-        TIC_TAC_TOE_WIDGET_JS_PATH,
-        TIC_TAC_TOE_WIDGET_CSS_PATH,
-    )
+    return WIDGET_BUNDLES.html(TIC_TAC_TOE_WIDGET_URI)
 
 
 @app.resource(MANCALA_WIDGET_URI, mime_type=WIDGET_MIME_TYPE)
 def mancala_widget_template() -> str:
-    return load_widget_template(
-        MANCALA_WIDGET_TEMPLATE_PATH,
-        MANCALA_WIDGET_JS_PATH,
-        MANCALA_WIDGET_CSS_PATH,
-    )
+    return WIDGET_BUNDLES.html(MANCALA_WIDGET_URI)
 
 
 @app._mcp_server.read_resource()
 async def read_resource(uri: str):
+    started = time.perf_counter()
+    # Only registered widgets get their own series; any other URI a client
+    # sends is counted under one label.
+    label = str(uri) if str(uri) in WIDGET_URIS else UNKNOWN_RESOURCE
+    try:
+        contents = await _read_widget_resource(uri)
+    except Exception:
+        record_resource_read(
+            label, 0, time.perf_counter() - started, raised=True, registry=METRICS
+        )
+        raise
+    # The read just went through the bundle cache, which already knows the size.
+    bundle = WIDGET_BUNDLES.cached(label)
+    if bundle is not None:
+        size = bundle.size
+    else:
+        size = sum(
+            len(item.content.encode() if isinstance(item.content, str) else item.content)
+            for item in contents
+        )
+    record_resource_read(label, size, time.perf_counter() - started, registry=METRICS)
+    return contents
+
+
+async def _read_widget_resource(uri: str) -> list[ReadResourceContents]:
     resource = await app._resource_manager.get_resource(uri)
     if not resource:
         raise ResourceError(f"Unknown resource: {uri}")
 
     content = await resource.read()
     meta = None
-    if str(uri) in {
-        CHESS_WIDGET_URI,
-        CHECKERS_WIDGET_URI,
-        BLACKJACK_WIDGET_URI,
-        RPG_DICE_WIDGET_URI,
-        SEA_BATTLE_WIDGET_URI,
-        SLOT_WIDGET_URI,
-        FOUR_IN_A_ROW_WIDGET_URI,
-        TIC_TAC_TOE_WIDGET_URI,
-        MANCALA_WIDGET_URI,
-    }:
+    if str(uri) in WIDGET_URIS:
         meta = {
             "openai/widgetDomain": WIDGET_DOMAIN,
             "openai/widgetCSP": WIDGET_CSP,
@@ -273,5 +362,9 @@ async def read_resource(uri: str):
 
 
 if __name__ == "__main__":
-    # TODO: Replace with proper ASGI server invocation for production.
-    app.run()
+    if os.getenv("MCP_TRANSPORT", "http").lower() == "stdio":
+        app.run()
+    else:
+        from run_http import main
+
+        main()
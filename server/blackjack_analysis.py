@@ -0,0 +1,358 @@
+"""Monte Carlo expected values for blackjack actions from the unseen cards."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+import random
+import time
+
+try:
+    from .blackjack_rules import (
+        HAND_TOTALS,
+        RANK_POINTS,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        BlackjackState,
+        legal_dealer_actions,
+        legal_player_actions,
+        parse_state,
+    )
+    from .rng_service import shared_rng
+except ImportError:  # pragma: no cover - fallback for script execution
+    from blackjack_rules import (
+        HAND_TOTALS,
+        RANK_POINTS,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        BlackjackState,
+        legal_dealer_actions,
+        legal_player_actions,
+        parse_state,
+    )
+    from rng_service import shared_rng
+
+
+DEFAULT_BUDGET_MS = 100
+MAX_BUDGET_MS = 5_000
+DEFAULT_MAX_ROLLOUTS = 100_000
+# Rollouts run in batches between deadline checks.
+BATCH_SIZE = 256
+# Two-sided 95% normal quantile for the confidence intervals.
+CONFIDENCE_Z = 1.96
+HOLE_CARD_ATTEMPTS = 32
+
+
+@dataclass(frozen=True)
+class ActionEstimate:
+    action: str
+    ev: float
+    ci_low: float
+    ci_high: float
+    rollouts: int
+
+
+@dataclass(frozen=True)
+class HandAnalysis:
+    turn: str | None
+    actions: list[ActionEstimate]
+    best_action: str | None
+    rollouts: int
+    elapsed_ms: float
+
+
+class _ShoeExhausted(Exception):
+    pass
+
+
+class _Rollout:
+    """One random completion of the hand, drawn lazily from the unseen cards.
+
+    Cards come from a partial Fisher-Yates shuffle of ``pool`` that starts
+    over for every rollout, so each rollout is a uniform draw without
+    reshuffling the whole shoe. Every action reads the same card sequence,
+    which keeps the comparison between actions low-variance.
+    """
+
+    __slots__ = ("pool", "cards", "random")
+
+    def __init__(self, pool: list[int], rng: random.Random) -> None:
+        self.pool = pool
+        self.cards: list[int] = []
+        self.random = rng.random
+
+    def reset(self) -> None:
+        self.cards = []
+
+    def card(self, index: int) -> int:
+        cards = self.cards
+        pool = self.pool
+        while len(cards) <= index:
+            position = len(cards)
+            if position >= len(pool):
+                raise _ShoeExhausted
+            swap = position + int(self.random() * (len(pool) - position))
+            pool[position], pool[swap] = pool[swap], pool[position]
+            cards.append(pool[position])
+        return cards[index]
+
+    def hidden_hole_card(self, upcard: int) -> int:
+        """Draw the dealer's hole card, excluding ones that would be blackjack.
+
+        A hand still in play means the dealer did not have blackjack.
+        """
+        for _ in range(HOLE_CARD_ATTEMPTS):
+            self.cards = []
+            hole = self.card(0)
+            if (upcard, hole) not in ((1, 10), (10, 1)):
+                return hole
+        return self.cards[0]
+
+
+def _total(hard: int, has_ace: bool) -> int:
+    if hard > 21:
+        return hard
+    return HAND_TOTALS[hard][has_ace][0]
+
+
+def _points(cards: list[str]) -> tuple[int, bool]:
+    hard = sum(RANK_POINTS[card[0]] for card in cards)
+    return hard, any(card[0] == "A" for card in cards)
+
+
+def _play_dealer(rollout: _Rollout, hard: int, has_ace: bool, index: int) -> int:
+    """Dealer draws to 17, standing on all 17s; returns the final total."""
+    total = _total(hard, has_ace)
+    while total < 17:
+        points = rollout.card(index)
+        index += 1
+        hard += points
+        has_ace = has_ace or points == 1
+        total = _total(hard, has_ace)
+    return total
+
+
+def _keeps_hitting(total: int, soft: bool, upcard: int) -> bool:
+    """Basic-strategy hit/stand used to finish a hand after the analysed action."""
+    dealer = 11 if upcard == 1 else upcard
+    if soft:
+        return total <= 17 or (total == 18 and dealer >= 9)
+    if total <= 11:
+        return True
+    if total == 12:
+        return dealer < 4 or dealer >= 7
+    if total <= 16:
+        return dealer >= 7
+    return False
+
+
+def _play_player(
+    rollout: _Rollout,
+    hard: int,
+    has_ace: bool,
+    upcard: int,
+    index: int,
+) -> tuple[int, int]:
+    """Hit by the fallback policy; returns ``(final total, next card index)``."""
+    total = _total(hard, has_ace)
+    while total < 21 and _keeps_hitting(total, total != hard, upcard):
+        points = rollout.card(index)
+        index += 1
+        hard += points
+        has_ace = has_ace or points == 1
+        total = _total(hard, has_ace)
+    return total, index
+
+
+def _payoff(total: int, two_card_21: bool, dealer_total: int) -> float:
+    """Per-unit result as ``resolve_results`` settles it, dealer blackjack aside."""
+    if total > 21:
+        return -1.0
+    if two_card_21:
+        return 1.5
+    if dealer_total > 21 or total > dealer_total:
+        return 1.0
+    if total < dealer_total:
+        return -1.0
+    return 0.0
+
+
+def _simulate_player_action(
+    rollout: _Rollout,
+    action: str,
+    hand: tuple[int, bool, int],
+    upcard: int,
+    hole: int,
+) -> float:
+    hard, has_ace, pair_points = hand
+    dealer_hard = upcard + hole
+    dealer_ace = upcard == 1 or hole == 1
+
+    if action == "stand":
+        total = _total(hard, has_ace)
+        dealer_total = _play_dealer(rollout, dealer_hard, dealer_ace, 1)
+        return _payoff(total, False, dealer_total)
+
+    if action == "double":
+        points = rollout.card(1)
+        hard += points
+        if hard > 21:
+            return -2.0
+        total = _total(hard, has_ace or points == 1)
+        dealer_total = _play_dealer(rollout, dealer_hard, dealer_ace, 2)
+        return 2.0 * _payoff(total, False, dealer_total)
+
+    if action == "hit":
+        points = rollout.card(1)
+        total, index = _play_player(
+            rollout, hard + points, has_ace or points == 1, upcard, 2
+        )
+        if total > 21:
+            return -1.0
+        dealer_total = _play_dealer(rollout, dealer_hard, dealer_ace, index)
+        return _payoff(total, False, dealer_total)
+
+    # Split: each half takes its second card before either is played.
+    split_ace = pair_points == 1
+    left = rollout.card(1)
+    right = rollout.card(2)
+    finished = []
+    index = 3
+    for second in (left, right):
+        start = pair_points + second
+        start_ace = split_ace or second == 1
+        two_card_21 = _total(start, start_ace) == 21
+        final, index = _play_player(rollout, start, start_ace, upcard, index)
+        finished.append((final, two_card_21))
+    if all(final > 21 for final, _ in finished):
+        return -2.0
+    dealer_total = _play_dealer(rollout, dealer_hard, dealer_ace, index)
+    return sum(
+        _payoff(final, two_card_21, dealer_total) for final, two_card_21 in finished
+    )
+
+
+def _simulate_dealer_turn(
+    rollout: _Rollout,
+    hands: list[tuple[int, bool, bool, float]],
+    dealer: tuple[int, bool],
+) -> float:
+    dealer_total = _play_dealer(rollout, dealer[0], dealer[1], 0)
+    return sum(
+        weight * _payoff(_total(hard, has_ace), two_card_21, dealer_total)
+        for hard, has_ace, two_card_21, weight in hands
+    )
+
+
+def _estimate(action: str, total: float, squares: float, count: int) -> ActionEstimate:
+    if not count:
+        return ActionEstimate(action, 0.0, 0.0, 0.0, 0)
+    mean = total / count
+    variance = max(squares / count - mean * mean, 0.0)
+    margin = CONFIDENCE_Z * math.sqrt(variance / count) if count > 1 else 0.0
+    return ActionEstimate(
+        action,
+        round(mean, 4),
+        round(mean - margin, 4),
+        round(mean + margin, 4),
+        count,
+    )
+
+
+def _unseen_cards(state: BlackjackState, hide_hole: bool) -> list[int]:
+    pool = [RANK_POINTS[card[0]] for card in state.shoe.remaining()]
+    if hide_hole and len(state.dealer) > 1:
+        pool.append(RANK_POINTS[state.dealer[1][0]])
+    return pool
+
+
+def analyze_hand(
+    state: str,
+    *,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    max_rollouts: int = DEFAULT_MAX_ROLLOUTS,
+    rng: random.Random | None = None,
+    parsed: BlackjackState | None = None,
+) -> HandAnalysis:
+    """Estimate the EV of each legal action by simulating the rest of the hand.
+
+    On the player's turn the dealer's hole card is treated as unseen and
+    drawn with the remaining shoe; EVs are per unit of the current hand's
+    bet, and after ``hit`` or ``split`` the hands are finished with a
+    basic-strategy hit/stand policy. On the dealer's turn the single legal
+    action is scored as the player's total result in units of the base bet.
+    ``parsed`` skips parsing ``state`` when the caller already has it.
+    """
+    started = time.perf_counter()
+    if parsed is None:
+        try:
+            parsed = parse_state(state)
+        except ValueError:
+            return HandAnalysis(None, [], None, 0, 0.0)
+    if parsed.status != STATUS_IN_PROGRESS or len(parsed.dealer) < 2:
+        return HandAnalysis(parsed.turn, [], None, 0, 0.0)
+    budget_ms = max(1.0, min(float(budget_ms), MAX_BUDGET_MS))
+    deadline = started + budget_ms / 1000
+    rng = rng or shared_rng()
+
+    player_turn = parsed.turn == TURN_PLAYER
+    if player_turn:
+        actions = legal_player_actions(parsed)
+    else:
+        actions = legal_dealer_actions(parsed)
+    if not actions:
+        return HandAnalysis(parsed.turn, [], None, 0, 0.0)
+
+    rollout = _Rollout(_unseen_cards(parsed, player_turn), rng)
+    totals = {action: 0.0 for action in actions}
+    squares = {action: 0.0 for action in actions}
+    counts = {action: 0 for action in actions}
+    upcard = RANK_POINTS[parsed.dealer[0][0]]
+
+    if player_turn:
+        current = parsed.player_hands[parsed.hand_index]
+        hard, has_ace = _points(current.cards)
+        pair_points = RANK_POINTS[current.cards[0][0]]
+        hand = (hard, has_ace, pair_points)
+    else:
+        dealer = _points(parsed.dealer)
+        base_bet = parsed.bet or 1.0
+        hands = []
+        for player_hand in parsed.player_hands:
+            hard, has_ace = _points(player_hand.cards)
+            two_card_21 = len(player_hand.cards) == 2 and _total(hard, has_ace) == 21
+            hands.append((hard, has_ace, two_card_21, player_hand.bet / base_bet))
+
+    completed = 0
+    while completed < max_rollouts and time.perf_counter() < deadline:
+        for _ in range(min(BATCH_SIZE, max_rollouts - completed)):
+            completed += 1
+            try:
+                if player_turn:
+                    hole = rollout.hidden_hole_card(upcard)
+                else:
+                    rollout.reset()
+            except _ShoeExhausted:
+                continue
+            for action in actions:
+                try:
+                    if player_turn:
+                        value = _simulate_player_action(
+                            rollout, action, hand, upcard, hole
+                        )
+                    else:
+                        value = _simulate_dealer_turn(rollout, hands, dealer)
+                except _ShoeExhausted:
+                    continue
+                totals[action] += value
+                squares[action] += value * value
+                counts[action] += 1
+
+    estimates = [
+        _estimate(action, totals[action], squares[action], counts[action])
+        for action in actions
+    ]
+    estimates.sort(key=lambda estimate: -estimate.ev)
+    best = next((estimate.action for estimate in estimates if estimate.rollouts), None)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return HandAnalysis(parsed.turn, estimates, best, completed, elapsed_ms)
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 import random
 
+try:
+    from .rng_service import shared_rng
+except ImportError:  # pragma: no cover - fallback for script execution
+    from rng_service import shared_rng
+
 
 RANKS = "A23456789TJQK"
 SUITS = "SHDC"
@@ -21,8 +27,25 @@ CARD_VALUES = {
     "Q": 10,
     "K": 10,
 }
+# Points with aces counted as one; at most one ace can ever count eleven.
+RANK_POINTS = {rank: 1 if rank == "A" else value for rank, value in CARD_VALUES.items()}
+# ``HAND_TOTALS[hard][has_ace]`` is ``(total, is_soft)`` for hard totals up to 21.
+HAND_TOTALS = tuple(
+    ((hard, False), (hard + 10, True) if hard + 10 <= 21 else (hard, False))
+    for hard in range(22)
+)
 
 MAX_HANDS = 4
+DECK_SIZE = len(RANKS) * len(SUITS)
+MIN_DECKS = 1
+MAX_DECKS = 8
+MIN_PENETRATION = 0.5
+MAX_PENETRATION = 0.9
+DEFAULT_PENETRATION = 0.75
+# A new hand is never dealt from fewer cards than this, cut card or not.
+RESHUFFLE_MIN_CARDS = 15
+SEEDED_SHOE_PREFIX = "#"
+SHUFFLE_CACHE_SIZE = 1024
 STATUS_IN_PROGRESS = "in_progress"
 STATUS_GAME_OVER = "game_over"
 TURN_PLAYER = "player"
@@ -37,9 +60,68 @@ class BlackjackHand:
     bet: float
 
 
+@dataclass
+class Shoe:
+    """Cards in dealing order plus a cursor to the next card.
+
+    Seeded shoes serialize as ``#<seed hex>.<cursor>.<decks>.<cut>`` (or just
+    ``#<seed hex>.<cursor>`` for a single deck without a cut card) and rebuild
+    the exact order from the seed; shoes built from explicit cards (legacy
+    states) serialize as the list of cards still to be dealt. ``cut`` is the
+    cursor position of the cut card: once it is reached the shoe is
+    reshuffled before the next hand.
+    """
+
+    cards: tuple[str, ...]
+    cursor: int = 0
+    seed: int | None = None
+    decks: int = 1
+    cut: int | None = None
+
+    @classmethod
+    def seeded(
+        cls,
+        seed: int,
+        cursor: int = 0,
+        *,
+        decks: int = 1,
+        cut: int | None = None,
+    ) -> "Shoe":
+        return cls(
+            cards=shuffled_deck(seed, decks),
+            cursor=cursor,
+            seed=seed,
+            decks=decks,
+            cut=cut,
+        )
+
+    @classmethod
+    def from_cards(cls, cards: list[str] | tuple[str, ...]) -> "Shoe":
+        return cls(cards=tuple(cards))
+
+    def draw(self) -> str:
+        if self.cursor >= len(self.cards):
+            raise ValueError("Shoe is empty.")
+        card = self.cards[self.cursor]
+        self.cursor += 1
+        return card
+
+    def remaining(self) -> list[str]:
+        return list(self.cards[self.cursor :])
+
+    def needs_reshuffle(self) -> bool:
+        """Whether the cut card is out or too few cards remain for another hand."""
+        if self.cut is not None and self.cursor >= self.cut:
+            return True
+        return len(self) < RESHUFFLE_MIN_CARDS
+
+    def __len__(self) -> int:
+        return len(self.cards) - self.cursor
+
+
 @dataclass
 class BlackjackState:
-    shoe: list[str]
+    shoe: Shoe
     player_hands: list[BlackjackHand]
     dealer: list[str]
     stack: float
@@ -50,10 +132,39 @@ class BlackjackState:
     last_action: str | None = None
     results: list[str] | None = None
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.shoe, Shoe):
+            self.shoe = Shoe.from_cards(self.shoe)
+
+
+@lru_cache(maxsize=SHUFFLE_CACHE_SIZE)
+def shuffled_deck(seed: int, decks: int = 1) -> tuple[str, ...]:
+    """The shoe order for ``seed``; the same seed always yields the same order."""
+    cards = [rank + suit for rank in RANKS for suit in SUITS] * decks
+    random.Random(seed).shuffle(cards)
+    return tuple(cards)
+
+
+def new_seeded_shoe(
+    rng: random.Random,
+    *,
+    decks: int = 1,
+    penetration: float = DEFAULT_PENETRATION,
+) -> Shoe:
+    """Shuffle a fresh shoe with its cut card at ``penetration`` of the cards."""
+    if not MIN_DECKS <= decks <= MAX_DECKS:
+        raise ValueError(f"Decks must be between {MIN_DECKS} and {MAX_DECKS}.")
+    if not MIN_PENETRATION <= penetration <= MAX_PENETRATION:
+        raise ValueError(
+            f"Penetration must be between {MIN_PENETRATION} and {MAX_PENETRATION}."
+        )
+    cut = round(decks * DECK_SIZE * penetration)
+    return Shoe.seeded(rng.getrandbits(64), decks=decks, cut=cut)
+
 
 def new_shoe(rng: random.Random | None = None) -> list[str]:
     cards = [rank + suit for rank in RANKS for suit in SUITS]
-    rng = rng or random.Random()
+    rng = rng or shared_rng()
     rng.shuffle(cards)
     return cards
 
@@ -61,7 +172,7 @@ def new_shoe(rng: random.Random | None = None) -> list[str]:
 def serialize_state(state: BlackjackState) -> str:
     return "|".join(
         [
-            f"S:{_serialize_list(state.shoe)}",
+            f"S:{_serialize_shoe(state.shoe)}",
             f"P:{_serialize_hands(state.player_hands)}",
             f"D:{_serialize_list(state.dealer)}",
             f"BK:{_format_amount(state.stack)}",
@@ -84,7 +195,7 @@ def parse_state(state_str: str) -> BlackjackState:
             raise ValueError("Invalid blackjack state segment.")
         key, value = chunk.split(":", 1)
         parts[key] = value
-    shoe = _parse_list(parts.get("S"))
+    shoe = _parse_shoe(parts.get("S"))
     stack = _parse_amount(parts.get("BK"), default=0.0)
     bet = _parse_amount(parts.get("B"), default=0.0)
     player_hands = _parse_hands(parts.get("P"), base_bet=bet)
@@ -106,7 +217,8 @@ def parse_state(state_str: str) -> BlackjackState:
     if hand_index < 0:
         raise ValueError("Invalid blackjack hand index.")
 
-    _validate_cards(shoe)
+    if shoe.seed is None:
+        _validate_cards(shoe.remaining())
     _validate_cards(dealer)
     for hand in player_hands:
         _validate_cards(hand.cards)
@@ -125,17 +237,99 @@ def parse_state(state_str: str) -> BlackjackState:
     )
 
 
+def copy_state(state: BlackjackState) -> BlackjackState:
+    """A copy the rules can play on without changing ``state``.
+
+    Sessions keep the parsed state of each game, so anything that moves cards
+    or the shoe cursor works on a copy. Cards and the shoe order are shared.
+    """
+    return replace(
+        state,
+        shoe=replace(state.shoe),
+        player_hands=[
+            replace(hand, cards=list(hand.cards)) for hand in state.player_hands
+        ],
+        dealer=list(state.dealer),
+        results=list(state.results) if state.results is not None else None,
+    )
+
+
 def initial_blackjack_state(
     *,
     stack: float,
     bet: float,
     rng: random.Random | None = None,
+    decks: int = 1,
+    penetration: float = DEFAULT_PENETRATION,
 ) -> BlackjackState:
-    shoe = new_shoe(rng)
+    rng = rng or shared_rng()
+    shoe = new_seeded_shoe(rng, decks=decks, penetration=penetration)
+    return _deal(shoe, stack=stack, bet=bet)
+
+
+def deal_next_hand(
+    state_str: str,
+    bet: float | None = None,
+    rng: random.Random | None = None,
+    *,
+    parsed: BlackjackState | None = None,
+) -> dict[str, object]:
+    """Deal a new hand from a finished game's shoe, carrying over its stack.
+
+    The shoe keeps its cursor, so only the seed and position are carried
+    forward; it is reshuffled (same decks and penetration) once the cut card
+    has come out. ``parsed`` is ``state_str`` already parsed, if the caller
+    has it; it is not modified.
+    """
+    try:
+        state = copy_state(parsed) if parsed is not None else parse_state(state_str)
+    except ValueError as exc:
+        return {
+            "legal": False,
+            "state": state_str,
+            "error": str(exc),
+        }
+    if state.status != STATUS_GAME_OVER:
+        return _illegal(state, "Finish the current hand before dealing the next one.")
+    next_bet = state.bet if bet is None else float(bet)
+    if next_bet <= 0:
+        return _illegal(state, "Bet must be positive.")
+    if next_bet > state.stack:
+        return _illegal(state, "Bet cannot exceed stack.")
+
+    shoe = state.shoe
+    reshuffled = shoe.needs_reshuffle()
+    if reshuffled:
+        rng = rng or shared_rng()
+        if shoe.cut is None:
+            penetration = DEFAULT_PENETRATION
+        else:
+            penetration = shoe.cut / len(shoe.cards)
+        shoe = new_seeded_shoe(
+            rng,
+            decks=shoe.decks,
+            penetration=min(max(penetration, MIN_PENETRATION), MAX_PENETRATION),
+        )
+    next_state = _deal(shoe, stack=state.stack, bet=next_bet)
+    return {
+        "legal": True,
+        "state": serialize_state(next_state),
+        "status": next_state.status,
+        "turn": next_state.turn,
+        "lastAction": next_state.last_action,
+        "results": next_state.results,
+        "handIndex": next_state.hand_index,
+        "reshuffled": reshuffled,
+        "cardsRemaining": len(shoe),
+        "parsed": next_state,
+    }
+
+
+def _deal(shoe: Shoe, *, stack: float, bet: float) -> BlackjackState:
     player_hand = BlackjackHand(
-        cards=[_draw(shoe), _draw(shoe)], state="active", doubled=False, bet=bet
+        cards=[shoe.draw(), shoe.draw()], state="active", doubled=False, bet=bet
     )
-    dealer = [_draw(shoe), _draw(shoe)]
+    dealer = [shoe.draw(), shoe.draw()]
 
     status = STATUS_IN_PROGRESS
     if _is_blackjack(player_hand.cards) or _is_blackjack(dealer):
@@ -184,9 +378,19 @@ def legal_dealer_actions(state: BlackjackState) -> list[str]:
     return ["stand"]
 
 
-def apply_blackjack_action(state_str: str, action: str) -> dict[str, object]:
+def apply_blackjack_action(
+    state_str: str,
+    action: str,
+    *,
+    parsed: BlackjackState | None = None,
+) -> dict[str, object]:
+    """Apply ``action``; a legal result also carries the new state as ``parsed``.
+
+    ``parsed`` is ``state_str`` already parsed, if the caller has it; it is
+    not modified.
+    """
     try:
-        state = parse_state(state_str)
+        state = copy_state(parsed) if parsed is not None else parse_state(state_str)
     except ValueError as exc:
         return {
             "legal": False,
@@ -203,11 +407,20 @@ def apply_blackjack_action(state_str: str, action: str) -> dict[str, object]:
     if state.turn == TURN_PLAYER:
         if normalized_action not in legal_player_actions(state):
             return _illegal(state, "Illegal action.")
-        _apply_player_action(state, normalized_action)
+        apply_action = _apply_player_action
     else:
         if normalized_action not in legal_dealer_actions(state):
             return _illegal(state, "Illegal action.")
-        _apply_dealer_action(state, normalized_action)
+        apply_action = _apply_dealer_action
+    try:
+        apply_action(state, normalized_action)
+    except ValueError as exc:
+        # The shoe ran out mid-hand; leave the submitted state untouched.
+        return {
+            "legal": False,
+            "state": state_str,
+            "error": str(exc),
+        }
 
     state.last_action = normalized_action
     return {
@@ -218,6 +431,7 @@ def apply_blackjack_action(state_str: str, action: str) -> dict[str, object]:
         "lastAction": state.last_action,
         "results": state.results,
         "handIndex": state.hand_index,
+        "parsed": state,
     }
 
 
@@ -266,7 +480,7 @@ def _apply_player_action(state: BlackjackState, action: str) -> None:
         return
 
     if action == "hit":
-        hand.cards.append(_draw(state.shoe))
+        hand.cards.append(state.shoe.draw())
         total, _ = hand_value(hand.cards)
         if total > 21:
             hand.state = "bust"
@@ -284,7 +498,7 @@ def _apply_player_action(state: BlackjackState, action: str) -> None:
     if action == "double":
         if not _can_double(state, hand):
             return
-        hand.cards.append(_draw(state.shoe))
+        hand.cards.append(state.shoe.draw())
         hand.doubled = True
         hand.bet = hand.bet * 2
         total, _ = hand_value(hand.cards)
@@ -304,7 +518,7 @@ def _apply_player_action(state: BlackjackState, action: str) -> None:
 
 def _apply_dealer_action(state: BlackjackState, action: str) -> None:
     if action == "hit":
-        state.dealer.append(_draw(state.shoe))
+        state.dealer.append(state.shoe.draw())
         if hand_value(state.dealer)[0] > 21:
             state.status = STATUS_GAME_OVER
             _apply_results(state)
@@ -319,11 +533,11 @@ def _apply_split(state: BlackjackState, hand: BlackjackHand) -> None:
     if len(state.player_hands) >= MAX_HANDS:
         return
     left_card, right_card = hand.cards
-    hand.cards = [left_card, _draw(state.shoe)]
+    hand.cards = [left_card, state.shoe.draw()]
     hand.state = "active"
     hand.doubled = False
     new_hand = BlackjackHand(
-        cards=[right_card, _draw(state.shoe)],
+        cards=[right_card, state.shoe.draw()],
         state="active",
         doubled=False,
         bet=hand.bet,
@@ -383,23 +597,48 @@ def _is_blackjack(cards: list[str]) -> bool:
 
 
 def hand_value(cards: list[str]) -> tuple[int, bool]:
-    total = 0
-    aces = 0
+    hard = 0
+    has_ace = False
     for card in cards:
-        rank = _card_rank(card)
-        total += CARD_VALUES[rank]
-        if rank == "A":
-            aces += 1
-    while total > 21 and aces > 0:
-        total -= 10
-        aces -= 1
-    return total, aces > 0
-
-
-def _draw(shoe: list[str]) -> str:
-    if not shoe:
-        raise ValueError("Shoe is empty.")
-    return shoe.pop(0)
+        points = RANK_POINTS[_card_rank(card)]
+        hard += points
+        has_ace = has_ace or points == 1
+    if hard > 21:
+        return hard, False
+    return HAND_TOTALS[hard][has_ace]
+
+
+def _serialize_shoe(shoe: Shoe) -> str:
+    if shoe.seed is None:
+        return _serialize_list(shoe.remaining())
+    serialized = f"{SEEDED_SHOE_PREFIX}{shoe.seed:x}.{shoe.cursor}"
+    if shoe.decks != 1 or shoe.cut is not None:
+        serialized += f".{shoe.decks}.{shoe.cut if shoe.cut is not None else '-'}"
+    return serialized
+
+
+def _parse_shoe(raw: str | None) -> Shoe:
+    if not raw or not raw.startswith(SEEDED_SHOE_PREFIX):
+        return Shoe.from_cards(_parse_list(raw))
+    fields = raw[len(SEEDED_SHOE_PREFIX) :].split(".")
+    if len(fields) == 2:
+        fields += ["1", "-"]
+    if len(fields) != 4:
+        raise ValueError("Invalid blackjack shoe.")
+    seed_raw, cursor_raw, decks_raw, cut_raw = fields
+    try:
+        seed = int(seed_raw, 16)
+        cursor = int(cursor_raw)
+        decks = int(decks_raw)
+        cut = None if cut_raw == "-" else int(cut_raw)
+    except ValueError as exc:
+        raise ValueError("Invalid blackjack shoe.") from exc
+    if seed < 0 or not MIN_DECKS <= decks <= MAX_DECKS:
+        raise ValueError("Invalid blackjack shoe.")
+    size = decks * DECK_SIZE
+    if not 0 <= cursor <= size or (cut is not None and not 0 < cut <= size):
+        raise ValueError("Invalid blackjack shoe.")
+    return Shoe.seeded(seed, cursor, decks=decks, cut=cut)
 
 
 def _serialize_list(values: list[str] | None) -> str:
@@ -0,0 +1,349 @@
+"""Exact dealer outcomes and composition-dependent basic strategy for blackjack."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    from .blackjack_rules import (
+        HAND_TOTALS,
+        RANK_POINTS,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        BlackjackState,
+        legal_player_actions,
+        parse_state,
+    )
+except ImportError:  # pragma: no cover - fallback for script execution
+    from blackjack_rules import (
+        HAND_TOTALS,
+        RANK_POINTS,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        BlackjackState,
+        legal_player_actions,
+        parse_state,
+    )
+
+
+# A shoe composition counts the cards left by points: index 0 is aces,
+# index 9 is every ten-valued card.
+Composition = tuple[int, ...]
+POINTS = tuple(range(1, 11))
+DEALER_OUTCOMES = ("17", "18", "19", "20", "21", "bust")
+BUST = len(DEALER_OUTCOMES) - 1
+UPCARD_LABELS = ("A", "2", "3", "4", "5", "6", "7", "8", "9", "T")
+HARD_TOTALS = tuple(range(4, 22))
+SOFT_TOTALS = tuple(range(12, 22))
+DEALER_CACHE_SIZE = 4096
+STRATEGY_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class StrategyEntry:
+    """Best action and per-action EVs (per unit bet) for one table cell.
+
+    ``double`` and ``split`` assume a two-card hand; ``split`` is ``None``
+    outside the pair rows.
+    """
+
+    action: str
+    stand: float
+    hit: float
+    double: float
+    split: float | None = None
+
+    def ev(self, action: str) -> float | None:
+        return getattr(self, action, None)
+
+
+@dataclass(frozen=True)
+class StrategyAdvice:
+    action: str
+    row: str
+    evs: dict[str, float]
+    dealer_outcomes: dict[str, float]
+
+
+def composition_of(cards: list[str]) -> Composition:
+    counts = [0] * len(POINTS)
+    for card in cards:
+        counts[RANK_POINTS[card[0]] - 1] += 1
+    return tuple(counts)
+
+
+def _total(hard: int, has_ace: bool) -> int:
+    if hard > 21:
+        return hard
+    return HAND_TOTALS[hard][has_ace][0]
+
+
+def _dealer_draws(
+    counts: list[int],
+    remaining: int,
+    hard: int,
+    has_ace: bool,
+    memo: dict[tuple, tuple[float, ...]],
+) -> tuple[float, ...]:
+    """Final-total probabilities for a dealer who stands on all 17s.
+
+    Draw sequences that would empty the shoe contribute nothing, matching a
+    hand that cannot be completed.
+    """
+    total = _total(hard, has_ace)
+    if total > 21:
+        return _ONE_HOT[BUST]
+    if total >= 17:
+        return _ONE_HOT[total - 17]
+    key = (tuple(counts), hard, has_ace)
+    cached = memo.get(key)
+    if cached is not None:
+        return cached
+    result = [0.0] * len(DEALER_OUTCOMES)
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+        probability = count / remaining
+        counts[index] -= 1
+        outcome = _dealer_draws(
+            counts, remaining - 1, hard + index + 1, has_ace or index == 0, memo
+        )
+        counts[index] += 1
+        for slot, value in enumerate(outcome):
+            result[slot] += probability * value
+    memo[key] = tuple(result)
+    return memo[key]
+
+
+_ONE_HOT = tuple(
+    tuple(1.0 if slot == index else 0.0 for slot in range(len(DEALER_OUTCOMES)))
+    for index in range(len(DEALER_OUTCOMES))
+)
+
+
+@lru_cache(maxsize=DEALER_CACHE_SIZE)
+def dealer_distribution(composition: Composition, upcard: int) -> tuple[float, ...]:
+    """Exact dealer final totals (``DEALER_OUTCOMES`` order) for an upcard.
+
+    ``composition`` holds the unseen cards, hole card included. The hole card
+    is conditioned on not making a dealer blackjack, since a hand that is
+    still being played rules that out.
+    """
+    counts = list(composition)
+    remaining = sum(counts)
+    memo: dict[tuple, tuple[float, ...]] = {}
+    result = [0.0] * len(DEALER_OUTCOMES)
+    weight = 0.0
+    for index, count in enumerate(counts):
+        hole = index + 1
+        if not count or {upcard, hole} == {1, 10}:
+            continue
+        probability = count / remaining
+        counts[index] -= 1
+        outcome = _dealer_draws(
+            counts, remaining - 1, upcard + hole, 1 in (upcard, hole), memo
+        )
+        counts[index] += 1
+        weight += probability
+        for slot, value in enumerate(outcome):
+            result[slot] += probability * value
+    if not weight:
+        return tuple(result)
+    return tuple(value / weight for value in result)
+
+
+def _stand_ev(distribution: tuple[float, ...], total: int) -> float:
+    if total > 21:
+        return -1.0
+    ev = distribution[BUST]
+    for slot, dealer_total in enumerate(range(17, 22)):
+        if total > dealer_total:
+            ev += distribution[slot]
+        elif total < dealer_total:
+            ev -= distribution[slot]
+    return ev
+
+
+class _HandValues:
+    """Player EVs against one upcard, drawing at fixed shoe probabilities.
+
+    The dealer's outcomes are exact for the composition; the player's own
+    draws use the composition's card frequencies without further depletion.
+    """
+
+    def __init__(
+        self, distribution: tuple[float, ...], draw_odds: tuple[float, ...]
+    ) -> None:
+        self.distribution = distribution
+        self.draw_odds = draw_odds
+        self._best: dict[tuple[int, bool], float] = {}
+
+    def stand(self, hard: int, has_ace: bool) -> float:
+        return _stand_ev(self.distribution, _total(hard, has_ace))
+
+    def hit(self, hard: int, has_ace: bool) -> float:
+        return sum(
+            odds * self.best(hard + points, has_ace or points == 1)
+            for points, odds in zip(POINTS, self.draw_odds)
+            if odds
+        )
+
+    def double(self, hard: int, has_ace: bool) -> float:
+        return 2 * sum(
+            odds * self.stand(hard + points, has_ace or points == 1)
+            for points, odds in zip(POINTS, self.draw_odds)
+            if odds
+        )
+
+    def best(self, hard: int, has_ace: bool) -> float:
+        """Best of hit and stand from here on."""
+        if hard > 21:
+            return -1.0
+        key = (hard, has_ace)
+        cached = self._best.get(key)
+        if cached is not None:
+            return cached
+        value = self.stand(hard, has_ace)
+        if _total(hard, has_ace) < 21:
+            value = max(value, self.hit(hard, has_ace))
+        self._best[key] = value
+        return value
+
+    def split(self, pair_points: int) -> float:
+        """Two hands each starting from one card of the pair; no resplits."""
+        ev = 0.0
+        for points, odds in zip(POINTS, self.draw_odds):
+            if not odds:
+                continue
+            hard = pair_points + points
+            has_ace = pair_points == 1 or points == 1
+            if _total(hard, has_ace) == 21:
+                # Two-card 21 after a split is paid as blackjack by these rules.
+                value = 1.5
+            else:
+                value = max(self.best(hard, has_ace), self.double(hard, has_ace))
+            ev += odds * value
+        return 2 * ev
+
+    def entry(
+        self, hard: int, has_ace: bool, pair_points: int | None = None
+    ) -> StrategyEntry:
+        evs = {
+            "stand": self.stand(hard, has_ace),
+            "hit": self.hit(hard, has_ace),
+            "double": self.double(hard, has_ace),
+        }
+        if pair_points is not None:
+            evs["split"] = self.split(pair_points)
+        action = max(evs, key=evs.__getitem__)
+        return StrategyEntry(
+            action=action,
+            **{name: round(value, 4) for name, value in evs.items()},
+        )
+
+
+def _without(composition: Composition, points: int) -> Composition:
+    if not composition[points - 1]:
+        return composition
+    counts = list(composition)
+    counts[points - 1] -= 1
+    return tuple(counts)
+
+
+@lru_cache(maxsize=STRATEGY_CACHE_SIZE)
+def strategy_table(composition: Composition) -> dict[str, dict[str, StrategyEntry]]:
+    """Composition-dependent strategy for every starting total and upcard.
+
+    Rows are ``hard <n>``, ``soft <n>`` and ``pair <rank>`` (``T`` for any
+    ten-valued pair); columns are upcard labels ``A``, ``2`` ... ``T``.
+    Results are cached per composition, so repeated lookups are free.
+    """
+    table: dict[str, dict[str, StrategyEntry]] = {}
+    for upcard, label in zip(POINTS, UPCARD_LABELS):
+        values = _values_for(composition, upcard)
+        for total in HARD_TOTALS:
+            table.setdefault(f"hard {total}", {})[label] = values.entry(total, False)
+        for total in SOFT_TOTALS:
+            soft = values.entry(total - 10, True)
+            table.setdefault(f"soft {total}", {})[label] = soft
+        for points, pair_label in zip(POINTS, UPCARD_LABELS):
+            table.setdefault(f"pair {pair_label}", {})[label] = values.entry(
+                2 * points, points == 1, pair_points=points
+            )
+    return table
+
+
+def _values_for(composition: Composition, upcard: int) -> _HandValues:
+    unseen = _without(composition, upcard)
+    remaining = sum(unseen)
+    if remaining:
+        draw_odds = tuple(count / remaining for count in unseen)
+    else:
+        draw_odds = (0.0,) * len(POINTS)
+    return _HandValues(dealer_distribution(unseen, upcard), draw_odds)
+
+
+def hand_row(cards: list[str]) -> str:
+    """The strategy-table row for a player hand."""
+    points = [RANK_POINTS[card[0]] for card in cards]
+    if len(cards) == 2 and cards[0][0] == cards[1][0]:
+        return f"pair {UPCARD_LABELS[points[0] - 1]}"
+    hard = sum(points)
+    total = _total(hard, 1 in points)
+    if total != hard:
+        return f"soft {total}"
+    return f"hard {min(max(hard, HARD_TOTALS[0]), HARD_TOTALS[-1])}"
+
+
+def unseen_composition(state: BlackjackState) -> Composition:
+    """Cards the player cannot see: the rest of the shoe plus the hole card."""
+    cards = state.shoe.remaining()
+    if state.turn == TURN_PLAYER and state.status == STATUS_IN_PROGRESS:
+        cards = cards + state.dealer[1:2]
+    return composition_of(cards)
+
+
+def advise(
+    state: str, parsed: BlackjackState | None = None
+) -> StrategyAdvice | None:
+    """Strategy-table advice for the current hand, limited to its legal actions."""
+    if parsed is None:
+        try:
+            parsed = parse_state(state)
+        except ValueError:
+            return None
+    actions = legal_player_actions(parsed)
+    if not actions or not parsed.dealer:
+        return None
+    hand = parsed.player_hands[parsed.hand_index]
+    upcard = RANK_POINTS[parsed.dealer[0][0]]
+    unseen = unseen_composition(parsed)
+    # Table compositions still include the upcard, like a shoe before the deal.
+    with_upcard = list(unseen)
+    with_upcard[upcard - 1] += 1
+    row = hand_row(hand.cards)
+    entry = strategy_table(tuple(with_upcard))[row][UPCARD_LABELS[upcard - 1]]
+    if len(hand.cards) == 2:
+        evs = {action: entry.ev(action) for action in actions}
+    else:
+        # Table doubles and splits assume two cards; longer hands hit or stand.
+        values = _values_for(tuple(with_upcard), upcard)
+        hard = sum(RANK_POINTS[card[0]] for card in hand.cards)
+        has_ace = any(card[0] == "A" for card in hand.cards)
+        evs = {"stand": values.stand(hard, has_ace), "hit": values.hit(hard, has_ace)}
+    evs = {
+        action: round(value, 4)
+        for action, value in evs.items()
+        if action in actions and value is not None
+    }
+    distribution = dealer_distribution(unseen, upcard)
+    return StrategyAdvice(
+        action=max(evs, key=evs.__getitem__),
+        row=row,
+        evs=evs,
+        dealer_outcomes={
+            name: round(probability, 4)
+            for name, probability in zip(DEALER_OUTCOMES, distribution)
+        },
+    )
@@ -8,6 +8,14 @@ RANKS = "12345678"
 WHITE = "w"
 BLACK = "b"
 
+# Playable (dark) squares are indexed 0..31 as row * 4 + col // 2, where row 0 is
+# rank 8. Each side is stored as two 32-bit bitboards (men and kings).
+SQUARE_COUNT = 32
+DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+WHITE_MAN_DIRECTIONS = (0, 1)
+BLACK_MAN_DIRECTIONS = (2, 3)
+KING_DIRECTIONS = (0, 1, 2, 3)
+
 
 @dataclass(frozen=True)
 class CheckersMoveResult:
@@ -18,6 +26,29 @@ class CheckersMoveResult:
     turn: str | None = None
     last_move: str | None = None
     winner: str | None = None
+    next_legal_moves: list[str] | None = None
+    must_capture: bool | None = None
+
+
+@dataclass(frozen=True)
+class CheckersPosition:
+    white_men: int
+    white_kings: int
+    black_men: int
+    black_kings: int
+    turn: str
+
+    @property
+    def white(self) -> int:
+        return self.white_men | self.white_kings
+
+    @property
+    def black(self) -> int:
+        return self.black_men | self.black_kings
+
+    @property
+    def empty(self) -> int:
+        return ALL_SQUARES & ~(self.white | self.black)
 
 
 def initial_checkers_state() -> str:
@@ -126,177 +157,279 @@ def legal_checkers_moves(state: str) -> list[str]:
 
 
 def all_checkers_moves(state: str) -> tuple[list[str], list[str]]:
-    board, turn = parse_state(state)
+    return generate_moves(parse_position(state))
+
+
+def generate_moves(position: CheckersPosition) -> tuple[list[str], list[str]]:
+    """Return (capture_moves, simple_moves) for the side to move, each sorted."""
+    if position.turn == WHITE:
+        men, kings, opponents = position.white_men, position.white_kings, position.black
+    else:
+        men, kings, opponents = position.black_men, position.black_kings, position.white
+    empty = position.empty
+    man_steps = WHITE_MAN_STEPS if position.turn == WHITE else BLACK_MAN_STEPS
+    man_jumps = WHITE_MAN_JUMPS if position.turn == WHITE else BLACK_MAN_JUMPS
+    promotion = PROMOTION_ROWS[position.turn]
+
     capture_moves: set[str] = set()
     simple_moves: set[str] = set()
 
-    for row in range(8):
-        for col in range(8):
-            piece = board[row][col]
-            if piece == ".":
-                continue
-            if piece_color(piece) != turn:
-                continue
-            capture_moves.update(generate_capture_sequences(board, row, col, piece))
-            simple_moves.update(generate_simple_moves(board, row, col, piece))
+    for square in _iter_bits(men):
+        name = SQUARE_NAMES[square]
+        for target in _iter_bits(man_steps[square] & empty):
+            simple_moves.add(name + SQUARE_NAMES[target])
+        for path in _capture_paths(
+            square, empty | (1 << square), opponents, man_jumps, promotion
+        ):
+            capture_moves.add(name + path)
+
+    for square in _iter_bits(kings):
+        name = SQUARE_NAMES[square]
+        for target in _iter_bits(KING_STEPS[square] & empty):
+            simple_moves.add(name + SQUARE_NAMES[target])
+        for path in _capture_paths(
+            square, empty | (1 << square), opponents, KING_JUMPS, 0
+        ):
+            capture_moves.add(name + path)
 
     return sorted(capture_moves), sorted(simple_moves)
 
 
-def generate_simple_moves(
-    board: list[list[str]],
-    row: int,
-    col: int,
-    piece: str,
+def _capture_paths(
+    square: int,
+    empty: int,
+    opponents: int,
+    jumps: tuple[tuple[tuple[int, int], ...], ...],
+    promotion: int,
 ) -> list[str]:
-    moves: list[str] = []
-    for dr, dc in simple_directions(piece):
-        r = row + dr
-        c = col + dc
-        if not in_bounds(r, c) or not is_dark_square(r, c):
+    """Return landing-square suffixes for every maximal jump sequence.
+
+    The moving piece is treated as lifted off the board, so ``empty`` includes
+    its origin; captured pieces are removed from ``opponents`` and become empty
+    as the sequence proceeds. A man that reaches its promotion row stops there.
+    """
+    paths: list[str] = []
+    for middle_bit, landing in jumps[square]:
+        landing_bit = 1 << landing
+        if not opponents & middle_bit or not empty & landing_bit:
             continue
-        if board[r][c] != ".":
+        landing_name = SQUARE_NAMES[landing]
+        if promotion & landing_bit:
+            paths.append(landing_name)
             continue
-        moves.append(coords_to_square(row, col) + coords_to_square(r, c))
-    return moves
-
-
-def generate_capture_sequences(
-    board: list[list[str]],
-    row: int,
-    col: int,
-    piece: str,
-) -> list[str]:
-    sequences: list[str] = []
-    start_square = coords_to_square(row, col)
-
-    for dr, dc in capture_directions(piece):
-        mid_row = row + dr // 2
-        mid_col = col + dc // 2
-        end_row = row + dr
-        end_col = col + dc
-        if not in_bounds(end_row, end_col) or not is_dark_square(end_row, end_col):
-            continue
-        if board[end_row][end_col] != ".":
-            continue
-        middle_piece = board[mid_row][mid_col]
-        if middle_piece == "." or piece_color(middle_piece) == piece_color(piece):
-            continue
-
-        new_board = clone_board(board)
-        new_board[row][col] = "."
-        new_board[mid_row][mid_col] = "."
-        new_piece = maybe_king(piece, end_row)
-        new_board[end_row][end_col] = new_piece
-
-        landing_square = coords_to_square(end_row, end_col)
-
-        if new_piece != piece and not is_king(piece):
-            sequences.append(start_square + landing_square)
-            continue
-
-        continuation = generate_capture_sequences(
-            new_board, end_row, end_col, new_piece
+        continuation = _capture_paths(
+            landing,
+            empty | middle_bit,
+            opponents & ~middle_bit,
+            jumps,
+            promotion,
         )
         if continuation:
-            for cont in continuation:
-                sequences.append(start_square + cont)
+            paths.extend(landing_name + cont for cont in continuation)
         else:
-            sequences.append(start_square + landing_square)
-
-    return sequences
+            paths.append(landing_name)
+    return paths
 
 
 def apply_checkers_move(state: str, move: str) -> CheckersMoveResult:
+    """Validate and apply a move, returning the next side's legal moves too.
+
+    The state is parsed once; the mover's moves and the reply moves are each
+    generated once from the bitboard position.
+    """
     try:
-        board, turn = parse_state(state)
+        position = parse_position(state)
     except ValueError as exc:
         return CheckersMoveResult(False, state, error=str(exc))
 
     normalized_move = normalize_move_notation(move)
-    legal_moves = legal_checkers_moves(state)
-    if normalized_move not in legal_moves:
+    capture_moves, simple_moves = generate_moves(position)
+    if normalized_move not in (capture_moves or simple_moves):
         return CheckersMoveResult(False, state, error="Illegal move.")
 
-    squares = move_squares_from_string(normalized_move)
-    start_row, start_col = square_to_coords(squares[0])
-    piece = board[start_row][start_col]
-    board[start_row][start_col] = "."
-
-    for idx in range(1, len(squares)):
-        end_row, end_col = square_to_coords(squares[idx])
-        dr = end_row - start_row
-        dc = end_col - start_col
-        if abs(dr) == 2 and abs(dc) == 2:
-            mid_row = start_row + dr // 2
-            mid_col = start_col + dc // 2
-            board[mid_row][mid_col] = "."
-        start_row, start_col = end_row, end_col
-
-    piece = maybe_king(piece, start_row)
-    board[start_row][start_col] = piece
-
-    next_turn = opponent(turn)
-    new_state = board_to_state(board, next_turn)
+    next_position = _play_move(position, normalized_move)
+    next_captures, next_simple = generate_moves(next_position)
+    next_moves = next_captures or next_simple
 
     status = "in_progress"
     winner = None
-    if not has_pieces(board, next_turn) or not legal_checkers_moves(new_state):
+    if not next_moves:
         status = "game_over"
-        winner = turn
+        winner = position.turn
 
     return CheckersMoveResult(
         True,
-        new_state,
+        position_to_state(next_position),
         status=status,
-        turn=next_turn,
+        turn=next_position.turn,
         last_move=normalized_move,
         winner=winner,
+        next_legal_moves=next_moves,
+        must_capture=bool(next_captures),
+    )
+
+
+def _play_move(position: CheckersPosition, move: str) -> CheckersPosition:
+    """Apply an already-validated move in notation such as ``c3e5g7``."""
+    path = [SQUARE_INDEX[square] for square in move_squares_from_string(move)]
+    start_bit = 1 << path[0]
+    end_bit = 1 << path[-1]
+    captured = 0
+    for origin, landing in zip(path, path[1:]):
+        captured |= JUMP_MIDDLES.get((origin, landing), 0)
+
+    white_men = position.white_men
+    white_kings = position.white_kings
+    black_men = position.black_men
+    black_kings = position.black_kings
+    if position.turn == WHITE:
+        if white_kings & start_bit:
+            white_kings = (white_kings & ~start_bit) | end_bit
+        elif end_bit & PROMOTION_ROWS[WHITE]:
+            white_men &= ~start_bit
+            white_kings |= end_bit
+        else:
+            white_men = (white_men & ~start_bit) | end_bit
+        black_men &= ~captured
+        black_kings &= ~captured
+    else:
+        if black_kings & start_bit:
+            black_kings = (black_kings & ~start_bit) | end_bit
+        elif end_bit & PROMOTION_ROWS[BLACK]:
+            black_men &= ~start_bit
+            black_kings |= end_bit
+        else:
+            black_men = (black_men & ~start_bit) | end_bit
+        white_men &= ~captured
+        white_kings &= ~captured
+
+    return CheckersPosition(
+        white_men=white_men,
+        white_kings=white_kings,
+        black_men=black_men,
+        black_kings=black_kings,
+        turn=opponent(position.turn),
     )
 
 
-def has_pieces(board: list[list[str]], color: str) -> bool:
-    for row in board:
-        for piece in row:
-            if piece == ".":
-                continue
-            if piece_color(piece) == color:
-                return True
-    return False
+def in_bounds(row: int, col: int) -> bool:
+    return 0 <= row < 8 and 0 <= col < 8
 
 
-def maybe_king(piece: str, row: int) -> str:
-    if is_king(piece):
-        return piece
-    if piece == "w" and row == 0:
-        return "W"
-    if piece == "b" and row == 7:
-        return "B"
-    return piece
+def parse_position(state: str) -> CheckersPosition:
+    if not isinstance(state, str) or " " not in state:
+        raise ValueError("Invalid checkers state string.")
+    board_part, turn = state.strip().split(" ", 1)
+    rows = board_part.split("/")
+    if len(rows) != 8:
+        raise ValueError("Invalid checkers state rows.")
+    if any(len(text) != 8 for text in rows):
+        raise ValueError("Invalid checkers state row length.")
+    cells = "".join(rows)
+    if not set(cells) <= PIECE_CHARS:
+        raise ValueError("Invalid checkers state piece.")
+    if any(cells[index] != "." for index in LIGHT_CELL_INDICES):
+        raise ValueError("Invalid checkers state: piece on light square.")
+    bitboards = {"w": 0, "W": 0, "b": 0, "B": 0, ".": 0}
+    for square, index in enumerate(DARK_CELL_INDICES):
+        bitboards[cells[index]] |= 1 << square
+    if turn not in {WHITE, BLACK}:
+        raise ValueError("Invalid checkers state turn.")
+    return CheckersPosition(
+        white_men=bitboards["w"],
+        white_kings=bitboards["W"],
+        black_men=bitboards["b"],
+        black_kings=bitboards["B"],
+        turn=turn,
+    )
 
 
-def simple_directions(piece: str) -> list[tuple[int, int]]:
-    if is_king(piece):
-        return [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-    if piece == "w":
-        return [(-1, -1), (-1, 1)]
-    return [(1, -1), (1, 1)]
+def position_to_state(position: CheckersPosition) -> str:
+    cells = ["."] * 64
+    for piece, bits in (
+        ("w", position.white_men),
+        ("W", position.white_kings),
+        ("b", position.black_men),
+        ("B", position.black_kings),
+    ):
+        for square in _iter_bits(bits):
+            cells[DARK_CELL_INDICES[square]] = piece
+    rows = ["".join(cells[row * 8 : row * 8 + 8]) for row in range(8)]
+    return "/".join(rows) + f" {position.turn}"
 
 
-def capture_directions(piece: str) -> list[tuple[int, int]]:
-    if is_king(piece):
-        return [(-2, -2), (-2, 2), (2, -2), (2, 2)]
-    if piece == "w":
-        return [(-2, -2), (-2, 2)]
-    return [(2, -2), (2, 2)]
+def square_index(row: int, col: int) -> int:
+    return row * 4 + col // 2
 
 
-def in_bounds(row: int, col: int) -> bool:
-    return 0 <= row < 8 and 0 <= col < 8
+def _iter_bits(bits: int):
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
 
 
-def clone_board(board: list[list[str]]) -> list[list[str]]:
-    return [list(row) for row in board]
+def _build_square_coords() -> list[tuple[int, int]]:
+    coords = [(0, 0)] * SQUARE_COUNT
+    for row in range(8):
+        for col in range(8):
+            if is_dark_square(row, col):
+                coords[square_index(row, col)] = (row, col)
+    return coords
+
+
+def _build_steps(directions: tuple[int, ...]) -> tuple[int, ...]:
+    masks = []
+    for square in range(SQUARE_COUNT):
+        row, col = SQUARE_COORDS[square]
+        mask = 0
+        for direction in directions:
+            dr, dc = DIRECTIONS[direction]
+            if in_bounds(row + dr, col + dc):
+                mask |= 1 << square_index(row + dr, col + dc)
+        masks.append(mask)
+    return tuple(masks)
+
+
+def _build_jumps(
+    directions: tuple[int, ...],
+) -> tuple[tuple[tuple[int, int], ...], ...]:
+    """Per square: (captured-square bit, landing square) for each jump."""
+    table = []
+    for square in range(SQUARE_COUNT):
+        row, col = SQUARE_COORDS[square]
+        jumps = []
+        for direction in directions:
+            dr, dc = DIRECTIONS[direction]
+            if in_bounds(row + 2 * dr, col + 2 * dc):
+                middle = square_index(row + dr, col + dc)
+                landing = square_index(row + 2 * dr, col + 2 * dc)
+                jumps.append((1 << middle, landing))
+        table.append(tuple(jumps))
+    return tuple(table)
+
+
+ALL_SQUARES = (1 << SQUARE_COUNT) - 1
+PIECE_CHARS = {"w", "W", "b", "B", "."}
+SQUARE_COORDS = _build_square_coords()
+DARK_CELL_INDICES = tuple(row * 8 + col for row, col in SQUARE_COORDS)
+LIGHT_CELL_INDICES = tuple(
+    index for index in range(64) if not is_dark_square(index // 8, index % 8)
+)
+SQUARE_NAMES = [coords_to_square(row, col) for row, col in SQUARE_COORDS]
+SQUARE_INDEX = {name: square for square, name in enumerate(SQUARE_NAMES)}
+PROMOTION_ROWS = {WHITE: 0x0000000F, BLACK: 0xF0000000}
+WHITE_MAN_STEPS = _build_steps(WHITE_MAN_DIRECTIONS)
+BLACK_MAN_STEPS = _build_steps(BLACK_MAN_DIRECTIONS)
+KING_STEPS = _build_steps(KING_DIRECTIONS)
+WHITE_MAN_JUMPS = _build_jumps(WHITE_MAN_DIRECTIONS)
+BLACK_MAN_JUMPS = _build_jumps(BLACK_MAN_DIRECTIONS)
+KING_JUMPS = _build_jumps(KING_DIRECTIONS)
+JUMP_MIDDLES = {
+    (origin, landing): middle_bit
+    for origin in range(SQUARE_COUNT)
+    for middle_bit, landing in KING_JUMPS[origin]
+}
 
 
 def opponent_move_candidates(state: str, limit: int = 200) -> list[str]:
@@ -0,0 +1,183 @@
+"""Polyglot opening book lookups for the chess opponent.
+
+The book file is memory-mapped and binary-searched by Zobrist key through
+``chess.polyglot``, so lookups touch a few pages instead of loading the
+whole file. ``write_book`` produces the same format, which is how
+``scripts/build_opening_book.py`` builds the book shipped in ``data/``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import os
+from pathlib import Path
+import random
+import struct
+import threading
+from typing import Iterable, Mapping
+
+import chess
+import chess.polyglot
+
+try:
+    from .chess_rules import board_from_fen
+    from .rng_service import shared_rng
+except ImportError:  # pragma: no cover - fallback for script execution
+    from chess_rules import board_from_fen
+    from rng_service import shared_rng
+
+
+BOOK_ENV_VAR = "CHESS_OPENING_BOOK"
+DEFAULT_BOOK_PATH = Path(__file__).resolve().parent / "data" / "opening_book.bin"
+MAX_WEIGHT = 0xFFFF
+_ENTRY = struct.Struct(">QHHI")
+# Polyglot writes castling as the king taking its own rook.
+_CASTLING_TARGETS = {
+    (chess.E1, chess.G1): chess.H1,
+    (chess.E1, chess.C1): chess.A1,
+    (chess.E8, chess.G8): chess.H8,
+    (chess.E8, chess.C8): chess.A8,
+}
+
+
+@dataclass(frozen=True)
+class BookMove:
+    uci: str
+    san: str
+    weight: int
+    probability: float
+
+
+class OpeningBook:
+    """A Polyglot book opened on first use, once per process."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._reader: chess.polyglot.MemoryMappedReader | None = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> chess.polyglot.MemoryMappedReader:
+        with self._lock:
+            if self._reader is None:
+                self._reader = chess.polyglot.open_reader(self.path)
+            return self._reader
+
+    def __len__(self) -> int:
+        return len(self._open())
+
+    def moves(self, board: chess.Board) -> list[BookMove]:
+        """Book moves for ``board``, heaviest first; empty when out of book."""
+        weights: dict[chess.Move, int] = {}
+        for entry in self._open().find_all(board):
+            if entry.weight and board.is_legal(entry.move):
+                weights[entry.move] = weights.get(entry.move, 0) + entry.weight
+        total = sum(weights.values())
+        ranked = sorted(weights.items(), key=lambda item: (-item[1], item[0].uci()))
+        return [
+            BookMove(move.uci(), board.san(move), weight, weight / total)
+            for move, weight in ranked
+        ]
+
+    def choose(
+        self, board: chess.Board, rng: random.Random | None = None
+    ) -> tuple[BookMove | None, list[BookMove]]:
+        """A weighted random book move and the full list it was drawn from."""
+        moves = self.moves(board)
+        if not moves:
+            return None, moves
+        rng = rng or shared_rng()
+        chosen = rng.choices(moves, weights=[move.weight for move in moves])[0]
+        return chosen, moves
+
+    def close(self) -> None:
+        with self._lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+
+@lru_cache(maxsize=1)
+def opening_book() -> OpeningBook | None:
+    """The book named by ``CHESS_OPENING_BOOK``, or the bundled one.
+
+    An empty variable disables the book, as does a missing file.
+    """
+    raw = os.environ.get(BOOK_ENV_VAR)
+    if raw is not None and not raw.strip():
+        return None
+    path = Path(raw) if raw else DEFAULT_BOOK_PATH
+    if not path.is_file():
+        return None
+    return OpeningBook(path)
+
+
+def choose_book_move(
+    fen: str, rng: random.Random | None = None
+) -> tuple[BookMove | None, list[BookMove]]:
+    """Pick a book move for ``fen``; ``(None, [])`` when out of book."""
+    book = opening_book()
+    if book is None:
+        return None, []
+    try:
+        board = board_from_fen(fen)
+    except ValueError:
+        return None, []
+    return book.choose(board, rng)
+
+
+def encode_move(board: chess.Board, move: chess.Move) -> int:
+    """The 16-bit Polyglot encoding of ``move`` in ``board``."""
+    to_square = move.to_square
+    if board.piece_type_at(move.from_square) == chess.KING:
+        to_square = _CASTLING_TARGETS.get((move.from_square, to_square), to_square)
+    promotion = move.promotion - 1 if move.promotion else 0
+    return (
+        chess.square_file(to_square)
+        | chess.square_rank(to_square) << 3
+        | chess.square_file(move.from_square) << 6
+        | chess.square_rank(move.from_square) << 9
+        | promotion << 12
+    )
+
+
+def write_book(
+    path: str | Path, positions: Mapping[str, Mapping[str, int]]
+) -> int:
+    """Write ``{fen: {uci: weight}}`` as a Polyglot book; return the entry count.
+
+    Weights are scaled per position so the heaviest move gets ``MAX_WEIGHT``
+    when any count exceeds it.
+    """
+    entries = []
+    for fen, weights in positions.items():
+        board = chess.Board(fen)
+        key = chess.polyglot.zobrist_hash(board)
+        scale = max(1, -(-max(weights.values(), default=0) // MAX_WEIGHT))
+        for uci, weight in weights.items():
+            move = chess.Move.from_uci(uci)
+            if weight > 0 and board.is_legal(move):
+                entries.append((key, encode_move(board, move), max(1, weight // scale)))
+    entries.sort(key=lambda entry: (entry[0], -entry[2], entry[1]))
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(b"".join(_ENTRY.pack(*entry, 0) for entry in entries))
+    return len(entries)
+
+
+def positions_from_games(
+    games: Iterable[Iterable[str]], plies: int
+) -> dict[str, dict[str, int]]:
+    """Count the moves played from each position within the first ``plies``."""
+    positions: dict[str, dict[str, int]] = {}
+    for game in games:
+        board = chess.Board()
+        for ply, uci in enumerate(game):
+            if ply >= plies:
+                break
+            # Key by the EPD so move counters do not split transpositions.
+            fen = board.epd() + " 0 1"
+            counts = positions.setdefault(fen, {})
+            counts[uci] = counts.get(uci, 0) + 1
+            board.push_uci(uci)
+    return positions
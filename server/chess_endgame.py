@@ -0,0 +1,200 @@
+"""Distance-to-mate tables for the three-piece chess endgames KQK, KRK and KPK.
+
+Each table is a packed byte array with one byte per position: the number of
+plies to mate with best play, ``DRAW`` or ``INVALID``. Positions are stored
+with the side that has the extra piece as White. KQK and KRK fold the
+stronger king into the a1-d1-d4 triangle, and KPK mirrors the pawn onto
+files a-d. ``scripts/build_endgame_tables.py`` generates the files by
+retrograde analysis; here they are memory-mapped and probed in O(1).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import mmap
+import os
+from pathlib import Path
+import threading
+
+import chess
+
+
+TABLES_ENV_VAR = "CHESS_ENDGAME_TABLES"
+DEFAULT_TABLES_DIR = Path(__file__).resolve().parent / "data" / "endgame"
+DRAW = 255
+INVALID = 254
+TRIANGLE = (
+    chess.A1,
+    chess.B1,
+    chess.C1,
+    chess.D1,
+    chess.B2,
+    chess.C2,
+    chess.D2,
+    chess.C3,
+    chess.D3,
+    chess.D4,
+)
+TRIANGLE_INDEX = {square: index for index, square in enumerate(TRIANGLE)}
+PAWN_SQUARES = 24  # files a-d, ranks 2-7
+TABLE_PIECES = {"KQK": chess.QUEEN, "KRK": chess.ROOK, "KPK": chess.PAWN}
+TABLE_SIZES = {
+    "KQK": 2 * len(TRIANGLE) * 64 * 64,
+    "KRK": 2 * len(TRIANGLE) * 64 * 64,
+    "KPK": 2 * PAWN_SQUARES * 64 * 64,
+}
+
+OUTCOME_WIN = "win"
+OUTCOME_LOSS = "loss"
+OUTCOME_DRAW = "draw"
+
+
+@dataclass(frozen=True)
+class EndgameProbe:
+    """A table result from the side to move's point of view."""
+
+    material: str
+    outcome: str
+    plies: int | None
+
+    @property
+    def mate_in(self) -> int | None:
+        """Moves to mate: positive when the side to move mates."""
+        if self.plies is None:
+            return None
+        if self.outcome == OUTCOME_WIN:
+            return (self.plies + 1) // 2
+        return -(self.plies // 2)
+
+
+def _transpose(square: int) -> int:
+    return chess.square(chess.square_rank(square), chess.square_file(square))
+
+
+def table_index(
+    material: str, strong_to_move: bool, king: int, weak_king: int, piece: int
+) -> int:
+    """Index into ``material``'s table, with the stronger side as White."""
+    side = 0 if strong_to_move else 1
+    if material == "KPK":
+        if chess.square_file(piece) > 3:
+            king, weak_king, piece = king ^ 7, weak_king ^ 7, piece ^ 7
+        pawn = (chess.square_rank(piece) - 1) * 4 + chess.square_file(piece)
+        return ((side * PAWN_SQUARES + pawn) * 64 + king) * 64 + weak_king
+    if chess.square_file(king) > 3:
+        king, weak_king, piece = king ^ 7, weak_king ^ 7, piece ^ 7
+    if chess.square_rank(king) > 3:
+        king, weak_king, piece = king ^ 56, weak_king ^ 56, piece ^ 56
+    if chess.square_rank(king) > chess.square_file(king):
+        king, weak_king, piece = (
+            _transpose(king),
+            _transpose(weak_king),
+            _transpose(piece),
+        )
+    triangle = side * len(TRIANGLE) + TRIANGLE_INDEX[king]
+    return (triangle * 64 + weak_king) * 64 + piece
+
+
+def decode_index(material: str, index: int) -> tuple[bool, int, int, int]:
+    """``(strong_to_move, king, weak_king, piece)`` for a table index."""
+    if material == "KPK":
+        rest, weak_king = divmod(index, 64)
+        rest, king = divmod(rest, 64)
+        side, pawn = divmod(rest, PAWN_SQUARES)
+        piece = chess.square(pawn % 4, pawn // 4 + 1)
+        return side == 0, king, weak_king, piece
+    rest, piece = divmod(index, 64)
+    rest, weak_king = divmod(rest, 64)
+    side, triangle = divmod(rest, len(TRIANGLE))
+    return side == 0, TRIANGLE[triangle], weak_king, piece
+
+
+class EndgameTables:
+    """Tables in ``directory`` (``kqk.bin`` ...), each mapped on first probe."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self._tables: dict[str, mmap.mmap | None] = {}
+        self._lock = threading.Lock()
+
+    def table(self, material: str) -> mmap.mmap | None:
+        with self._lock:
+            if material not in self._tables:
+                self._tables[material] = self._map(material)
+            return self._tables[material]
+
+    def _map(self, material: str) -> mmap.mmap | None:
+        path = self.directory / f"{material.lower()}.bin"
+        try:
+            with open(path, "rb") as handle:
+                table = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(table) != TABLE_SIZES[material]:
+            table.close()
+            raise ValueError(f"{path} is not a {material} table.")
+        return table
+
+    def probe(self, board: chess.Board) -> EndgameProbe | None:
+        """The table result for ``board``, or ``None`` if no table covers it."""
+        occupied = board.occupied
+        pieces = chess.popcount(occupied)
+        if pieces > 3 or board.castling_rights:
+            return None
+        if pieces == 2:
+            return EndgameProbe("KK", OUTCOME_DRAW, None)
+        square = chess.lsb(occupied & ~board.kings)
+        piece = board.piece_at(square)
+        if piece is None:
+            return None
+        material = f"K{piece.symbol().upper()}K"
+        if piece.piece_type in (chess.KNIGHT, chess.BISHOP):
+            return EndgameProbe(material, OUTCOME_DRAW, None)
+        table = self.table(material)
+        if table is None:
+            return None
+        strong = piece.color
+        king, weak_king = board.king(strong), board.king(not strong)
+        if king is None or weak_king is None:
+            return None
+        if strong == chess.BLACK:
+            king, weak_king, square = king ^ 56, weak_king ^ 56, square ^ 56
+        strong_to_move = board.turn == strong
+        value = table[table_index(material, strong_to_move, king, weak_king, square)]
+        if value == INVALID:
+            return None
+        if value == DRAW:
+            return EndgameProbe(material, OUTCOME_DRAW, None)
+        return EndgameProbe(
+            material, OUTCOME_WIN if strong_to_move else OUTCOME_LOSS, value
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            for table in self._tables.values():
+                if table is not None:
+                    table.close()
+            self._tables.clear()
+
+
+@lru_cache(maxsize=1)
+def endgame_tables() -> EndgameTables | None:
+    """Tables from ``CHESS_ENDGAME_TABLES``, or the bundled ones.
+
+    An empty variable disables the tables.
+    """
+    raw = os.environ.get(TABLES_ENV_VAR)
+    if raw is not None and not raw.strip():
+        return None
+    directory = Path(raw) if raw else DEFAULT_TABLES_DIR
+    if not directory.is_dir():
+        return None
+    return EndgameTables(directory)
+
+
+def probe_endgame(board: chess.Board) -> EndgameProbe | None:
+    tables = endgame_tables()
+    if tables is None:
+        return None
+    return tables.probe(board)
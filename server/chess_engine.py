@@ -0,0 +1,714 @@
+"""Chess search on python-chess boards: alpha-beta with iterative deepening.
+
+Positions with three pieces or fewer are scored from the endgame tables
+instead of being searched.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+
+import chess
+import chess.polyglot
+
+try:
+    from .chess_endgame import OUTCOME_DRAW, OUTCOME_WIN, probe_endgame
+    from .chess_rules import board_from_fen as parsed_board, position_info
+except ImportError:  # pragma: no cover - fallback for script execution
+    from chess_endgame import OUTCOME_DRAW, OUTCOME_WIN, probe_endgame
+    from chess_rules import board_from_fen as parsed_board, position_info
+
+
+PIECE_VALUES = {
+    chess.PAWN: 100,
+    chess.KNIGHT: 320,
+    chess.BISHOP: 330,
+    chess.ROOK: 500,
+    chess.QUEEN: 900,
+    chess.KING: 0,
+}
+# Non-pawn material weights for tapering between middlegame and endgame.
+PHASE_WEIGHTS = {
+    chess.PAWN: 0,
+    chess.KNIGHT: 1,
+    chess.BISHOP: 1,
+    chess.ROOK: 2,
+    chess.QUEEN: 4,
+    chess.KING: 0,
+}
+MAX_PHASE = 24
+
+MATE_SCORE = 100_000
+MAX_PLY = 64
+# Scores beyond this are forced mates; the distance is MATE_SCORE - |score|.
+# Table mates can run deeper than the search itself, so leave room for them.
+MATE_BOUND = MATE_SCORE - 1_000
+TABLE_PIECES = 3
+INFINITY = 1_000_000
+DEFAULT_BUDGET_MS = 200
+MAX_BUDGET_MS = 5_000
+DEFAULT_TOP_MOVES = 5
+MAX_TOP_MOVES = 20
+MAX_DEPTH = 32
+TRANSPOSITION_TABLE_SIZE = 1 << 18
+DEADLINE_CHECK_NODES = 256
+# Quiescence skips captures that cannot reach alpha even with this much to spare.
+DELTA_MARGIN = 200
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# Piece-square tables from White's side, written rank 8 first as on a diagram.
+_PAWN_TABLE = (
+    0, 0, 0, 0, 0, 0, 0, 0,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    10, 10, 20, 30, 30, 20, 10, 10,
+    5, 5, 10, 25, 25, 10, 5, 5,
+    0, 0, 0, 20, 20, 0, 0, 0,
+    5, -5, -10, 0, 0, -10, -5, 5,
+    5, 10, 10, -20, -20, 10, 10, 5,
+    0, 0, 0, 0, 0, 0, 0, 0,
+)  # fmt: skip
+_PAWN_ENDGAME_TABLE = (
+    0, 0, 0, 0, 0, 0, 0, 0,
+    80, 80, 80, 80, 80, 80, 80, 80,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    30, 30, 30, 30, 30, 30, 30, 30,
+    15, 15, 15, 15, 15, 15, 15, 15,
+    5, 5, 5, 5, 5, 5, 5, 5,
+    0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0,
+)  # fmt: skip
+_KNIGHT_TABLE = (
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20, 0, 0, 0, 0, -20, -40,
+    -30, 0, 10, 15, 15, 10, 0, -30,
+    -30, 5, 15, 20, 20, 15, 5, -30,
+    -30, 0, 15, 20, 20, 15, 0, -30,
+    -30, 5, 10, 15, 15, 10, 5, -30,
+    -40, -20, 0, 5, 5, 0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+)  # fmt: skip
+_BISHOP_TABLE = (
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 10, 10, 5, 0, -10,
+    -10, 5, 5, 10, 10, 5, 5, -10,
+    -10, 0, 10, 10, 10, 10, 0, -10,
+    -10, 10, 10, 10, 10, 10, 10, -10,
+    -10, 5, 0, 0, 0, 0, 5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+)  # fmt: skip
+_ROOK_TABLE = (
+    0, 0, 0, 0, 0, 0, 0, 0,
+    5, 10, 10, 10, 10, 10, 10, 5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    0, 0, 0, 5, 5, 0, 0, 0,
+)  # fmt: skip
+_QUEEN_TABLE = (
+    -20, -10, -10, -5, -5, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 5, 5, 5, 0, -10,
+    -5, 0, 5, 5, 5, 5, 0, -5,
+    0, 0, 5, 5, 5, 5, 0, -5,
+    -10, 5, 5, 5, 5, 5, 0, -10,
+    -10, 0, 5, 0, 0, 0, 0, -10,
+    -20, -10, -10, -5, -5, -10, -10, -20,
+)  # fmt: skip
+_KING_TABLE = (
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+    20, 20, 0, 0, 0, 0, 20, 20,
+    20, 30, 10, 0, 0, 10, 30, 20,
+)  # fmt: skip
+_KING_ENDGAME_TABLE = (
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10, 0, 0, -10, -20, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -30, 0, 0, 0, 0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+)  # fmt: skip
+_MIDGAME_TABLES = {
+    chess.PAWN: _PAWN_TABLE,
+    chess.KNIGHT: _KNIGHT_TABLE,
+    chess.BISHOP: _BISHOP_TABLE,
+    chess.ROOK: _ROOK_TABLE,
+    chess.QUEEN: _QUEEN_TABLE,
+    chess.KING: _KING_TABLE,
+}
+_ENDGAME_TABLES = {
+    **_MIDGAME_TABLES,
+    chess.PAWN: _PAWN_ENDGAME_TABLE,
+    chess.KING: _KING_ENDGAME_TABLE,
+}
+
+
+def piece_index(piece_type: chess.PieceType, color: chess.Color) -> int:
+    """Polyglot piece numbering: black pawn 0, white pawn 1, ... white king 11."""
+    return (piece_type - 1) * 2 + int(color)
+
+
+def _signed_squares(tables: dict[int, tuple[int, ...]]) -> tuple[tuple[int, ...], ...]:
+    # Material plus placement per piece index and square, positive for White.
+    result = []
+    for piece_type in chess.PIECE_TYPES:
+        table = tables[piece_type]
+        value = PIECE_VALUES[piece_type]
+        for color in (chess.BLACK, chess.WHITE):
+            # Diagram index of a1 is 56, so White flips ranks and Black reads as is.
+            flip = 56 if color == chess.WHITE else 0
+            sign = 1 if color == chess.WHITE else -1
+            result.append(
+                tuple(sign * (value + table[square ^ flip]) for square in chess.SQUARES)
+            )
+    return tuple(result)
+
+
+_MIDGAME_SQUARES = _signed_squares(_MIDGAME_TABLES)
+_ENDGAME_SQUARES = _signed_squares(_ENDGAME_TABLES)
+_ZOBRIST = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+_ZOBRIST_PIECES = tuple(
+    tuple(_ZOBRIST[64 * index + square] for square in chess.SQUARES)
+    for index in range(12)
+)
+_ZOBRIST_TURN = _ZOBRIST[780]
+_CASTLING_KEYS = (
+    (chess.BB_H1, _ZOBRIST[768]),
+    (chess.BB_A1, _ZOBRIST[769]),
+    (chess.BB_H8, _ZOBRIST[770]),
+    (chess.BB_A8, _ZOBRIST[771]),
+)
+_PHASES = tuple(PHASE_WEIGHTS[(index >> 1) + 1] for index in range(12))
+
+# Incrementally maintained (zobrist key, midgame sum, endgame sum, phase).
+Position = tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class ScoredMove:
+    uci: str
+    san: str
+    score: int
+    mate_in: int | None
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    best_move: str | None
+    moves: list[ScoredMove]
+    ranked: list[str]
+    depth: int
+    nodes: int
+    elapsed_ms: float
+    tablebase: bool = False
+
+
+class TranspositionTable:
+    """Fixed-size, always-replace table indexed by the low bits of the key."""
+
+    def __init__(self, size: int = TRANSPOSITION_TABLE_SIZE) -> None:
+        if size < 1 or size & (size - 1):
+            raise ValueError("Transposition table size must be a power of two.")
+        self._index_mask = size - 1
+        self._entries: list[tuple | None] = [None] * size
+
+    def get(self, key: int) -> tuple[int, int, int, int, chess.Move | None] | None:
+        entry = self._entries[key & self._index_mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def put(
+        self, key: int, depth: int, flag: int, score: int, move: chess.Move | None
+    ) -> None:
+        self._entries[key & self._index_mask] = (key, depth, flag, score, move)
+
+    def clear(self) -> None:
+        self._entries = [None] * len(self._entries)
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+def board_from_fen(fen: str) -> chess.Board | None:
+    """A searchable board for ``fen``, or ``None`` if it is invalid."""
+    try:
+        info = position_info(fen)
+    except (TypeError, ValueError):
+        return None
+    if not info.valid:
+        return None
+    return parsed_board(fen)
+
+
+def _castling_key(rights: int) -> int:
+    key = 0
+    for mask, value in _CASTLING_KEYS:
+        if rights & mask:
+            key ^= value
+    return key
+
+
+def _en_passant_key(board: chess.Board) -> int:
+    # Polyglot hashes the file only when a pawn stands ready to capture.
+    ep_square = board.ep_square
+    if ep_square is None:
+        return 0
+    rank = chess.square_rank(ep_square) + (-1 if board.turn == chess.WHITE else 1)
+    pawns = board.pawns & board.occupied_co[board.turn]
+    for file in (chess.square_file(ep_square) - 1, chess.square_file(ep_square) + 1):
+        if 0 <= file < 8 and pawns & chess.BB_SQUARES[chess.square(file, rank)]:
+            return _ZOBRIST[772 + chess.square_file(ep_square)]
+    return 0
+
+
+def initial_position(board: chess.Board) -> Position:
+    """Compute the key and evaluation sums for ``board`` from scratch."""
+    midgame = endgame = phase = 0
+    for square, piece in board.piece_map().items():
+        index = piece_index(piece.piece_type, piece.color)
+        midgame += _MIDGAME_SQUARES[index][square]
+        endgame += _ENDGAME_SQUARES[index][square]
+        phase += _PHASES[index]
+    return chess.polyglot.zobrist_hash(board), midgame, endgame, phase
+
+
+def play(board: chess.Board, move: chess.Move, position: Position) -> Position:
+    """Push ``move`` and return the position updated from the move's deltas."""
+    key, midgame, endgame, phase = position
+    turn = board.turn
+    from_square = move.from_square
+    to_square = move.to_square
+    moving = board.piece_type_at(from_square)
+    index = (moving - 1) * 2 + turn
+    key ^= _ZOBRIST_PIECES[index][from_square]
+    midgame -= _MIDGAME_SQUARES[index][from_square]
+    endgame -= _ENDGAME_SQUARES[index][from_square]
+
+    placed = index
+    if move.promotion:
+        placed = (move.promotion - 1) * 2 + turn
+        phase += _PHASES[placed]
+    key ^= _ZOBRIST_PIECES[placed][to_square]
+    midgame += _MIDGAME_SQUARES[placed][to_square]
+    endgame += _ENDGAME_SQUARES[placed][to_square]
+
+    captured_square = to_square
+    captured = board.piece_type_at(to_square)
+    if captured is None and moving == chess.PAWN and to_square == board.ep_square:
+        # The pawn taken en passant stands beside the mover, one rank back.
+        captured_square = to_square ^ 8
+        captured = chess.PAWN
+    if captured is not None:
+        taken = (captured - 1) * 2 + (not turn)
+        key ^= _ZOBRIST_PIECES[taken][captured_square]
+        midgame -= _MIDGAME_SQUARES[taken][captured_square]
+        endgame -= _ENDGAME_SQUARES[taken][captured_square]
+        phase -= _PHASES[taken]
+
+    if moving == chess.KING and abs(to_square - from_square) == 2:
+        if to_square > from_square:
+            rook_from, rook_to = from_square + 3, from_square + 1
+        else:
+            rook_from, rook_to = from_square - 4, from_square - 1
+        rook = (chess.ROOK - 1) * 2 + turn
+        key ^= _ZOBRIST_PIECES[rook][rook_from] ^ _ZOBRIST_PIECES[rook][rook_to]
+        midgame += _MIDGAME_SQUARES[rook][rook_to] - _MIDGAME_SQUARES[rook][rook_from]
+        endgame += _ENDGAME_SQUARES[rook][rook_to] - _ENDGAME_SQUARES[rook][rook_from]
+
+    rights = board.castling_rights
+    key ^= _en_passant_key(board)
+    board.push(move)
+    if board.castling_rights != rights:
+        key ^= _castling_key(rights) ^ _castling_key(board.castling_rights)
+    key ^= _en_passant_key(board) ^ _ZOBRIST_TURN
+    return key, midgame, endgame, phase
+
+
+def evaluate(position: Position, turn: chess.Color) -> int:
+    """Tapered material and placement score in centipawns for ``turn``."""
+    _, midgame, endgame, phase = position
+    phase = min(phase, MAX_PHASE)
+    score = (midgame * phase + endgame * (MAX_PHASE - phase)) // MAX_PHASE
+    return score if turn == chess.WHITE else -score
+
+
+def table_score(board: chess.Board, ply: int = 0) -> int | None:
+    """Exact score for the side to move from the endgame tables, if covered."""
+    if chess.popcount(board.occupied) > TABLE_PIECES:
+        return None
+    probe = probe_endgame(board)
+    if probe is None:
+        return None
+    if probe.outcome == OUTCOME_DRAW:
+        return 0
+    score = MATE_SCORE - ply - probe.plies
+    return score if probe.outcome == OUTCOME_WIN else -score
+
+
+def mate_in(score: int) -> int | None:
+    """Moves to mate for a mate score: positive if the side to move mates."""
+    if score > MATE_BOUND:
+        return (MATE_SCORE - score + 1) // 2
+    if score < -MATE_BOUND:
+        return -((MATE_SCORE + score + 1) // 2)
+    return None
+
+
+class ChessSearch:
+    """Negamax alpha-beta searcher sharing one transposition table across calls.
+
+    Scores are centipawns from the side to move. Each depth iteration keeps
+    exact scores for the best ``top_n`` root moves and only bounds for the
+    rest, so ranking several moves costs little more than finding one. Leaves
+    run a capture-only quiescence search. Moves are tried table move first,
+    then captures by most valuable victim and least valuable attacker, then
+    killer moves. The first iteration ignores the budget, so a very tactical
+    position may overrun a tiny budget by a few hundred milliseconds. Roots
+    the endgame tables cover are ranked from the tables without a search.
+
+    Each call keeps its own killers, path and node count, so searches on
+    different worker threads run side by side. Only the table is shared;
+    its entries are replaced whole and checked by key, so a concurrent
+    write can cost a probe but never corrupt one.
+    """
+
+    def __init__(self, table: TranspositionTable | None = None) -> None:
+        self.table = table or TranspositionTable()
+
+    def search(
+        self,
+        fen: str,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        top_n: int = DEFAULT_TOP_MOVES,
+        max_depth: int = MAX_DEPTH,
+    ) -> SearchResult:
+        """Rank the legal moves; ``max_depth`` caps iterations for repeatable runs."""
+        started = time.perf_counter()
+        board = board_from_fen(fen)
+        moves = []
+        if board is not None:
+            # Reuse the move generation legal_chess_moves already did for this FEN.
+            moves = list(position_info(fen).moves)
+        if not moves:
+            return SearchResult(None, [], [], 0, 0, 0.0)
+        budget_ms = max(1.0, min(float(budget_ms), MAX_BUDGET_MS))
+        top_n = max(1, min(int(top_n), MAX_TOP_MOVES, len(moves)))
+        scores = _table_scores(board, moves)
+        if scores is not None:
+            moves.sort(key=lambda move: -scores[move])
+            return _result(board, moves, scores, top_n, 0, len(moves), started, True)
+        root = initial_position(board)
+        run = _SearchRun(self.table, root[0])
+
+        # Depth one always completes, so every move has a searched score.
+        moves = _ordered_moves(board, moves, None, ())
+        scores = run.search_root(board, root, moves, 1, top_n)
+        moves.sort(key=lambda move: -scores[move])
+        run.deadline = started + budget_ms / 1000
+        depth = 1
+        for target in range(2, min(max_depth, MAX_DEPTH) + 1):
+            if len(moves) == 1 or abs(scores[moves[0]]) > MATE_BOUND:
+                break
+            try:
+                scores = run.search_root(board, root, moves, target, top_n)
+            except _SearchTimeout:
+                break
+            depth = target
+            moves.sort(key=lambda move: -scores[move])
+        return _result(board, moves, scores, top_n, depth, run.nodes, started)
+
+
+class _SearchRun:
+    """Per-call search state: node count, deadline, killers and the game path."""
+
+    def __init__(self, table: TranspositionTable, root_key: int) -> None:
+        self.table = table
+        self.nodes = 0
+        self.deadline = float("inf")
+        self.killers: list[list[chess.Move | None]] = [
+            [None, None] for _ in range(MAX_PLY + 1)
+        ]
+        self.path = [root_key]
+
+    def search_root(
+        self,
+        board: chess.Board,
+        position: Position,
+        moves: list[chess.Move],
+        depth: int,
+        top_n: int,
+    ) -> dict[chess.Move, int]:
+        scores = {}
+        best: list[int] = []
+        for move in moves:
+            # Moves that cannot reach the current top_n only need an upper bound.
+            floor = best[top_n - 1] if len(best) >= top_n else -INFINITY
+            child = play(board, move, position)
+            self.path.append(child[0])
+            try:
+                score = -self._negamax(board, child, depth - 1, -INFINITY, -floor, 1)
+            finally:
+                self.path.pop()
+                board.pop()
+            scores[move] = score
+            best.append(score)
+            best.sort(reverse=True)
+        return scores
+
+    def _negamax(
+        self,
+        board: chess.Board,
+        position: Position,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ) -> int:
+        self.nodes += 1
+        if self.nodes % DEADLINE_CHECK_NODES == 0 and time.perf_counter() > self.deadline:
+            raise _SearchTimeout
+
+        key = position[0]
+        if board.halfmove_clock >= 100 or self.path.count(key) > 1:
+            return 0
+        known = table_score(board, ply)
+        if known is not None:
+            return known
+        in_check = board.is_check()
+        if in_check:
+            depth += 1
+        if depth <= 0 or ply >= MAX_PLY:
+            return self._quiescence(board, position, alpha, beta, ply)
+
+        original_alpha = alpha
+        table_move = None
+        entry = self.table.get(key)
+        if entry is not None:
+            _, entry_depth, flag, stored, table_move = entry
+            if entry_depth >= depth:
+                score = _score_from_table(stored, ply)
+                if flag == EXACT:
+                    return score
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                elif flag == UPPER_BOUND:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        moves = list(board.legal_moves)
+        if not moves:
+            return -(MATE_SCORE - ply) if in_check else 0
+
+        killers = self.killers[ply]
+        best = -INFINITY
+        best_move = None
+        for move in _ordered_moves(board, moves, table_move, killers):
+            quiet = not board.is_capture(move) and not move.promotion
+            child = play(board, move, position)
+            self.path.append(child[0])
+            try:
+                score = -self._negamax(board, child, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                self.path.pop()
+                board.pop()
+            if score > best:
+                best = score
+                best_move = move
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                if quiet and killers[0] != move:
+                    killers[1] = killers[0]
+                    killers[0] = move
+                break
+
+        if best <= original_alpha:
+            flag = UPPER_BOUND
+        elif best >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.put(key, depth, flag, _score_to_table(best, ply), best_move)
+        return best
+
+    def _quiescence(
+        self,
+        board: chess.Board,
+        position: Position,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ) -> int:
+        self.nodes += 1
+        if self.nodes % DEADLINE_CHECK_NODES == 0 and time.perf_counter() > self.deadline:
+            raise _SearchTimeout
+
+        known = table_score(board, ply)
+        if known is not None:
+            return known
+        if board.is_check():
+            # No standing pat in check: every evasion is searched.
+            moves = list(board.legal_moves)
+            if not moves:
+                return -(MATE_SCORE - ply)
+            best = -INFINITY
+        else:
+            best = evaluate(position, board.turn)
+            if best >= beta or ply >= MAX_PLY:
+                return best
+            alpha = max(alpha, best)
+            moves = [
+                move
+                for move in board.generate_legal_captures()
+                if _capture_may_raise(board, move, best, alpha)
+            ]
+
+        for move in _ordered_moves(board, moves, None, ()):
+            child = play(board, move, position)
+            try:
+                score = -self._quiescence(board, child, -beta, -alpha, ply + 1)
+            finally:
+                board.pop()
+            if score > best:
+                best = score
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+        return best
+
+
+def _table_scores(
+    board: chess.Board, moves: list[chess.Move]
+) -> dict[chess.Move, int] | None:
+    """Score every root move from the tables, or ``None`` if any is uncovered."""
+    if chess.popcount(board.occupied) > TABLE_PIECES:
+        return None
+    scores = {}
+    for move in moves:
+        board.push(move)
+        try:
+            known = table_score(board, 1)
+        finally:
+            board.pop()
+        if known is None:
+            return None
+        scores[move] = -known
+    return scores
+
+
+def _result(
+    board: chess.Board,
+    moves: list[chess.Move],
+    scores: dict[chess.Move, int],
+    top_n: int,
+    depth: int,
+    nodes: int,
+    started: float,
+    tablebase: bool = False,
+) -> SearchResult:
+    scored = [
+        ScoredMove(move.uci(), board.san(move), scores[move], mate_in(scores[move]))
+        for move in moves[:top_n]
+    ]
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return SearchResult(
+        scored[0].uci,
+        scored,
+        [move.uci() for move in moves],
+        depth,
+        nodes,
+        elapsed_ms,
+        tablebase,
+    )
+
+
+def _ordered_moves(
+    board: chess.Board,
+    moves: list[chess.Move],
+    table_move: chess.Move | None,
+    killers: tuple | list,
+) -> list[chess.Move]:
+    """Table move, then captures by MVV-LVA and promotions, then killers."""
+    scored = []
+    for rank, move in enumerate(moves):
+        if move == table_move:
+            priority = 1 << 20
+        else:
+            victim = board.piece_type_at(move.to_square)
+            if victim is None and board.is_en_passant(move):
+                victim = chess.PAWN
+            if victim is not None:
+                attacker = board.piece_type_at(move.from_square)
+                priority = 10_000 + 10 * PIECE_VALUES[victim] - attacker
+            elif move.promotion:
+                priority = 9_000 + move.promotion
+            elif move in killers:
+                priority = 8_000
+            else:
+                priority = 0
+        scored.append((-priority, rank, move))
+    scored.sort()
+    return [move for _, _, move in scored]
+
+
+def _capture_may_raise(
+    board: chess.Board, move: chess.Move, stand_pat: int, alpha: int
+) -> bool:
+    """Skip captures that cannot lift alpha or that lose material outright."""
+    if move.promotion:
+        return True
+    victim = board.piece_type_at(move.to_square) or chess.PAWN
+    gain = PIECE_VALUES[victim]
+    if stand_pat + gain + DELTA_MARGIN <= alpha:
+        return False
+    attacker = board.piece_type_at(move.from_square)
+    # A defended piece worth less than its attacker is a likely loss.
+    return PIECE_VALUES[attacker] <= gain or not board.is_attacked_by(
+        not board.turn, move.to_square
+    )
+
+
+def _score_to_table(score: int, ply: int) -> int:
+    # Store mate scores relative to this node so they stay valid at any ply.
+    if score > MATE_BOUND:
+        return score + ply
+    if score < -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def _score_from_table(score: int, ply: int) -> int:
+    if score > MATE_BOUND:
+        return score - ply
+    if score < -MATE_BOUND:
+        return score + ply
+    return score
+
+
+SEARCHER = ChessSearch()
+
+
+def search_chess(
+    fen: str,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    top_n: int = DEFAULT_TOP_MOVES,
+) -> SearchResult:
+    """Rank the legal moves for the side to move within ``budget_ms``."""
+    return SEARCHER.search(fen, budget_ms, top_n)
@@ -2,31 +2,177 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
 import re
+import threading
 
 import chess
 
 
 MAX_FEN_LENGTH = 200
 UCI_PATTERN = re.compile(r"^[a-h][1-8][a-h][1-8][qrbn]?$")
+# A turn loop parses the same few FENs repeatedly (legal, choose, apply).
+BOARD_CACHE_SIZE = 512
+POSITION_CACHE_SIZE = 1024
+SEVENTY_FIVE_MOVE_PLIES = 150
 
+T = TypeVar("T")
 
-def _status_from_board(board: chess.Board) -> tuple[str, bool]:
-    """Return (status, in_check) for the current board state."""
-    if board.is_checkmate():
-        return "checkmate", True
-    if board.is_stalemate():
-        return "stalemate", False
-    if board.is_check():
-        return "check", True
-    return "in_progress", False
+
+@dataclass(frozen=True)
+class PositionInfo:
+    """Move generation and status for one FEN, shared by every chess tool."""
+
+    moves: tuple[chess.Move, ...]
+    legal_moves: tuple[str, ...]
+    status: str
+    check: bool
+    turn: str
+    game_over: bool
+    valid: bool
+
+
+class _LruCache(Generic[T]):
+    """A small thread-safe LRU map that also counts hits and misses."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> T | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: T) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_BOARDS: _LruCache[chess.Board] = _LruCache(BOARD_CACHE_SIZE)
+_POSITIONS: _LruCache[PositionInfo] = _LruCache(POSITION_CACHE_SIZE)
+
+
+def _status(in_check: bool, has_moves: bool) -> str:
+    if not has_moves:
+        return "checkmate" if in_check else "stalemate"
+    return "check" if in_check else "in_progress"
 
 
 def _turn_from_board(board: chess.Board) -> str:
     return "w" if board.turn == chess.WHITE else "b"
 
 
+def _describe(board: chess.Board) -> PositionInfo:
+    # The only legal-move generation for this position; everything else
+    # (status, game over, SAN disambiguation) is derived from it.
+    moves = tuple(board.generate_legal_moves())
+    in_check = board.is_check()
+    game_over = (
+        not moves
+        or board.halfmove_clock >= SEVENTY_FIVE_MOVE_PLIES
+        or board.is_insufficient_material()
+    )
+    return PositionInfo(
+        moves=moves,
+        legal_moves=tuple(move.uci() for move in moves),
+        status=_status(in_check, bool(moves)),
+        check=in_check,
+        turn=_turn_from_board(board),
+        game_over=game_over,
+        valid=board.is_valid(),
+    )
+
+
+def _cache_position(fen: str, board: chess.Board) -> PositionInfo:
+    info = _describe(board)
+    _BOARDS.put(fen, board.copy(stack=False))
+    _POSITIONS.put(fen, info)
+    return info
+
+
+def board_from_fen(fen: str) -> chess.Board:
+    """A private copy of the parsed board for ``fen``; raises ``ValueError``."""
+    board = _BOARDS.get(fen)
+    if board is None:
+        board = chess.Board(fen)
+        _BOARDS.put(fen, board)
+    return board.copy(stack=False)
+
+
+def position_info(fen: str) -> PositionInfo:
+    """Legal moves and status for ``fen``, computed once per FEN."""
+    info = _POSITIONS.get(fen)
+    if info is None:
+        info = _describe(board_from_fen(fen))
+        _POSITIONS.put(fen, info)
+    return info
+
+
+def clear_position_cache() -> None:
+    _BOARDS.clear()
+    _POSITIONS.clear()
+
+
+def san_for_move(
+    board: chess.Board, move: chess.Move, legal: tuple[chess.Move, ...]
+) -> str:
+    """SAN without the check suffix, disambiguated against ``legal``.
+
+    Matches ``board.san`` but reuses a move list instead of generating one.
+    """
+    if board.is_castling(move):
+        if chess.square_file(move.to_square) > chess.square_file(move.from_square):
+            return "O-O"
+        return "O-O-O"
+    piece = board.piece_type_at(move.from_square)
+    capture = board.is_capture(move)
+    if piece == chess.PAWN:
+        san = chess.FILE_NAMES[chess.square_file(move.from_square)] if capture else ""
+    else:
+        san = chess.piece_symbol(piece).upper()
+        others = [
+            other.from_square
+            for other in legal
+            if other.to_square == move.to_square
+            and other.from_square != move.from_square
+            and board.piece_type_at(other.from_square) == piece
+        ]
+        if others:
+            file = chess.square_file(move.from_square)
+            rank = chess.square_rank(move.from_square)
+            same_file = any(chess.square_file(square) == file for square in others)
+            same_rank = any(chess.square_rank(square) == rank for square in others)
+            if same_rank or not same_file:
+                san += chess.FILE_NAMES[file]
+            if same_file:
+                san += chess.RANK_NAMES[rank]
+    if capture:
+        san += "x"
+    san += chess.SQUARE_NAMES[move.to_square]
+    if move.promotion:
+        san += "=" + chess.piece_symbol(move.promotion).upper()
+    return san
+
+
 def _validate_fen_string(fen: str) -> str | None:
     if not isinstance(fen, str) or not fen.strip():
         return "Invalid FEN: missing"
@@ -56,14 +202,16 @@ def apply_uci_move(fen: str, move_uci: str) -> dict[str, Any]:
     """Validate and apply a UCI move against a FEN string.
 
     Returns a dict containing move legality, resulting FEN, SAN, UCI, turn,
-    check information, status, and an optional error.
+    check information, status, the legal moves for the side now to move, and
+    an optional error. The resulting position is cached, so the next call on
+    it does not generate moves again.
     """
     fen_error = _validate_fen_string(fen)
     if fen_error:
         return _error_snapshot_from_fen(fen, _normalize_uci(move_uci), fen_error)
 
     try:
-        board = chess.Board(fen)
+        info = position_info(fen)
     except ValueError as exc:
         return _error_snapshot_from_fen(
             fen,
@@ -72,45 +220,39 @@ def apply_uci_move(fen: str, move_uci: str) -> dict[str, Any]:
         )
 
     move_error = _validate_uci_string(move_uci)
-    if move_error:
-        status, in_check = _status_from_board(board)
-        return {
-            "legal": False,
-            "fen": fen,
-            "san": None,
-            "uci": _normalize_uci(move_uci),
-            "turn": _turn_from_board(board),
-            "check": in_check,
-            "status": status,
-            "error": move_error,
-        }
-
-    move = chess.Move.from_uci(_normalize_uci(move_uci))
-
-    if not board.is_legal(move):
-        status, in_check = _status_from_board(board)
+    normalized = _normalize_uci(move_uci)
+    if move_error or normalized not in info.legal_moves:
         return {
             "legal": False,
             "fen": fen,
             "san": None,
-            "uci": move.uci(),
-            "turn": _turn_from_board(board),
-            "check": in_check,
-            "status": status,
-            "error": "Illegal move",
+            "uci": normalized,
+            "turn": info.turn,
+            "check": info.check,
+            "status": info.status,
+            "moves": list(info.legal_moves),
+            "error": move_error or "Illegal move",
         }
 
-    san = board.san(move)
+    board = board_from_fen(fen)
+    move = info.moves[info.legal_moves.index(normalized)]
+    san = san_for_move(board, move, info.moves)
     board.push(move)
-    status, in_check = _status_from_board(board)
+    next_fen = board.fen()
+    next_info = _cache_position(next_fen, board)
+    if next_info.status == "checkmate":
+        san += "#"
+    elif next_info.check:
+        san += "+"
     return {
         "legal": True,
-        "fen": board.fen(),
+        "fen": next_fen,
         "san": san,
         "uci": move.uci(),
-        "turn": _turn_from_board(board),
-        "check": in_check,
-        "status": status,
+        "turn": next_info.turn,
+        "check": next_info.check,
+        "status": next_info.status,
+        "moves": list(next_info.legal_moves),
         "error": None,
     }
 
@@ -121,12 +263,10 @@ def legal_moves_uci(fen: str) -> list[str]:
     if fen_error:
         return []
     try:
-        board = chess.Board(fen)
+        return list(position_info(fen).legal_moves)
     except ValueError:
         return []
 
-    return [move.uci() for move in board.legal_moves]
-
 
 def opponent_move_candidates(fen: str, limit: int = 200) -> list[str]:
     """Return a capped list of legal opponent moves in UCI notation."""
@@ -138,8 +278,8 @@ def opponent_move_candidates(fen: str, limit: int = 200) -> list[str]:
 
 def _error_snapshot_from_fen(fen: str, move_uci: str, error: str) -> dict[str, Any]:
     try:
-        board = chess.Board(fen)
-    except ValueError:
+        info = position_info(fen)
+    except (TypeError, ValueError):
         return {
             "legal": False,
             "fen": fen,
@@ -148,18 +288,19 @@ def _error_snapshot_from_fen(fen: str, move_uci: str, error: str) -> dict[str, A
             "turn": "w",
             "check": False,
             "status": "in_progress",
+            "moves": [],
             "error": error,
         }
 
-    status, in_check = _status_from_board(board)
     return {
         "legal": False,
         "fen": fen,
         "san": None,
         "uci": _normalize_uci(move_uci),
-        "turn": _turn_from_board(board),
-        "check": in_check,
-        "status": status,
+        "turn": info.turn,
+        "check": info.check,
+        "status": info.status,
+        "moves": list(info.legal_moves),
         "error": error,
     }
 
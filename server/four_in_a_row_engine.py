@@ -0,0 +1,379 @@
+"""Bitboard Four-in-a-Row search: negamax alpha-beta with iterative deepening."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+
+try:
+    from .four_in_a_row_rules import (
+        COLS,
+        EMPTY,
+        OPPONENT,
+        PLAYER,
+        ROWS,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        parse_state,
+    )
+except ImportError:  # pragma: no cover - fallback for script execution
+    from four_in_a_row_rules import (
+        COLS,
+        EMPTY,
+        OPPONENT,
+        PLAYER,
+        ROWS,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        parse_state,
+    )
+
+
+# Each column uses ROWS bits plus a sentinel bit; bit = col * 7 + height, where
+# height 0 is the bottom cell (grid row 5).
+COLUMN_BITS = ROWS + 1
+CELLS = ROWS * COLS
+BOTTOM_MASK = sum(1 << (col * COLUMN_BITS) for col in range(COLS))
+BOARD_MASK = BOTTOM_MASK * ((1 << ROWS) - 1)
+COLUMN_MASKS = tuple(((1 << ROWS) - 1) << (col * COLUMN_BITS) for col in range(COLS))
+TOP_MASKS = tuple(1 << (ROWS - 1 + col * COLUMN_BITS) for col in range(COLS))
+BOTTOM_MASKS = tuple(1 << (col * COLUMN_BITS) for col in range(COLS))
+CENTER_FIRST_ORDER = (3, 2, 4, 1, 5, 0, 6)
+
+WIN_SCORE = 10_000
+INFINITY = 1_000_000
+DEFAULT_BUDGET_MS = 200
+MAX_BUDGET_MS = 5_000
+TRANSPOSITION_TABLE_SIZE = 1 << 18
+DEADLINE_CHECK_NODES = 256
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+OUTCOME_WIN = "win"
+OUTCOME_LOSS = "loss"
+OUTCOME_DRAW = "draw"
+OUTCOME_UNRESOLVED = "unresolved"
+
+
+@dataclass(frozen=True)
+class ScoredColumn:
+    column: int
+    score: int
+    outcome: str
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    best_column: int | None
+    columns: list[ScoredColumn]
+    depth: int
+    nodes: int
+    elapsed_ms: float
+
+
+class TranspositionTable:
+    """Fixed-size, always-replace table keyed by ``position + mask``."""
+
+    def __init__(self, size: int = TRANSPOSITION_TABLE_SIZE) -> None:
+        if size < 1 or size & (size - 1):
+            raise ValueError("Transposition table size must be a power of two.")
+        self._index_mask = size - 1
+        self._entries: list[tuple[int, int, int, int, int] | None] = [None] * size
+
+    def get(self, key: int) -> tuple[int, int, int, int, int] | None:
+        entry = self._entries[(key * 0x9E3779B1) >> 7 & self._index_mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def put(self, key: int, depth: int, flag: int, score: int, column: int) -> None:
+        index = (key * 0x9E3779B1) >> 7 & self._index_mask
+        self._entries[index] = (key, depth, flag, score, column)
+
+    def clear(self) -> None:
+        self._entries = [None] * len(self._entries)
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+def winning_cells(position: int, mask: int) -> int:
+    """Empty cells that would complete four for the stones in ``position``."""
+    # Vertical: three stacked stones directly below.
+    result = (position << 1) & (position << 2) & (position << 3)
+    for shift in (COLUMN_BITS, COLUMN_BITS - 1, COLUMN_BITS + 1):
+        pair = (position << shift) & (position << 2 * shift)
+        result |= pair & (position << 3 * shift)
+        result |= pair & (position >> shift)
+        pair = (position >> shift) & (position >> 2 * shift)
+        result |= pair & (position << shift)
+        result |= pair & (position >> 3 * shift)
+    return result & (BOARD_MASK ^ mask)
+
+
+def has_four(position: int) -> bool:
+    for shift in (1, COLUMN_BITS, COLUMN_BITS - 1, COLUMN_BITS + 1):
+        pairs = position & (position >> shift)
+        if pairs & (pairs >> 2 * shift):
+            return True
+    return False
+
+
+def playable_cells(mask: int) -> int:
+    return (mask + BOTTOM_MASK) & BOARD_MASK
+
+
+def _popcount(value: int) -> int:
+    return bin(value).count("1")
+
+
+def position_from_state(state: str) -> tuple[int, int, int] | None:
+    """Return ``(position, mask, moves)`` for the side to move, or ``None``."""
+    try:
+        parsed = parse_state(state)
+    except ValueError:
+        return None
+    if parsed["status"] != STATUS_IN_PROGRESS:
+        return None
+    mover = PLAYER if parsed["turn"] == TURN_PLAYER else OPPONENT
+    position = mask = moves = 0
+    for row, cells in enumerate(parsed["grid"]):
+        height = ROWS - 1 - row
+        for col, cell in enumerate(cells):
+            if cell == EMPTY:
+                continue
+            bit = 1 << (col * COLUMN_BITS + height)
+            mask |= bit
+            moves += 1
+            if cell == mover:
+                position |= bit
+    # Floating stones would break the column arithmetic.
+    for col in range(COLS):
+        stack = (mask & COLUMN_MASKS[col]) >> (col * COLUMN_BITS)
+        if stack & (stack + 1):
+            return None
+    if has_four(position) or has_four(position ^ mask):
+        return None
+    return position, mask, moves
+
+
+class FourInARowSearch:
+    """Negamax alpha-beta searcher sharing one transposition table across calls.
+
+    Scores are from the side to move: ``WIN_SCORE`` minus the stones already
+    played for a forced win (faster wins score higher), the negation for a
+    forced loss, and a threat-count heuristic at the depth horizon.
+
+    Each call keeps its own deadline and node count, so searches on different
+    worker threads run side by side. Only the table is shared; its entries are
+    replaced whole and checked by key, so a concurrent write can cost a probe
+    but never corrupt one.
+    """
+
+    def __init__(self, table: TranspositionTable | None = None) -> None:
+        self.table = table or TranspositionTable()
+
+    def search(self, state: str, budget_ms: float = DEFAULT_BUDGET_MS) -> SearchResult:
+        started = time.perf_counter()
+        parsed = position_from_state(state)
+        if parsed is None:
+            return SearchResult(None, [], 0, 0, 0.0)
+        position, mask, moves = parsed
+        budget_ms = max(1.0, min(float(budget_ms), MAX_BUDGET_MS))
+
+        run = _SearchRun(self.table, started + budget_ms / 1000)
+        columns = [col for col in CENTER_FIRST_ORDER if not mask & TOP_MASKS[col]]
+        scores: dict[int, int] = {}
+        depth = 0
+        remaining = CELLS - moves
+        for target in range(1, remaining + 1):
+            try:
+                scores = run.search_root(position, mask, moves, columns, target)
+            except _SearchTimeout:
+                break
+            depth = target
+            columns.sort(key=lambda col: -scores[col])
+            if _is_decided(scores[columns[0]]):
+                break
+        if not scores:
+            # Not even depth one finished; fall back to immediate tactics.
+            scores = {col: 0 for col in columns}
+            scores.update(_immediate_scores(position, mask, moves, columns))
+            columns.sort(key=lambda col: -scores[col])
+
+        ranked = [
+            ScoredColumn(col + 1, scores[col], _outcome(scores[col], depth, remaining))
+            for col in columns
+        ]
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        return SearchResult(ranked[0].column, ranked, depth, run.nodes, elapsed_ms)
+
+
+class _SearchRun:
+    """Per-call search state: the shared table, node count and deadline."""
+
+    def __init__(self, table: TranspositionTable, deadline: float) -> None:
+        self.table = table
+        self.nodes = 0
+        self.deadline = deadline
+
+    def search_root(
+        self,
+        position: int,
+        mask: int,
+        moves: int,
+        columns: list[int],
+        depth: int,
+    ) -> dict[int, int]:
+        scores = {}
+        own_wins = winning_cells(position, mask)
+        for col in columns:
+            move = (mask + BOTTOM_MASKS[col]) & COLUMN_MASKS[col]
+            if own_wins & move:
+                scores[col] = WIN_SCORE - moves
+                continue
+            child_mask = mask | move
+            scores[col] = -self._negamax(
+                position ^ mask, child_mask, moves + 1, depth - 1, -INFINITY, INFINITY
+            )
+        return scores
+
+    def _negamax(
+        self,
+        position: int,
+        mask: int,
+        moves: int,
+        depth: int,
+        alpha: int,
+        beta: int,
+    ) -> int:
+        self.nodes += 1
+        if self.nodes % DEADLINE_CHECK_NODES == 0 and time.perf_counter() > self.deadline:
+            raise _SearchTimeout
+
+        possible = playable_cells(mask)
+        if winning_cells(position, mask) & possible:
+            return WIN_SCORE - moves
+        if moves >= CELLS - 1:
+            return 0
+
+        opponent_wins = winning_cells(position ^ mask, mask)
+        forced = possible & opponent_wins
+        if forced:
+            if forced & (forced - 1):
+                return -(WIN_SCORE - moves - 1)
+            possible = forced
+        # Never play directly beneath a cell the opponent needs.
+        possible &= ~(opponent_wins >> 1)
+        if not possible:
+            return -(WIN_SCORE - moves - 1)
+        if depth <= 0:
+            return _evaluate(position, mask)
+
+        original_alpha = alpha
+        key = position + mask
+        best_column = -1
+        entry = self.table.get(key)
+        if entry is not None:
+            _, entry_depth, flag, score, best_column = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return score
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                elif flag == UPPER_BOUND:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        order = _ordered_moves(position, mask, possible, best_column)
+        best = -INFINITY
+        best_column = order[0][1]
+        for move, col in order:
+            score = -self._negamax(
+                position ^ mask, mask | move, moves + 1, depth - 1, -beta, -alpha
+            )
+            if score > best:
+                best = score
+                best_column = col
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+
+        if best <= original_alpha:
+            flag = UPPER_BOUND
+        elif best >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.put(key, depth, flag, best, best_column)
+        return best
+
+
+def _evaluate(position: int, mask: int) -> int:
+    opponent = position ^ mask
+    own_threats = _popcount(winning_cells(position, mask))
+    opponent_threats = _popcount(winning_cells(opponent, mask))
+    center = COLUMN_MASKS[3]
+    return 4 * (own_threats - opponent_threats) + (
+        _popcount(position & center) - _popcount(opponent & center)
+    )
+
+
+def _immediate_scores(
+    position: int, mask: int, moves: int, columns: list[int]
+) -> dict[int, int]:
+    scores = {}
+    opponent_wins = winning_cells(position ^ mask, mask)
+    own_wins = winning_cells(position, mask)
+    for col in columns:
+        move = (mask + BOTTOM_MASKS[col]) & COLUMN_MASKS[col]
+        if own_wins & move:
+            scores[col] = WIN_SCORE - moves
+        elif opponent_wins & (move << 1):
+            scores[col] = -(WIN_SCORE - moves - 2)
+    return scores
+
+
+def _ordered_moves(
+    position: int, mask: int, possible: int, first_column: int
+) -> list[tuple[int, int]]:
+    """Order moves: table move first, then by threats created, centre first."""
+    scored = []
+    for rank, col in enumerate(CENTER_FIRST_ORDER):
+        move = possible & COLUMN_MASKS[col]
+        if not move:
+            continue
+        if col == first_column:
+            priority = 1 << 10
+        else:
+            priority = _popcount(winning_cells(position | move, mask | move))
+        scored.append((-priority, rank, move, col))
+    scored.sort()
+    return [(move, col) for _, _, move, col in scored]
+
+
+def _is_decided(score: int) -> bool:
+    return abs(score) > WIN_SCORE - CELLS - 1
+
+
+def _outcome(score: int, depth: int, remaining: int) -> str:
+    if score > WIN_SCORE - CELLS - 1:
+        return OUTCOME_WIN
+    if score < -(WIN_SCORE - CELLS - 1):
+        return OUTCOME_LOSS
+    if depth >= remaining:
+        return OUTCOME_DRAW
+    return OUTCOME_UNRESOLVED
+
+
+SEARCHER = FourInARowSearch()
+
+
+def search_four_in_a_row(state: str, budget_ms: float = DEFAULT_BUDGET_MS) -> SearchResult:
+    """Score every legal column for the side to move within ``budget_ms``."""
+    return SEARCHER.search(state, budget_ms)
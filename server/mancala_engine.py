@@ -0,0 +1,312 @@
+"""Mancala (Kalah) search: alpha-beta with a transposition table and endgame memo."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+
+try:
+    from .mancala_rules import (
+        OTHER_STORE,
+        OWN_STORE,
+        PITS_PER_SIDE,
+        RING_SLOTS,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        parse_state,
+        sow,
+        to_board,
+    )
+except ImportError:  # pragma: no cover - fallback for script execution
+    from mancala_rules import (
+        OTHER_STORE,
+        OWN_STORE,
+        PITS_PER_SIDE,
+        RING_SLOTS,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        parse_state,
+        sow,
+        to_board,
+    )
+
+
+DEFAULT_BUDGET_MS = 200
+MAX_BUDGET_MS = 5_000
+MAX_DEPTH = 64
+INFINITY = 1_000_000
+DEADLINE_CHECK_NODES = 256
+# Positions with at most this many seeds left in pits are solved exactly.
+ENDGAME_SEEDS = 8
+TRANSPOSITION_TABLE_LIMIT = 200_000
+ENDGAME_MEMO_LIMIT = 500_000
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+Board = tuple[int, ...]
+OTHER_PITS = slice(OWN_STORE + 1, OTHER_STORE)
+
+
+@dataclass(frozen=True)
+class RankedPit:
+    pit: int
+    score: int
+    exact: bool
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    best_pit: int | None
+    pits: list[RankedPit]
+    depth: int
+    nodes: int
+    elapsed_ms: float
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+def board_from_state(state: str) -> Board | None:
+    """Return the mover-relative 14-slot board, or ``None`` when nothing can be played."""
+    try:
+        parsed = parse_state(state)
+    except ValueError:
+        return None
+    if parsed["status"] != STATUS_IN_PROGRESS:
+        return None
+    if parsed["turn"] == TURN_PLAYER:
+        board = to_board(
+            parsed["player_pits"],
+            parsed["opponent_pits"],
+            parsed["player_store"],
+            parsed["opponent_store"],
+        )
+    else:
+        board = to_board(
+            parsed["opponent_pits"],
+            parsed["player_pits"],
+            parsed["opponent_store"],
+            parsed["player_store"],
+        )
+    if not any(board[:PITS_PER_SIDE]):
+        return None
+    return tuple(board)
+
+
+def play(board: Board, pit_index: int) -> tuple[Board, bool]:
+    """Play a pit; return the resulting board for the next mover and whether it is the same side.
+
+    When the move ends the game the remaining seeds are swept into their
+    owners' stores and the board is returned from the same perspective.
+    """
+    slots = list(board)
+    last_slot, _ = sow(slots, pit_index)
+    own_seeds = sum(slots[:PITS_PER_SIDE])
+    other_seeds = sum(slots[OTHER_PITS])
+    if not own_seeds or not other_seeds:
+        return (
+            (0,) * PITS_PER_SIDE
+            + (slots[OWN_STORE] + own_seeds,)
+            + (0,) * PITS_PER_SIDE
+            + (slots[OTHER_STORE] + other_seeds,)
+        ), True
+    if last_slot == OWN_STORE:
+        return tuple(slots), True
+    return flip(slots), False
+
+
+def flip(board: Board | list[int]) -> Board:
+    """View the board from the other side (see ``mancala_rules.to_board``)."""
+    return (
+        tuple(board[OTHER_STORE - 1 : OWN_STORE : -1])
+        + (board[OTHER_STORE],)
+        + tuple(board[PITS_PER_SIDE - 1 :: -1])
+        + (board[OWN_STORE],)
+    )
+
+
+def is_terminal(board: Board) -> bool:
+    return not any(board[:PITS_PER_SIDE]) and not any(board[OTHER_PITS])
+
+
+def store_margin(board: Board) -> int:
+    return board[OWN_STORE] - board[OTHER_STORE]
+
+
+def seeds_in_pits(board: Board) -> int:
+    return sum(board[:PITS_PER_SIDE]) + sum(board[OTHER_PITS])
+
+
+class MancalaSearch:
+    """Negamax alpha-beta over mover-relative boards.
+
+    Scores are final store margins from the side to move (own store minus
+    other store). Extra turns keep the sign instead of negating. Positions
+    with few seeds left are solved exactly and memoised by their pits, since
+    the stores do not affect how the rest of the game plays out.
+
+    Each call keeps its own deadline and node count, so searches on different
+    worker threads run side by side. The table and endgame memo are shared
+    dicts; a single get or set is atomic, and every entry is complete on its
+    own, so concurrent searches can only overwrite each other's results.
+    """
+
+    def __init__(self) -> None:
+        self._table: dict[Board, tuple[int, int, int, int]] = {}
+        self._endgame: dict[Board, int] = {}
+
+    def search(self, state: str, budget_ms: float = DEFAULT_BUDGET_MS) -> SearchResult:
+        started = time.perf_counter()
+        board = board_from_state(state)
+        if board is None:
+            return SearchResult(None, [], 0, 0, 0.0)
+        budget_ms = max(1.0, min(float(budget_ms), MAX_BUDGET_MS))
+
+        if len(self._table) > TRANSPOSITION_TABLE_LIMIT:
+            self._table.clear()
+        if len(self._endgame) > ENDGAME_MEMO_LIMIT:
+            self._endgame.clear()
+        run = _SearchRun(self._table, self._endgame, started + budget_ms / 1000)
+
+        pits = [index for index in range(PITS_PER_SIDE) if board[index]]
+        scores = {index: store_margin(board) for index in pits}
+        exact = seeds_in_pits(board) <= ENDGAME_SEEDS
+        depth = 0
+        for target in range(1, MAX_DEPTH + 1):
+            try:
+                scores = run.search_root(board, pits, target)
+            except _SearchTimeout:
+                break
+            depth = target
+            pits.sort(key=lambda index: -scores[index])
+            if exact:
+                break
+
+        ranked = [RankedPit(index + 1, scores[index], exact) for index in pits]
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        return SearchResult(ranked[0].pit, ranked, depth, run.nodes, elapsed_ms)
+
+
+class _SearchRun:
+    """Per-call search state: the shared table and memo, node count and deadline."""
+
+    def __init__(
+        self,
+        table: dict[Board, tuple[int, int, int, int]],
+        endgame: dict[Board, int],
+        deadline: float,
+    ) -> None:
+        self.table = table
+        self.endgame = endgame
+        self.nodes = 0
+        self.deadline = deadline
+
+    def search_root(self, board: Board, pits: list[int], depth: int) -> dict[int, int]:
+        scores = {}
+        for index in pits:
+            child, same_side = play(board, index)
+            value = self._negamax(child, depth - 1, -INFINITY, INFINITY)
+            scores[index] = value if same_side else -value
+        return scores
+
+    def _negamax(self, board: Board, depth: int, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        if self.nodes % DEADLINE_CHECK_NODES == 0 and time.perf_counter() > self.deadline:
+            raise _SearchTimeout
+        if is_terminal(board):
+            return store_margin(board)
+        if seeds_in_pits(board) <= ENDGAME_SEEDS:
+            return store_margin(board) + self._endgame_value(board)
+        if depth <= 0:
+            return store_margin(board)
+
+        original_alpha = alpha
+        first = -1
+        entry = self.table.get(board)
+        if entry is not None:
+            entry_depth, flag, score, first = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return score
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                elif flag == UPPER_BOUND:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        best = -INFINITY
+        best_index = -1
+        for index in _move_order(board, first):
+            child, same_side = play(board, index)
+            if same_side:
+                score = self._negamax(child, depth - 1, alpha, beta)
+            else:
+                score = -self._negamax(child, depth - 1, -beta, -alpha)
+            if score > best:
+                best = score
+                best_index = index
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+
+        if best <= original_alpha:
+            flag = UPPER_BOUND
+        elif best >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table[board] = (depth, flag, best, best_index)
+        return best
+
+    def _endgame_value(self, board: Board) -> int:
+        """Exact store gain still to come for the mover, memoised by pit contents."""
+        key = board[:PITS_PER_SIDE] + board[OTHER_PITS]
+        cached = self.endgame.get(key)
+        if cached is not None:
+            return cached
+        base = store_margin(board)
+        best = -INFINITY
+        for index in range(PITS_PER_SIDE):
+            if not board[index]:
+                continue
+            child, same_side = play(board, index)
+            if is_terminal(child):
+                value = store_margin(child)
+            else:
+                value = store_margin(child) + self._endgame_value(child)
+            if not same_side:
+                value = -value
+            best = max(best, value - base)
+        self.endgame[key] = best
+        return best
+
+
+def _move_order(board: Board, first: int) -> list[int]:
+    """Table move first, then extra-turn moves, then rightmost pits."""
+    ordered = []
+    for index in range(PITS_PER_SIDE - 1, -1, -1):
+        seeds = board[index]
+        if not seeds:
+            continue
+        if index == first:
+            priority = 2
+        elif (index + seeds) % RING_SLOTS == OWN_STORE:
+            priority = 1
+        else:
+            priority = 0
+        ordered.append((-priority, -index, index))
+    ordered.sort()
+    return [index for _, _, index in ordered]
+
+
+SEARCHER = MancalaSearch()
+
+
+def search_mancala(state: str, budget_ms: float = DEFAULT_BUDGET_MS) -> SearchResult:
+    """Rank every legal pit for the side to move within ``budget_ms``."""
+    return SEARCHER.search(state, budget_ms)
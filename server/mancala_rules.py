@@ -6,6 +6,12 @@ from dataclasses import dataclass
 PITS_PER_SIDE = 6
 STARTING_SEEDS_PER_PIT = 4
 
+# Mover-relative board slots; see ``to_board``.
+OWN_STORE = PITS_PER_SIDE
+OTHER_STORE = 2 * PITS_PER_SIDE + 1
+RING_SLOTS = 2 * PITS_PER_SIDE + 1
+OPPOSITE_SLOTS = tuple(OWN_STORE + 1 + index for index in range(PITS_PER_SIDE))
+
 TURN_PLAYER = "player"
 TURN_OPPONENT = "opponent"
 
@@ -55,64 +61,39 @@ def apply_mancala_move(state: str, pit: int) -> MancalaMoveResult:
     if pit < 1 or pit > PITS_PER_SIDE:
         return MancalaMoveResult(False, state, error="Invalid pit.")
 
-    player_pits = list(parsed["player_pits"])
-    opponent_pits = list(parsed["opponent_pits"])
-    player_store = int(parsed["player_store"])
-    opponent_store = int(parsed["opponent_store"])
+    if turn == TURN_PLAYER:
+        board = to_board(
+            parsed["player_pits"],
+            parsed["opponent_pits"],
+            parsed["player_store"],
+            parsed["opponent_store"],
+        )
+    else:
+        board = to_board(
+            parsed["opponent_pits"],
+            parsed["player_pits"],
+            parsed["opponent_store"],
+            parsed["player_store"],
+        )
 
-    active_pits = player_pits if turn == TURN_PLAYER else opponent_pits
     pit_index = pit - 1
-    seeds = active_pits[pit_index]
-    if seeds <= 0:
+    if board[pit_index] <= 0:
         return MancalaMoveResult(False, state, error="Chosen pit is empty.")
 
-    active_pits[pit_index] = 0
-
-    ring_positions = _build_sowing_ring(turn)
-    cursor = ring_positions.index(("pit", pit_index))
+    last_slot, captured = sow(board, pit_index)
+    own_pits, other_pits, own_store, other_store = from_board(board)
+    if turn == TURN_PLAYER:
+        player_pits, opponent_pits = own_pits, other_pits
+        player_store, opponent_store = own_store, other_store
+    else:
+        player_pits, opponent_pits = other_pits, own_pits
+        player_store, opponent_store = other_store, own_store
 
-    while seeds > 0:
-        cursor = (cursor + 1) % len(ring_positions)
-        kind, idx = ring_positions[cursor]
-        if kind == "store":
-            if turn == TURN_PLAYER:
-                player_store += 1
-            else:
-                opponent_store += 1
-        else:
-            if turn == TURN_PLAYER:
-                if idx < PITS_PER_SIDE:
-                    player_pits[idx] += 1
-                else:
-                    opponent_pits[idx - PITS_PER_SIDE] += 1
-            else:
-                if idx < PITS_PER_SIDE:
-                    opponent_pits[idx] += 1
-                else:
-                    player_pits[idx - PITS_PER_SIDE] += 1
-        seeds -= 1
-
-    last_kind, last_idx = ring_positions[cursor]
     action_parts = [f"pit{pit}"]
+    if captured:
+        action_parts.append(f"capture{captured}")
 
-    if last_kind == "pit":
-        own_side_landing = last_idx < PITS_PER_SIDE
-        if own_side_landing:
-            own_pits = player_pits if turn == TURN_PLAYER else opponent_pits
-            opp_pits = opponent_pits if turn == TURN_PLAYER else player_pits
-            own_index = last_idx
-            opposite_index = PITS_PER_SIDE - 1 - own_index
-            if own_pits[own_index] == 1 and opp_pits[opposite_index] > 0:
-                captured = opp_pits[opposite_index] + 1
-                own_pits[own_index] = 0
-                opp_pits[opposite_index] = 0
-                if turn == TURN_PLAYER:
-                    player_store += captured
-                else:
-                    opponent_store += captured
-                action_parts.append(f"capture{captured}")
-
-    extra_turn = last_kind == "store"
+    extra_turn = last_slot == OWN_STORE
     if extra_turn:
         action_parts.append("extra_turn")
 
@@ -298,15 +279,53 @@ def _other_turn(turn: str) -> str:
     return TURN_OPPONENT if turn == TURN_PLAYER else TURN_PLAYER
 
 
-def _build_sowing_ring(turn: str) -> list[tuple[str, int]]:
-    # Ring for current side perspective: own pits (0..5), own store, opponent pits (5..0)
-    positions: list[tuple[str, int]] = []
-    for idx in range(PITS_PER_SIDE):
-        positions.append(("pit", idx))
-    positions.append(("store", -1))
-    for idx in range(PITS_PER_SIDE - 1, -1, -1):
-        positions.append(("pit", PITS_PER_SIDE + idx))
-    if turn == TURN_PLAYER:
-        return positions
-    # Same relative ring works for opponent because pit arrays are swapped by turn handling.
-    return positions
+def to_board(
+    own_pits: list[int],
+    other_pits: list[int],
+    own_store: int,
+    other_store: int,
+) -> list[int]:
+    """Lay out a position as 14 slots relative to the side to move.
+
+    Slots 0-5 are the mover's pits, 6 the mover's store, 7-12 the other
+    side's pits in sowing order (their pit 6 down to pit 1) and 13 their
+    store. Sowing walks slots 0-12 and skips the other store.
+    """
+    return [*own_pits, own_store, *reversed(other_pits), other_store]
+
+
+def from_board(board: list[int]) -> tuple[list[int], list[int], int, int]:
+    """Inverse of :func:`to_board`: ``(own_pits, other_pits, own_store, other_store)``."""
+    return (
+        board[:PITS_PER_SIDE],
+        board[OTHER_STORE - 1 : OWN_STORE : -1],
+        board[OWN_STORE],
+        board[OTHER_STORE],
+    )
+
+
+def sow(board: list[int], pit_index: int) -> tuple[int, int]:
+    """Sow ``board[pit_index]`` in place; return ``(last_slot, captured)``.
+
+    Whole laps of the 13-slot ring are added in one pass, so the cost does
+    not grow with the number of seeds.
+    """
+    seeds = board[pit_index]
+    board[pit_index] = 0
+    laps, remainder = divmod(seeds, RING_SLOTS)
+    if laps:
+        for slot in range(RING_SLOTS):
+            board[slot] += laps
+    for offset in range(1, remainder + 1):
+        board[(pit_index + offset) % RING_SLOTS] += 1
+    last_slot = (pit_index + seeds) % RING_SLOTS
+
+    captured = 0
+    if last_slot < PITS_PER_SIDE and board[last_slot] == 1:
+        opposite = OPPOSITE_SLOTS[last_slot]
+        if board[opposite] > 0:
+            captured = board[opposite] + 1
+            board[OWN_STORE] += captured
+            board[last_slot] = 0
+            board[opposite] = 0
+    return last_slot, captured
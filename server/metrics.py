@@ -0,0 +1,323 @@
+"""In-process metrics for tools and widget reads in Prometheus text format."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import itertools
+import json
+import threading
+import time
+from typing import Any, Iterable
+
+from fastmcp.exceptions import NotFoundError
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+# Tool names embed their game; longer names first so "slot" cannot shadow others.
+GAME_TYPES = (
+    "four_in_a_row",
+    "tic_tac_toe",
+    "sea_battle",
+    "blackjack",
+    "checkers",
+    "rpg_dice",
+    "mancala",
+    "chess",
+    "slot",
+)
+UNKNOWN_GAME = "unknown"
+UNKNOWN_TOOL = "unknown"
+UNKNOWN_RESOURCE = "unknown"
+# Payload sizes cost a json.dumps each, so only every Nth call is measured.
+SIZE_SAMPLE_EVERY = 16
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with a running sum and count."""
+
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[int]:
+        running = 0
+        result = []
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+
+class MetricsRegistry:
+    """Counters and histograms keyed by metric name and label set.
+
+    Values live in this process only; with several HTTP workers each one
+    reports its own series.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._help: dict[str, tuple[str, str]] = {}
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._histograms: dict[str, dict[Labels, Histogram]] = {}
+        self._buckets: dict[str, tuple[float, ...]] = {}
+
+    def counter(self, name: str, help_text: str) -> None:
+        self._help[name] = ("counter", help_text)
+        self._counters.setdefault(name, {})
+
+    def histogram(self, name: str, help_text: str, buckets: tuple[float, ...]) -> None:
+        self._help[name] = ("histogram", help_text)
+        self._histograms.setdefault(name, {})
+        self._buckets[name] = buckets
+
+    def inc(self, name: str, labels: dict[str, str], amount: float = 1.0) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters[name]
+            series[key] = series.get(key, 0.0) + amount
+
+    def observe(self, name: str, labels: dict[str, str], value: float) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms[name]
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self._buckets[name])
+            histogram.observe(value)
+
+    def value(self, name: str, labels: dict[str, str]) -> float:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            if name in self._counters:
+                return self._counters[name].get(key, 0.0)
+            histogram = self._histograms[name].get(key)
+            return float(histogram.count) if histogram else 0.0
+
+    def render(self) -> str:
+        """The registry in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for name, (kind, help_text) in sorted(self._help.items()):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind == "counter":
+                    for key, value in sorted(self._counters[name].items()):
+                        lines.append(f"{name}{_labels(key)} {_number(value)}")
+                    continue
+                for key, histogram in sorted(self._histograms[name].items()):
+                    for bound, count in zip(histogram.buckets, histogram.cumulative()):
+                        bucket_key = key + (("le", _number(bound)),)
+                        lines.append(f"{name}_bucket{_labels(bucket_key)} {count}")
+                    inf_key = key + (("le", "+Inf"),)
+                    lines.append(f"{name}_bucket{_labels(inf_key)} {histogram.count}")
+                    lines.append(f"{name}_sum{_labels(key)} {_number(histogram.total)}")
+                    lines.append(f"{name}_count{_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(key: Iterable[tuple[str, str]]) -> str:
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in key)
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _payload_size(payload: Any) -> int:
+    if payload is None:
+        return 0
+    try:
+        return len(json.dumps(payload, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def game_type_of(tool: str, payload: dict[str, Any] | None = None) -> str:
+    if payload and isinstance(payload.get("gameType"), str):
+        return payload["gameType"]
+    for game_type in GAME_TYPES:
+        if game_type in tool:
+            return game_type
+    return UNKNOWN_GAME
+
+
+def create_registry() -> MetricsRegistry:
+    """A registry with the tool and resource metrics this server reports."""
+    registry = MetricsRegistry()
+    registry.counter("mcp_tool_calls_total", "Tool calls.")
+    registry.counter(
+        "mcp_tool_errors_total", "Tool calls that raised or returned an error."
+    )
+    registry.counter(
+        "mcp_tool_illegal_total", "Tool calls that returned legal: false."
+    )
+    registry.histogram(
+        "mcp_tool_duration_seconds", "Tool call latency.", LATENCY_BUCKETS
+    )
+    registry.histogram(
+        "mcp_tool_phase_duration_seconds",
+        "Time a tool spends in one phase, such as offloaded compute.",
+        LATENCY_BUCKETS,
+    )
+    registry.histogram(
+        "mcp_tool_request_bytes",
+        "JSON size of tool arguments, sampled.",
+        SIZE_BUCKETS,
+    )
+    registry.histogram(
+        "mcp_tool_response_bytes",
+        "JSON size of tool structured content, sampled.",
+        SIZE_BUCKETS,
+    )
+    registry.counter("mcp_resource_reads_total", "Widget resource reads.")
+    registry.counter("mcp_resource_errors_total", "Widget resource reads that failed.")
+    registry.histogram(
+        "mcp_resource_duration_seconds", "Widget resource read latency.", LATENCY_BUCKETS
+    )
+    registry.histogram(
+        "mcp_resource_response_bytes",
+        "Size of widget resource content.",
+        SIZE_BUCKETS,
+    )
+    return registry
+
+
+REGISTRY = create_registry()
+
+
+def record_tool_call(
+    tool: str,
+    arguments: dict[str, Any] | None,
+    payload: dict[str, Any] | None,
+    seconds: float,
+    *,
+    raised: bool = False,
+    measure_sizes: bool = True,
+    registry: MetricsRegistry = REGISTRY,
+) -> None:
+    labels = {"tool": tool, "game_type": game_type_of(tool, payload)}
+    registry.inc("mcp_tool_calls_total", labels)
+    registry.observe("mcp_tool_duration_seconds", labels, seconds)
+    if measure_sizes:
+        registry.observe("mcp_tool_request_bytes", labels, _payload_size(arguments))
+        registry.observe("mcp_tool_response_bytes", labels, _payload_size(payload))
+    if raised or (payload and payload.get("error")):
+        registry.inc("mcp_tool_errors_total", labels)
+    if payload and payload.get("legal") is False:
+        registry.inc("mcp_tool_illegal_total", labels)
+
+
+def record_phase(
+    tool: str, phase: str, seconds: float, registry: MetricsRegistry = REGISTRY
+) -> None:
+    labels = {"tool": tool, "game_type": game_type_of(tool), "phase": phase}
+    registry.observe("mcp_tool_phase_duration_seconds", labels, seconds)
+
+
+def record_resource_read(
+    uri: str,
+    size: int,
+    seconds: float,
+    *,
+    raised: bool = False,
+    registry: MetricsRegistry = REGISTRY,
+) -> None:
+    labels = {"uri": uri}
+    registry.inc("mcp_resource_reads_total", labels)
+    registry.observe("mcp_resource_duration_seconds", labels, seconds)
+    if raised:
+        registry.inc("mcp_resource_errors_total", labels)
+    else:
+        registry.observe("mcp_resource_response_bytes", labels, size)
+
+
+class ToolMetricsMiddleware(Middleware):
+    """Times every tool call and records its outcome from the structured content.
+
+    Request and response sizes are measured on one call in ``size_sample_every``
+    so the JSON encoding stays off most calls.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry = REGISTRY,
+        size_sample_every: int = SIZE_SAMPLE_EVERY,
+    ) -> None:
+        if size_sample_every < 1:
+            raise ValueError("size_sample_every must be at least 1")
+        self.registry = registry
+        self.size_sample_every = size_sample_every
+        self._calls = itertools.count()
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext,
+        call_next: Any,
+    ) -> ToolResult:
+        tool = context.message.name
+        arguments = context.message.arguments
+        measure_sizes = next(self._calls) % self.size_sample_every == 0
+        started = time.perf_counter()
+        try:
+            result = await call_next(context)
+        except Exception as exc:
+            # Unknown names share one series so callers cannot add labels at will.
+            if isinstance(exc, NotFoundError):
+                tool = UNKNOWN_TOOL
+            record_tool_call(
+                tool,
+                arguments,
+                None,
+                time.perf_counter() - started,
+                raised=True,
+                measure_sizes=measure_sizes,
+                registry=self.registry,
+            )
+            raise
+        payload = getattr(result, "structured_content", None)
+        record_tool_call(
+            tool,
+            arguments,
+            payload if isinstance(payload, dict) else None,
+            time.perf_counter() - started,
+            measure_sizes=measure_sizes,
+            registry=self.registry,
+        )
+        return result
@@ -0,0 +1,196 @@
+"""Deterministic per-game random streams from a server secret and the gameId.
+
+Every stream is a counter-based generator: draw ``n`` is a keyed BLAKE2b
+hash of ``n // WORDS_PER_BLOCK``, so any draw can be recomputed directly
+without replaying the ones before it. Rules functions take these streams
+wherever they accept a ``random.Random``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+import os
+import random
+import struct
+import threading
+
+
+SECRET_ENV_VAR = "GAME_RNG_SECRET"
+DEFAULT_PURPOSE = "game"
+DEFAULT_MAX_STREAMS = 10_000
+WORDS_PER_BLOCK = 8
+KEY_BYTES = 32
+_BLOCK_FORMAT = struct.Struct(f"<{WORDS_PER_BLOCK}Q")
+_WORD_BITS = 64
+# 53 random mantissa bits per float, as random.Random.random() produces.
+_FLOAT_SHIFT = _WORD_BITS - 53
+_FLOAT_SCALE = 2.0**-53
+
+
+class CounterRandom(random.Random):
+    """A ``random.Random`` whose stream is ``BLAKE2b(key, block counter)``.
+
+    ``position`` counts 64-bit words drawn so far. ``random()`` uses one
+    word and ``getrandbits(k)`` uses ``ceil(k / 64)``, so every method of
+    ``random.Random`` (``choices``, ``shuffle``, ``randrange`` ...) is
+    reproducible from the key and a starting position. ``seek`` and
+    ``jumpahead`` move the stream in O(1).
+    """
+
+    def __init__(self, key: bytes, position: int = 0) -> None:
+        if not key or len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+            raise ValueError("Stream keys must be 1 to 64 bytes.")
+        self._key = bytes(key)
+        self._position = 0
+        self._block_index = -1
+        self._block: tuple[int, ...] = ()
+        super().__init__()
+        self.seek(position)
+
+    @property
+    def key(self) -> bytes:
+        return self._key
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    def seed(self, a: object = None, version: int = 2) -> None:
+        """Streams are fixed by their key; reseeding rewinds to the start."""
+        self._position = 0
+
+    def seek(self, position: int) -> None:
+        if position < 0:
+            raise ValueError("Stream position must be non-negative.")
+        self._position = position
+
+    def jumpahead(self, count: int) -> None:
+        self.seek(self._position + count)
+
+    def fork(self) -> "CounterRandom":
+        """An independent stream keyed by this stream's next four words.
+
+        Forks are picklable and cheap, so work shipped to another thread or
+        process can draw freely while this stream advances by a fixed amount.
+        """
+        key = self.getrandbits(KEY_BYTES * 8).to_bytes(KEY_BYTES, "little")
+        return CounterRandom(key)
+
+    def word_at(self, position: int) -> int:
+        """The 64-bit word at ``position``, without moving the stream."""
+        block_index, offset = divmod(position, WORDS_PER_BLOCK)
+        if block_index != self._block_index:
+            digest = hashlib.blake2b(
+                block_index.to_bytes(16, "little"), key=self._key
+            ).digest()
+            self._block = _BLOCK_FORMAT.unpack(digest)
+            self._block_index = block_index
+        return self._block[offset]
+
+    def random(self) -> float:
+        word = self.word_at(self._position)
+        self._position += 1
+        return (word >> _FLOAT_SHIFT) * _FLOAT_SCALE
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        words = -(-k // _WORD_BITS)
+        value = 0
+        for index in range(words):
+            value |= self.word_at(self._position + index) << (_WORD_BITS * index)
+        self._position += words
+        return value >> (words * _WORD_BITS - k)
+
+    def getstate(self) -> tuple[bytes, int]:
+        return self._key, self._position
+
+    def setstate(self, state: tuple[bytes, int]) -> None:
+        key, position = state
+        if key != self._key:
+            self._key = bytes(key)
+            self._block_index = -1
+        self.seek(position)
+
+    def __reduce__(self) -> tuple:
+        return type(self), (self._key, self._position)
+
+
+class RngService:
+    """Hands out counter-based streams keyed by ``(gameId, purpose)``.
+
+    ``game_stream`` returns the live stream for a game, so consecutive tool
+    calls continue where the previous one stopped; the most recently used
+    ``max_streams`` streams are kept. ``stream`` rebuilds a stream at any
+    position, which is what replays and audits use. ``shared`` serves calls
+    without a gameId from a per-thread stream keyed by a process nonce.
+    """
+
+    def __init__(self, secret: bytes, max_streams: int = DEFAULT_MAX_STREAMS) -> None:
+        if not secret:
+            raise ValueError("The RNG secret must not be empty.")
+        self._secret = hashlib.blake2b(secret, digest_size=KEY_BYTES).digest()
+        self._max_streams = max(1, max_streams)
+        self._streams: OrderedDict[tuple[str, str], CounterRandom] = OrderedDict()
+        self._lock = threading.Lock()
+        self._nonce = os.urandom(16).hex()
+        self._local = threading.local()
+
+    def key_for(self, game_id: str, purpose: str = DEFAULT_PURPOSE) -> bytes:
+        message = f"{game_id}\x1f{purpose}".encode()
+        return hashlib.blake2b(
+            message, key=self._secret, digest_size=KEY_BYTES
+        ).digest()
+
+    def stream(
+        self,
+        game_id: str,
+        purpose: str = DEFAULT_PURPOSE,
+        position: int = 0,
+    ) -> CounterRandom:
+        """A fresh stream for the game, starting at ``position``."""
+        return CounterRandom(self.key_for(game_id, purpose), position)
+
+    def game_stream(self, game_id: str, purpose: str = DEFAULT_PURPOSE) -> CounterRandom:
+        with self._lock:
+            key = (game_id, purpose)
+            rng = self._streams.get(key)
+            if rng is None:
+                rng = self.stream(game_id, purpose)
+                self._streams[key] = rng
+                while len(self._streams) > self._max_streams:
+                    self._streams.popitem(last=False)
+            else:
+                self._streams.move_to_end(key)
+            return rng
+
+    def shared(self) -> CounterRandom:
+        rng = getattr(self._local, "rng", None)
+        if rng is None:
+            thread_key = f"{self._nonce}:{threading.get_ident()}"
+            rng = self._local.rng = self.stream(thread_key, "shared")
+        return rng
+
+
+@lru_cache(maxsize=1)
+def rng_service() -> RngService:
+    """The process-wide service keyed by ``GAME_RNG_SECRET``.
+
+    Without the variable a random secret is drawn once per process, so
+    streams are reproducible only within that process.
+    """
+    secret = os.environ.get(SECRET_ENV_VAR, "").encode()
+    return RngService(secret or os.urandom(KEY_BYTES))
+
+
+def game_rng(game_id: str | None, purpose: str = DEFAULT_PURPOSE) -> CounterRandom:
+    """The live stream for ``game_id``, or the shared stream without one."""
+    if not game_id:
+        return rng_service().shared()
+    return rng_service().game_stream(game_id, purpose)
+
+
+def shared_rng() -> CounterRandom:
+    return rng_service().shared()
@@ -0,0 +1,287 @@
+"""Exact probability distributions of dice-expression totals."""
+
+from __future__ import annotations
+
+import cmath
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from math import comb, sqrt
+
+try:
+    from .rpg_dice_rules import (
+        EXPRESSION_CACHE_SIZE,
+        KEEP_LOWEST,
+        DiceExpression,
+        DiceGroup,
+        parse_expression,
+    )
+except ImportError:  # pragma: no cover - fallback for script execution
+    from rpg_dice_rules import (
+        EXPRESSION_CACHE_SIZE,
+        KEEP_LOWEST,
+        DiceExpression,
+        DiceGroup,
+        parse_expression,
+    )
+
+
+# Convolutions up to this many multiply-adds run directly; larger ones go
+# through one spectral product.
+DIRECT_WORK_LIMIT = 200_000
+# Keep-highest/lowest counting is exact but grows with the kept dice; beyond
+# this much work the distribution is reported as unavailable.
+KEEP_WORK_LIMIT = 2_000_000
+# Spectral results carry rounding noise around 1e-16; smaller values are zero.
+NOISE_FLOOR = 1e-15
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """Probabilities of each total from ``minimum`` upwards."""
+
+    minimum: int
+    probabilities: tuple[float, ...]
+
+    @property
+    def maximum(self) -> int:
+        return self.minimum + len(self.probabilities) - 1
+
+    @property
+    def mean(self) -> float:
+        return sum(
+            (self.minimum + offset) * p for offset, p in enumerate(self.probabilities)
+        )
+
+    @property
+    def std_dev(self) -> float:
+        mean = self.mean
+        variance = sum(
+            (self.minimum + offset - mean) ** 2 * p
+            for offset, p in enumerate(self.probabilities)
+        )
+        return sqrt(variance)
+
+    def probability(self, total: int) -> float:
+        offset = total - self.minimum
+        if 0 <= offset < len(self.probabilities):
+            return self.probabilities[offset]
+        return 0.0
+
+    def at_least(self, total: int) -> float:
+        offset = max(total - self.minimum, 0)
+        return min(sum(self.probabilities[offset:]), 1.0)
+
+    def at_most(self, total: int) -> float:
+        offset = total - self.minimum + 1
+        if offset <= 0:
+            return 0.0
+        return min(sum(self.probabilities[:offset]), 1.0)
+
+
+@dataclass(frozen=True)
+class _Part:
+    """One group's totals: ``pmf`` from ``offset``, or a plain-dice closed form."""
+
+    offset: int
+    width: int
+    pmf: tuple[float, ...] | None = None
+    dice: tuple[int, int] | None = None
+
+
+def _plain_counts(count: int, sides: int) -> list[float]:
+    """Sum of ``count`` dice shifted to start at zero, by sliding-window sums."""
+    pmf = [1.0]
+    for _ in range(count):
+        prefix = [0.0, *accumulate(pmf)]
+        size = len(pmf) + sides - 1
+        pmf = [
+            (prefix[min(total + 1, len(pmf))] - prefix[max(total - sides + 1, 0)])
+            / sides
+            for total in range(size)
+        ]
+    return pmf
+
+
+def _keep_highest_counts(count: int, sides: int, keep: int) -> list[int] | None:
+    """Ways to roll each kept sum when keeping the ``keep`` highest of ``count``.
+
+    Faces are assigned from highest to lowest. While fewer than ``keep`` dice
+    sit on the faces seen so far, every one of them is kept; once a face
+    fills the kept set, the remaining dice only need to show lower faces.
+    Returns counts indexed by kept sum, or ``None`` when the work is too large.
+    """
+    if sides * keep * keep * keep * sides > KEEP_WORK_LIMIT:
+        return None
+    ways = [0] * (keep * sides + 1)
+    # active[n][total]: ways with n dice (all kept) placed on faces above.
+    active = [[0] * (keep * sides + 1) for _ in range(keep)]
+    active[0][0] = 1
+    for face in range(sides, 0, -1):
+        below = face - 1
+        following = [[0] * (keep * sides + 1) for _ in range(keep)]
+        for placed in range(keep):
+            row = active[placed]
+            left = count - placed
+            needed = keep - placed
+            # Filling the kept set here: the first ``needed`` dice are kept and
+            # any extra ones on this face or lower faces are not.
+            finish = sum(
+                comb(left, extra) * below ** (left - extra)
+                for extra in range(needed, left + 1)
+            )
+            for total, number in enumerate(row):
+                if not number:
+                    continue
+                ways[total + face * needed] += number * finish
+                for extra in range(needed):
+                    following[placed + extra][total + face * extra] += number * comb(
+                        left, extra
+                    )
+        active = following
+    return ways
+
+
+def _group_part(group: DiceGroup) -> _Part | None:
+    if group.keep is None:
+        width = group.count * (group.sides - 1) + 1
+        low, high = group.count, group.count * group.sides
+        offset = low if group.sign > 0 else -high
+        if group.count * width <= DIRECT_WORK_LIMIT:
+            # Symmetric, so the negated group has the same shape.
+            pmf = tuple(_plain_counts(group.count, group.sides))
+            return _Part(offset, width, pmf=pmf)
+        return _Part(offset, width, dice=(group.count, group.sides))
+
+    counts = _keep_highest_counts(group.count, group.sides, group.keep_count)
+    if counts is None:
+        return None
+    if group.keep == KEEP_LOWEST:
+        # Lowest of the dice is the mirrored highest of the flipped dice.
+        counts.reverse()
+        shift = group.keep_count * (group.sides + 1) - len(counts) + 1
+    else:
+        shift = 0
+    low = next(total for total, number in enumerate(counts) if number)
+    high = max(total for total, number in enumerate(counts) if number)
+    outcomes = group.sides**group.count
+    pmf = [number / outcomes for number in counts[low : high + 1]]
+    low += shift
+    high += shift
+    if group.sign < 0:
+        pmf.reverse()
+        return _Part(-high, len(pmf), pmf=tuple(pmf))
+    return _Part(low, len(pmf), pmf=tuple(pmf))
+
+
+def _convolve(left: list[float], right: tuple[float, ...]) -> list[float]:
+    result = [0.0] * (len(left) + len(right) - 1)
+    for index, weight in enumerate(left):
+        if weight:
+            for other, value in enumerate(right, index):
+                result[other] += weight * value
+    return result
+
+
+def _fft(values: list[complex], inverse: bool = False) -> list[complex]:
+    """Iterative radix-2 FFT; ``len(values)`` must be a power of two."""
+    size = len(values)
+    data = list(values)
+    swap = 0
+    for index in range(1, size):
+        bit = size >> 1
+        while swap & bit:
+            swap ^= bit
+            bit >>= 1
+        swap |= bit
+        if index < swap:
+            data[index], data[swap] = data[swap], data[index]
+    sign = 1 if inverse else -1
+    span = 2
+    while span <= size:
+        half = span // 2
+        step = cmath.exp(sign * 2j * cmath.pi / span)
+        twiddles = [1 + 0j] * half
+        for index in range(1, half):
+            twiddles[index] = twiddles[index - 1] * step
+        for start in range(0, size, span):
+            for index in range(half):
+                low = start + index
+                high = low + half
+                odd = data[high] * twiddles[index]
+                data[high] = data[low] - odd
+                data[low] += odd
+        span *= 2
+    if inverse:
+        return [value / size for value in data]
+    return data
+
+
+def _dice_spectrum(count: int, sides: int, size: int) -> list[complex]:
+    """DFT of the zero-shifted sum of ``count`` dice, from its closed form.
+
+    One die on faces ``0..sides-1`` transforms to ``(1 - z**sides) /
+    (sides * (1 - z))``; the sum of independent dice is its ``count``-th power.
+    """
+    spectrum = [1 + 0j] * size
+    for index in range(1, size):
+        z = cmath.exp(-2j * cmath.pi * index / size)
+        spectrum[index] = ((1 - z**sides) / (sides * (1 - z))) ** count
+    return spectrum
+
+
+def _combine(parts: list[_Part]) -> list[float]:
+    width = sum(part.width - 1 for part in parts) + 1
+    if all(part.pmf is not None for part in parts):
+        work = 0
+        running = 1
+        for part in parts:
+            running += part.width - 1
+            work += running * part.width
+        if work <= DIRECT_WORK_LIMIT:
+            pmf = [1.0]
+            for part in parts:
+                pmf = _convolve(pmf, part.pmf)
+            return pmf
+
+    size = 1
+    while size < width:
+        size *= 2
+    spectrum = [1 + 0j] * size
+    for part in parts:
+        if part.dice is not None:
+            factor = _dice_spectrum(*part.dice, size)
+        else:
+            factor = _fft(list(part.pmf) + [0.0] * (size - part.width))
+        spectrum = [value * other for value, other in zip(spectrum, factor)]
+    values = [value.real for value in _fft(spectrum, inverse=True)[:width]]
+    pmf = [value if value > NOISE_FLOOR else 0.0 for value in values]
+    total = sum(pmf)
+    return [value / total for value in pmf]
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _distribution_of(expression: DiceExpression) -> Distribution | None:
+    parts = []
+    for group in expression.groups:
+        part = _group_part(group)
+        if part is None:
+            return None
+        parts.append(part)
+    pmf = _combine(parts)
+    minimum = sum(part.offset for part in parts) + expression.modifier
+    return Distribution(minimum, tuple(pmf))
+
+
+def expression_distribution(expression: str | DiceExpression) -> Distribution | None:
+    """Exact distribution of an expression's total, cached per expression.
+
+    Plain dice groups and the combination of groups are convolved directly
+    when small; large ones are combined with a single FFT, using the closed
+    form of each plain group's transform so ``1000d6`` costs one transform
+    rather than a thousand convolutions. Keep-highest/lowest groups are
+    counted exactly. Returns ``None`` when a keep group is too large to count.
+    """
+    if isinstance(expression, str):
+        expression = parse_expression(expression)
+    return _distribution_of(expression)
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import random
+import re
+
+try:
+    from .rng_service import shared_rng
+except ImportError:  # pragma: no cover - fallback for script execution
+    from rng_service import shared_rng
 
 
 ALLOWED_SIDES = {4, 6, 8, 10, 12, 20, 100}
-MAX_ROLLS = 100
+MAX_ROLLS = 1000
+MAX_GROUPS = 20
+MAX_MODIFIER = 10_000
+MAX_EXPRESSION_LENGTH = 200
+EXPRESSION_CACHE_SIZE = 256
+
+KEEP_HIGHEST = "kh"
+KEEP_LOWEST = "kl"
+
+# One signed term: NdS with an optional keep suffix, or a constant.
+_TERM_PATTERN = re.compile(r"([+-])?(?:(\d*)d(\d+)(?:(kh|kl)(\d*))?|(\d+))")
 
 
 @dataclass(frozen=True)
@@ -15,6 +32,61 @@ class DiceRoll:
     rolls: list[int]
 
 
+@dataclass(frozen=True)
+class DiceGroup:
+    count: int
+    sides: int
+    keep: str | None = None
+    keep_count: int = 0
+    sign: int = 1
+
+    @property
+    def notation(self) -> str:
+        keep = f"{self.keep}{self.keep_count}" if self.keep else ""
+        return f"{self.count}d{self.sides}{keep}"
+
+
+@dataclass(frozen=True)
+class DiceExpression:
+    groups: tuple[DiceGroup, ...]
+    modifier: int = 0
+
+    @property
+    def dice(self) -> int:
+        return sum(group.count for group in self.groups)
+
+    def __str__(self) -> str:
+        text = ""
+        for group in self.groups:
+            if group.sign < 0:
+                text += "-"
+            elif text:
+                text += "+"
+            text += group.notation
+        if self.modifier:
+            text += f"{self.modifier:+d}" if text else str(self.modifier)
+        return text or "0"
+
+
+@dataclass(frozen=True)
+class GroupRoll:
+    group: DiceGroup
+    rolls: list[int]
+    kept: list[int]
+    subtotal: int
+
+
+@dataclass(frozen=True)
+class ExpressionRoll:
+    expression: DiceExpression
+    groups: list[GroupRoll]
+    total: int
+
+    @property
+    def rolls(self) -> list[int]:
+        return [value for group in self.groups for value in group.rolls]
+
+
 def roll_dice(
     *,
     sides: int,
@@ -25,6 +97,97 @@ def roll_dice(
         raise ValueError("Unsupported dice sides.")
     if count < 1 or count > MAX_ROLLS:
         raise ValueError("Invalid dice count.")
-    rng = rng or random.Random()
-    rolls = [rng.randint(1, sides) for _ in range(count)]
-    return DiceRoll(sides=sides, count=count, rolls=rolls)
+    rng = rng or shared_rng()
+    return DiceRoll(sides=sides, count=count, rolls=_roll_many(rng, sides, count))
+
+
+def dice_expression(*, sides: int, count: int = 1) -> DiceExpression:
+    """The expression for ``count`` plain dice, validated like ``roll_dice``."""
+    if sides not in ALLOWED_SIDES:
+        raise ValueError("Unsupported dice sides.")
+    if count < 1 or count > MAX_ROLLS:
+        raise ValueError("Invalid dice count.")
+    return DiceExpression((DiceGroup(count, sides),))
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def parse_expression(text: str) -> DiceExpression:
+    """Parse dice notation such as ``4d6kh3+2``, ``2d20kl1`` or ``8d6+1d4``.
+
+    Terms are ``NdS`` (``N`` defaults to 1) with an optional ``khK``/``klK``
+    suffix keeping the highest or lowest ``K`` dice (``K`` defaults to 1),
+    or integer constants; terms are joined by ``+`` or ``-``.
+    """
+    if not isinstance(text, str):
+        raise ValueError("Invalid dice expression.")
+    compact = "".join(text.split()).lower()
+    if not compact or len(compact) > MAX_EXPRESSION_LENGTH:
+        raise ValueError("Invalid dice expression.")
+
+    groups: list[DiceGroup] = []
+    modifier = 0
+    position = 0
+    while position < len(compact):
+        match = _TERM_PATTERN.match(compact, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid dice expression near '{compact[position:]}'.")
+        sign_raw, count_raw, sides_raw, keep, keep_raw, constant_raw = match.groups()
+        if sign_raw is None and position > 0:
+            raise ValueError("Dice terms must be joined with '+' or '-'.")
+        sign = -1 if sign_raw == "-" else 1
+        position = match.end()
+        if constant_raw is not None:
+            modifier += sign * int(constant_raw)
+            continue
+        count = int(count_raw) if count_raw else 1
+        sides = int(sides_raw)
+        if sides not in ALLOWED_SIDES:
+            raise ValueError("Unsupported dice sides.")
+        if count < 1:
+            raise ValueError("Invalid dice count.")
+        keep_count = 0
+        if keep:
+            keep_count = int(keep_raw) if keep_raw else 1
+            if not 1 <= keep_count <= count:
+                raise ValueError("Keep count must be between 1 and the dice count.")
+            if keep_count == count:
+                keep, keep_count = None, 0
+        groups.append(DiceGroup(count, sides, keep, keep_count, sign))
+
+    expression = DiceExpression(tuple(groups), modifier)
+    if not groups:
+        raise ValueError("Dice expression needs at least one die.")
+    if len(groups) > MAX_GROUPS:
+        raise ValueError(f"Dice expressions are limited to {MAX_GROUPS} dice terms.")
+    if expression.dice > MAX_ROLLS:
+        raise ValueError(f"Dice expressions are limited to {MAX_ROLLS} dice.")
+    if abs(modifier) > MAX_MODIFIER:
+        raise ValueError("Dice modifier is too large.")
+    return expression
+
+
+def roll_expression(
+    expression: str | DiceExpression,
+    rng: random.Random | None = None,
+) -> ExpressionRoll:
+    if isinstance(expression, str):
+        expression = parse_expression(expression)
+    rng = rng or shared_rng()
+    groups = []
+    total = expression.modifier
+    for group in expression.groups:
+        rolls = _roll_many(rng, group.sides, group.count)
+        if group.keep is None:
+            kept = rolls
+        else:
+            ordered = sorted(rolls, reverse=group.keep == KEEP_HIGHEST)
+            kept = ordered[: group.keep_count]
+        subtotal = group.sign * sum(kept)
+        total += subtotal
+        groups.append(GroupRoll(group, rolls, list(kept), subtotal))
+    return ExpressionRoll(expression, groups, total)
+
+
+def _roll_many(rng: random.Random, sides: int, count: int) -> list[int]:
+    # One bulk draw instead of a randint call per die.
+    return rng.choices(range(1, sides + 1), k=count)
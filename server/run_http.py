@@ -1,21 +1,97 @@
-"""Run the MCP server over Streamable HTTP."""
+"""Run the MCP server over Streamable HTTP, with one or more uvicorn workers.
+
+With ``HTTP_WORKERS`` (or ``WEB_CONCURRENCY``) above 1, uvicorn's process
+supervisor runs that many shared-nothing workers on one socket. Workers
+then serve stateless HTTP, so any worker can answer any request without
+sticky routing on ``mcp-session-id``, and game sessions default to the
+shared SQLite backend with write-through saves. Several workers also need
+``GAME_RNG_SECRET``, so every worker derives the same random stream for a
+game. ``SIGHUP`` restarts the workers one at a time. ``SIGTERM`` lets
+in-flight requests finish within ``GRACEFUL_SHUTDOWN_SECONDS``.
+"""
 
 from __future__ import annotations
+
+import logging
 import os
-from app import app
+from pathlib import Path
+
+import uvicorn
+from starlette.applications import Starlette
+
+TRUE_VALUES = {"1", "true", "yes"}
+SHARED_SESSION_BACKEND = "sqlite"
+RNG_SECRET_ENV_VAR = "GAME_RNG_SECRET"
+
+logger = logging.getLogger(__name__)
+
+
+def _flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in TRUE_VALUES
+
+
+def worker_count() -> int:
+    raw = os.getenv("HTTP_WORKERS") or os.getenv("WEB_CONCURRENCY") or "1"
+    return max(1, int(raw))
+
+
+def check_worker_environment(workers: int) -> None:
+    """Refuse settings that would make workers disagree about a game."""
+    if workers > 1 and not os.getenv(RNG_SECRET_ENV_VAR, "").strip():
+        raise ValueError(
+            f"{RNG_SECRET_ENV_VAR} must be set when running {workers} workers; "
+            "without it each worker draws different random streams for a game."
+        )
+
+
+def create_app() -> Starlette:
+    """ASGI app factory; each uvicorn worker calls it once after forking."""
+    from app import app
+
+    path = os.getenv("MCP_PATH", "/mcp")
+    stateless = _flag("MCP_STATELESS_HTTP", worker_count() > 1)
+    return app.http_app(path=path, stateless_http=stateless)
+
 
 def main() -> None:
     host = os.getenv("HOST", "0.0.0.0")  # IMPORTANT on Render
     port = int(os.getenv("PORT", "10000"))  # Render sets PORT
-    path = os.getenv("MCP_PATH", "/mcp")
+    workers = worker_count()
+    try:
+        check_worker_environment(workers)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from None
 
-    app.run(
-        transport="streamable-http",
+    if workers > 1:
+        # Workers inherit the environment, so these reach every one of them.
+        os.environ.setdefault("GAME_SESSION_BACKEND", SHARED_SESSION_BACKEND)
+        # Write through, so the next call for a game may land on any worker.
+        os.environ.setdefault("GAME_SESSION_BATCH_SIZE", "1")
+        os.environ.setdefault("MCP_STATELESS_HTTP", "true")
+        backend = os.environ["GAME_SESSION_BACKEND"]
+        if backend != SHARED_SESSION_BACKEND:
+            logger.warning(
+                "GAME_SESSION_BACKEND=%s is per worker; a gameId only resolves on "
+                "the worker that created it.",
+                backend,
+            )
+
+    uvicorn.run(
+        "run_http:create_app",
+        factory=True,
+        app_dir=str(Path(__file__).resolve().parent),
         host=host,
         port=port,
-        path=path,
-        show_banner=False,
+        workers=workers,
+        timeout_graceful_shutdown=float(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "30")),
+        proxy_headers=True,
+        forwarded_allow_ips=os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1"),
+        log_level=os.getenv("LOG_LEVEL", "info").lower(),
     )
 
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,251 @@
+"""Sea Battle targeting from ship-placement densities over precomputed bitmasks."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from itertools import combinations
+import random
+
+try:
+    from .sea_battle_rules import (
+        BOARD_SIZE,
+        EMPTY,
+        FILES,
+        FLEET_SIZES,
+        HIT,
+        MISS,
+        SHIP,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        parse_state,
+    )
+    from .rng_service import shared_rng
+except ImportError:  # pragma: no cover - fallback for script execution
+    from sea_battle_rules import (
+        BOARD_SIZE,
+        EMPTY,
+        FILES,
+        FLEET_SIZES,
+        HIT,
+        MISS,
+        SHIP,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        parse_state,
+    )
+    from rng_service import shared_rng
+
+
+MODE_HUNT = "hunt"
+MODE_TARGET = "target"
+
+CELLS = BOARD_SIZE * BOARD_SIZE
+# Cell index is row * BOARD_SIZE + col, matching the state's row-major boards.
+COORDS = tuple(
+    f"{FILES[index % BOARD_SIZE]}{index // BOARD_SIZE + 1}" for index in range(CELLS)
+)
+NEIGHBORS = tuple(
+    tuple(
+        row * BOARD_SIZE + col
+        for row, col in (
+            (index // BOARD_SIZE - 1, index % BOARD_SIZE),
+            (index // BOARD_SIZE + 1, index % BOARD_SIZE),
+            (index // BOARD_SIZE, index % BOARD_SIZE - 1),
+            (index // BOARD_SIZE, index % BOARD_SIZE + 1),
+        )
+        if 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE
+    )
+    for index in range(CELLS)
+)
+
+
+def _build_placements(size: int) -> list[int]:
+    """Every horizontal and vertical placement of a ship as a 100-bit cell mask."""
+    run = (1 << size) - 1
+    vertical_run = sum(1 << (offset * BOARD_SIZE) for offset in range(size))
+    placements = []
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE - size + 1):
+            placements.append(run << (row * BOARD_SIZE + col))
+    for row in range(BOARD_SIZE - size + 1):
+        for col in range(BOARD_SIZE):
+            placements.append(vertical_run << (row * BOARD_SIZE + col))
+    return placements
+
+
+def _build_cell_index(placements: list[int]) -> tuple[int, ...]:
+    """Per cell, the set of placement indices covering it, as a bitset."""
+    covering = [0] * CELLS
+    for number, mask in enumerate(placements):
+        bits = mask
+        while bits:
+            low = bits & -bits
+            covering[low.bit_length() - 1] |= 1 << number
+            bits ^= low
+    return tuple(covering)
+
+
+PLACEMENTS = {size: _build_placements(size) for size in sorted(set(FLEET_SIZES))}
+ALL_PLACEMENTS = {size: (1 << len(masks)) - 1 for size, masks in PLACEMENTS.items()}
+PLACEMENTS_BY_CELL = {
+    size: _build_cell_index(masks) for size, masks in PLACEMENTS.items()
+}
+
+
+@dataclass(frozen=True)
+class TargetCell:
+    coord: str
+    weight: float
+
+
+@dataclass(frozen=True)
+class TargetingResult:
+    mode: str
+    cells: list[TargetCell]
+    remaining_fleet: list[int]
+
+
+def _mask(board: list[list[str]], symbols: set[str]) -> int:
+    mask = 0
+    for row, cells in enumerate(board):
+        for col, cell in enumerate(cells):
+            if cell in symbols:
+                mask |= 1 << (row * BOARD_SIZE + col)
+    return mask
+
+
+def _sunk_components(target_board: list[list[str]]) -> list[int]:
+    """Masks of ship groups whose every cell has been hit.
+
+    Touching ships form one group; a group counts as sunk only once none of
+    its cells are still intact, which is what ``sunk(n)`` announcements reveal.
+    """
+    ships = _mask(target_board, {HIT, SHIP})
+    intact = _mask(target_board, {SHIP})
+    seen = 0
+    components = []
+    for start in range(CELLS):
+        bit = 1 << start
+        if not ships & bit or seen & bit:
+            continue
+        component = 0
+        stack = [start]
+        while stack:
+            index = stack.pop()
+            index_bit = 1 << index
+            if component & index_bit:
+                continue
+            component |= index_bit
+            stack.extend(n for n in NEIGHBORS[index] if ships & (1 << n))
+        seen |= component
+        if not component & intact:
+            components.append(component)
+    return components
+
+
+def _remove_sunk(fleet: list[int], sunk_sizes: list[int]) -> list[int]:
+    remaining = list(fleet)
+    for total in sorted(sunk_sizes, reverse=True):
+        if total in remaining:
+            remaining.remove(total)
+            continue
+        for count in range(2, len(remaining) + 1):
+            group = next(
+                (combo for combo in combinations(remaining, count) if sum(combo) == total),
+                None,
+            )
+            if group is not None:
+                for size in group:
+                    remaining.remove(size)
+                break
+    return remaining
+
+
+def placement_densities(
+    blocked: int,
+    hits: int,
+    fleet: list[int],
+) -> tuple[list[int], list[int]]:
+    """Count consistent placements covering each cell.
+
+    Returns ``(hunt, target)`` per-cell counts. ``hunt`` counts placements
+    avoiding ``blocked`` cells; ``target`` counts only those placements that
+    also cover unsunk ``hits``, once per hit covered, so lines through
+    several hits dominate.
+    """
+    hunt = [0] * CELLS
+    target = [0] * CELLS
+    hit_cells = [index for index in range(CELLS) if hits >> index & 1]
+    for size, multiplicity in Counter(fleet).items():
+        by_cell = PLACEMENTS_BY_CELL[size]
+        valid = ALL_PLACEMENTS[size]
+        bits = blocked
+        while bits:
+            low = bits & -bits
+            valid &= ~by_cell[low.bit_length() - 1]
+            bits ^= low
+        hit_sets = [valid & by_cell[index] for index in hit_cells]
+        for index in range(CELLS):
+            covering = valid & by_cell[index]
+            if not covering:
+                continue
+            hunt[index] += multiplicity * covering.bit_count()
+            for hit_set in hit_sets:
+                target[index] += multiplicity * (covering & hit_set).bit_count()
+    return hunt, target
+
+
+def target_cells(
+    state: str,
+    rng: random.Random | None = None,
+    parsed: dict[str, object] | None = None,
+) -> TargetingResult:
+    """Rank the side to move's untargeted cells by placement density.
+
+    In hunt mode (no unsunk hits) cells are ranked by how many placements of
+    the remaining fleet could cover them; in target mode placements through
+    the unsunk hits take priority. Ties are broken at random. ``parsed``
+    skips parsing ``state`` when the caller already has it.
+    """
+    if parsed is None:
+        try:
+            parsed = parse_state(state)
+        except ValueError:
+            return TargetingResult(MODE_HUNT, [], [])
+    if parsed["status"] != STATUS_IN_PROGRESS:
+        return TargetingResult(MODE_HUNT, [], [])
+    if parsed["turn"] == TURN_PLAYER:
+        target_board = parsed["opponent_board"]
+        fog = parsed["fog_board"]
+    else:
+        target_board = parsed["player_board"]
+        fog = parsed["opponent_fog"]
+
+    sunk = 0
+    sunk_sizes = []
+    for component in _sunk_components(target_board):
+        sunk |= component
+        sunk_sizes.append(component.bit_count())
+    fleet = _remove_sunk(FLEET_SIZES, sunk_sizes)
+    hits = _mask(fog, {HIT}) & ~sunk
+    blocked = _mask(fog, {MISS}) | sunk
+    untargeted = _mask(fog, {EMPTY})
+    open_cells = [index for index in range(CELLS) if untargeted >> index & 1]
+
+    hunt, target = placement_densities(blocked, hits, fleet)
+    mode = MODE_HUNT
+    if hits and any(target[index] for index in open_cells):
+        mode = MODE_TARGET
+    scores = target if mode == MODE_TARGET else hunt
+    total = sum(scores[index] for index in open_cells)
+
+    rng = rng or shared_rng()
+    order = list(open_cells)
+    rng.shuffle(order)
+    order.sort(key=lambda index: (-scores[index], -hunt[index]))
+    cells = [
+        TargetCell(COORDS[index], round(scores[index] / total, 4) if total else 0.0)
+        for index in order
+    ]
+    return TargetingResult(mode, cells, fleet)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import random
 
+try:
+    from .rng_service import shared_rng
+except ImportError:  # pragma: no cover - fallback for script execution
+    from rng_service import shared_rng
+
 
 BOARD_SIZE = 10
 FLEET_SIZES = [5, 4, 3, 3, 2]
@@ -18,6 +23,8 @@ SHIP = "S"
 HIT = "H"
 MISS = "M"
 
+BOARD_KEYS = ("player_board", "opponent_board", "fog_board", "opponent_fog")
+
 FILES = "ABCDEFGHIJ"
 RANKS = list(range(1, 11))
 
@@ -31,10 +38,12 @@ class SeaBattleMoveResult:
     turn: str | None = None
     last_action: str | None = None
     winner: str | None = None
+    # The new state as ``parse_state`` would return it, for session storage.
+    parsed: dict[str, object] | None = field(default=None, compare=False, repr=False)
 
 
 def initial_sea_battle_state(rng: random.Random | None = None) -> str:
-    rng = rng or random.Random()
+    rng = rng or shared_rng()
     player_board = _empty_board()
     opponent_board = _empty_board()
     _place_fleet_random(player_board, rng)
@@ -51,11 +60,21 @@ def initial_sea_battle_state(rng: random.Random | None = None) -> str:
     )
 
 
-def apply_sea_battle_move(state: str, coord: str) -> SeaBattleMoveResult:
-    try:
-        parsed = parse_state(state)
-    except ValueError as exc:
-        return SeaBattleMoveResult(False, state, error=str(exc))
+def apply_sea_battle_move(
+    state: str, coord: str, *, parsed: dict[str, object] | None = None
+) -> SeaBattleMoveResult:
+    """Fire at ``coord`` for the side to move.
+
+    ``parsed`` is ``state`` already parsed, if the caller has it; the move is
+    played on a copy, so it is not modified.
+    """
+    if parsed is None:
+        try:
+            parsed = parse_state(state)
+        except ValueError as exc:
+            return SeaBattleMoveResult(False, state, error=str(exc))
+    else:
+        parsed = copy_state(parsed)
 
     if parsed["status"] != STATUS_IN_PROGRESS:
         return SeaBattleMoveResult(False, state, error="Game is already over.")
@@ -125,14 +144,27 @@ def apply_sea_battle_move(state: str, coord: str) -> SeaBattleMoveResult:
         turn=next_turn,
         last_action=last_action,
         winner=None if winner == "-" else winner,
+        parsed={
+            "player_board": player_board,
+            "opponent_board": opponent_board,
+            "fog_board": player_fog,
+            "opponent_fog": opponent_fog,
+            "turn": next_turn,
+            "status": status,
+            "last_action": last_action,
+            "winner": winner,
+        },
     )
 
 
-def legal_sea_battle_moves(state: str) -> list[str]:
-    try:
-        parsed = parse_state(state)
-    except ValueError:
-        return []
+def legal_sea_battle_moves(
+    state: str, *, parsed: dict[str, object] | None = None
+) -> list[str]:
+    if parsed is None:
+        try:
+            parsed = parse_state(state)
+        except ValueError:
+            return []
     fog = (
         parsed["fog_board"] if parsed["turn"] == TURN_PLAYER else parsed["opponent_fog"]
     )
@@ -213,6 +245,14 @@ def parse_state(state: str) -> dict[str, object]:
     }
 
 
+def copy_state(parsed: dict[str, object]) -> dict[str, object]:
+    """A parsed state whose boards can be changed without touching ``parsed``."""
+    copied = dict(parsed)
+    for key in BOARD_KEYS:
+        copied[key] = [row[:] for row in parsed[key]]
+    return copied
+
+
 def _empty_board() -> list[list[str]]:
     return [[EMPTY for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
 
@@ -0,0 +1,338 @@
+"""Server-side game session storage keyed by gameId."""
+
+from __future__ import annotations
+
+import atexit
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Callable
+import zlib
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SESSIONS = 10_000
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.05
+STATELESS_BACKENDS = {"none", "off", "stateless"}
+
+# State blobs carry a one-byte tag so short states can skip compression.
+RAW_TAG = b"\x00"
+ZLIB_TAG = b"\x01"
+COMPRESS_MIN_BYTES = 64
+
+CREATE_TABLE_SQL = (
+    "CREATE TABLE IF NOT EXISTS game_sessions ("
+    "game_id TEXT PRIMARY KEY, "
+    "game_type TEXT NOT NULL, "
+    "state BLOB NOT NULL, "
+    "updated_at REAL NOT NULL)"
+)
+CREATE_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS game_sessions_updated_at "
+    "ON game_sessions (updated_at)"
+)
+SELECT_SQL = "SELECT game_type, state, updated_at FROM game_sessions WHERE game_id = ?"
+UPSERT_SQL = (
+    "INSERT INTO game_sessions (game_id, game_type, state, updated_at) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(game_id) DO UPDATE SET "
+    "game_type = excluded.game_type, state = excluded.state, "
+    "updated_at = excluded.updated_at"
+)
+TOUCH_SQL = (
+    "UPDATE game_sessions SET updated_at = ? WHERE game_id = ? AND updated_at < ?"
+)
+DELETE_SQL = "DELETE FROM game_sessions WHERE game_id = ?"
+PURGE_SQL = "DELETE FROM game_sessions WHERE updated_at < ?"
+COUNT_SQL = "SELECT COUNT(*) FROM game_sessions"
+
+
+@dataclass(frozen=True)
+class GameSession:
+    """The latest state of one game.
+
+    ``parsed`` is the rules module's parsed form of ``state`` when the store
+    still holds it, so the tools can skip parsing. Callers must treat it as
+    read-only and copy it before playing a move on it.
+    """
+
+    game_id: str
+    game_type: str
+    state: str
+    parsed: Any = field(default=None, compare=False, repr=False)
+
+
+class SessionStore:
+    """Interface shared by the session backends used by the tools layer."""
+
+    def get(self, game_id: str) -> GameSession | None:
+        raise NotImplementedError
+
+    def save(
+        self, game_id: str, game_type: str, state: str, parsed: Any = None
+    ) -> None:
+        raise NotImplementedError
+
+    def delete(self, game_id: str) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources; the default store holds none."""
+
+
+class InMemorySessionStore(SessionStore):
+    """Bounded LRU of the latest state per game, with idle expiry.
+
+    Entries expire ``ttl_seconds`` after their last read or write; once
+    ``max_sessions`` is reached the least recently used game is evicted.
+    Parsed states are kept alongside the strings.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be positive.")
+        self._max_sessions = max_sessions
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[GameSession, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, game_id: str) -> GameSession | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None:
+                return None
+            session, touched_at = entry
+            if now - touched_at > self._ttl_seconds:
+                del self._entries[game_id]
+                return None
+            self._entries[game_id] = (session, now)
+            self._entries.move_to_end(game_id)
+            return session
+
+    def save(
+        self, game_id: str, game_type: str, state: str, parsed: Any = None
+    ) -> None:
+        session = GameSession(game_id, game_type, state, parsed)
+        now = self._clock()
+        with self._lock:
+            self._entries[game_id] = (session, now)
+            self._entries.move_to_end(game_id)
+            while len(self._entries) > self._max_sessions:
+                self._entries.popitem(last=False)
+
+    def delete(self, game_id: str) -> None:
+        with self._lock:
+            self._entries.pop(game_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteSessionStore(SessionStore):
+    """Durable sessions in a WAL-mode SQLite file shared by all workers.
+
+    Writes are buffered and flushed with a single ``executemany`` once
+    ``batch_size`` games are pending or ``flush_interval`` seconds have
+    passed; reads consult the pending buffer first so a worker always sees
+    its own writes. Like the in-memory store, sessions expire
+    ``ttl_seconds`` after their last read or write; reads refresh
+    ``updated_at`` through the same batched flush as writes. Only strings
+    reach the database, so parsed states last until the pending write is
+    flushed; rows read back are parsed again by the tools.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive.")
+        self._path = str(path)
+        self._ttl_seconds = ttl_seconds
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._clock = clock
+        self._pending: dict[str, tuple[GameSession, float]] = {}
+        self._touched: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._closed = False
+
+        self._conn = sqlite3.connect(
+            self._path,
+            timeout=5.0,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if self._path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(CREATE_TABLE_SQL)
+        self._conn.execute(CREATE_INDEX_SQL)
+        self._conn.execute(PURGE_SQL, (self._clock() - self._ttl_seconds,))
+
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="session-store-flush", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def get(self, game_id: str) -> GameSession | None:
+        now = self._clock()
+        with self._lock:
+            pending = self._pending.get(game_id)
+            if pending is not None:
+                self._pending[game_id] = (pending[0], now)
+                return pending[0]
+            if self._closed:
+                return None
+            row = self._conn.execute(SELECT_SQL, (game_id,)).fetchone()
+            if row is None:
+                return None
+            game_type, blob, updated_at = row
+            updated_at = max(updated_at, self._touched.get(game_id, updated_at))
+            if now - updated_at <= self._ttl_seconds:
+                self._touched[game_id] = now
+                self._wake.set()
+        if now - updated_at > self._ttl_seconds:
+            self.delete(game_id)
+            return None
+        return GameSession(game_id, game_type, decode_state(blob))
+
+    def save(
+        self, game_id: str, game_type: str, state: str, parsed: Any = None
+    ) -> None:
+        session = GameSession(game_id, game_type, state, parsed)
+        now = self._clock()
+        with self._lock:
+            self._pending[game_id] = (session, now)
+            if len(self._pending) >= self._batch_size:
+                self._flush_locked()
+            else:
+                self._wake.set()
+
+    def delete(self, game_id: str) -> None:
+        with self._lock:
+            self._pending.pop(game_id, None)
+            self._touched.pop(game_id, None)
+            if not self._closed:
+                self._conn.execute(DELETE_SQL, (game_id,))
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            self._conn.close()
+        self._stop.set()
+        self._wake.set()
+        atexit.unregister(self.close)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush_locked()
+            return self._conn.execute(COUNT_SQL).fetchone()[0]
+
+    def _flush_locked(self) -> None:
+        if not (self._pending or self._touched) or self._closed:
+            return
+        rows = [
+            (session.game_id, session.game_type, encode_state(session.state), saved_at)
+            for session, saved_at in self._pending.values()
+        ]
+        touches = [
+            (touched_at, game_id, touched_at)
+            for game_id, touched_at in self._touched.items()
+            if game_id not in self._pending
+        ]
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(UPSERT_SQL, rows)
+            self._conn.executemany(TOUCH_SQL, touches)
+        self._pending.clear()
+        self._touched.clear()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._stop.wait(self._flush_interval):
+                return
+            try:
+                self.flush()
+            except Exception:
+                # Pending writes stay buffered; retry on the next interval
+                # rather than letting the daemon thread die.
+                logger.exception("Flushing game sessions to %s failed", self._path)
+                self._wake.set()
+
+
+def encode_state(state: str) -> bytes:
+    """Encode a state string as a tagged, zlib-compressed blob when that is smaller."""
+    raw = state.encode("utf-8")
+    if len(raw) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(raw, 6)
+        if len(compressed) < len(raw):
+            return ZLIB_TAG + compressed
+    return RAW_TAG + raw
+
+
+def decode_state(blob: bytes) -> str:
+    tag, payload = blob[:1], blob[1:]
+    if tag == ZLIB_TAG:
+        payload = zlib.decompress(payload)
+    elif tag != RAW_TAG:
+        raise ValueError("Invalid session state encoding.")
+    return payload.decode("utf-8")
+
+
+def create_session_store(
+    backend: str,
+    *,
+    max_sessions: int = DEFAULT_MAX_SESSIONS,
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    path: str | Path | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+) -> SessionStore | None:
+    """Build the configured store; stateless backends return ``None``."""
+    normalized = (backend or "").strip().lower()
+    if normalized in STATELESS_BACKENDS:
+        return None
+    if normalized == "memory":
+        return InMemorySessionStore(max_sessions=max_sessions, ttl_seconds=ttl_seconds)
+    if normalized == "sqlite":
+        if not path:
+            raise ValueError("The sqlite session backend requires a database path.")
+        return SQLiteSessionStore(
+            path,
+            ttl_seconds=ttl_seconds,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+        )
+    raise ValueError(f"Unknown game session backend: {backend}")
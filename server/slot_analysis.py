@@ -0,0 +1,161 @@
+"""Slot machine return-to-player figures and batched session simulation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+import math
+import random
+import statistics
+import time
+
+try:
+    from .slot_rules import (
+        PAYOUT_MULTIPLIERS,
+        REEL_COUNT,
+        SYMBOL_WEIGHTS,
+        SYMBOLS,
+        initial_slot_state,
+    )
+    from .rng_service import shared_rng
+except ImportError:  # pragma: no cover - fallback for script execution
+    from slot_rules import (
+        PAYOUT_MULTIPLIERS,
+        REEL_COUNT,
+        SYMBOL_WEIGHTS,
+        SYMBOLS,
+        initial_slot_state,
+    )
+    from rng_service import shared_rng
+
+
+DEFAULT_SESSIONS = 10_000
+MAX_SESSIONS = 1_000_000
+DEFAULT_MAX_SPINS = 1_000
+MAX_SPINS_PER_SESSION = 1_000_000
+DEFAULT_BUDGET_MS = 200
+MAX_BUDGET_MS = 5_000
+
+# A spin pays only when all reels match, so its payout depends on a single
+# draw over the winning symbols plus one losing outcome. Integer weights are
+# counts out of every reel combination.
+TOTAL_COMBINATIONS = sum(SYMBOL_WEIGHTS.values()) ** REEL_COUNT
+WINNING_WEIGHTS = tuple(SYMBOL_WEIGHTS[symbol] ** REEL_COUNT for symbol in SYMBOLS)
+OUTCOME_MULTIPLIERS = tuple(PAYOUT_MULTIPLIERS[symbol] for symbol in SYMBOLS) + (0,)
+OUTCOME_CUM_WEIGHTS = tuple(
+    accumulate(WINNING_WEIGHTS + (TOTAL_COMBINATIONS - sum(WINNING_WEIGHTS),))
+)
+
+
+@dataclass(frozen=True)
+class SymbolOdds:
+    symbol: str
+    probability: float
+    multiplier: int
+
+
+@dataclass(frozen=True)
+class PaytableStatistics:
+    """Per-spin figures in units of the bet."""
+
+    rtp: float
+    house_edge: float
+    variance: float
+    std_dev: float
+    hit_frequency: float
+    outcomes: list[SymbolOdds]
+
+
+@dataclass(frozen=True)
+class SessionStatistics:
+    sessions: int
+    max_spins: int
+    spins: int
+    risk_of_ruin: float
+    median_spins: float
+    mean_spins: float
+    mean_final_stack: float
+    observed_rtp: float
+    elapsed_ms: float
+
+
+@lru_cache(maxsize=1)
+def paytable_statistics() -> PaytableStatistics:
+    """Exact RTP and volatility of one spin from the reel weights and paytable."""
+    outcomes = [
+        SymbolOdds(symbol, weight / TOTAL_COMBINATIONS, PAYOUT_MULTIPLIERS[symbol])
+        for symbol, weight in zip(SYMBOLS, WINNING_WEIGHTS)
+    ]
+    rtp = sum(odds.probability * odds.multiplier for odds in outcomes)
+    second_moment = sum(odds.probability * odds.multiplier**2 for odds in outcomes)
+    # Net result per spin is multiplier - 1; the shift leaves variance unchanged.
+    variance = second_moment - rtp * rtp
+    return PaytableStatistics(
+        rtp=rtp,
+        house_edge=1 - rtp,
+        variance=variance,
+        std_dev=math.sqrt(variance),
+        hit_frequency=sum(odds.probability for odds in outcomes),
+        outcomes=sorted(outcomes, key=lambda odds: -odds.multiplier),
+    )
+
+
+def simulate_sessions(
+    stack: float,
+    bet: float,
+    *,
+    sessions: int = DEFAULT_SESSIONS,
+    max_spins: int = DEFAULT_MAX_SPINS,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    rng: random.Random | None = None,
+) -> SessionStatistics:
+    """Play sessions of flat bets until the stack cannot cover a bet or ``max_spins``.
+
+    Spin payouts are drawn in bulk from the per-spin outcome distribution.
+    Each draw covers only as many spins as the stack can survive for
+    certain, so no draws are wasted when a session ends. Simulation stops
+    early when ``budget_ms`` runs out; ``sessions`` reports how many finished.
+    """
+    initial_slot_state(stack=stack, bet=bet)
+    sessions = max(1, min(int(sessions), MAX_SESSIONS))
+    max_spins = max(1, min(int(max_spins), MAX_SPINS_PER_SESSION))
+    budget_ms = max(1.0, min(float(budget_ms), MAX_BUDGET_MS))
+    started = time.perf_counter()
+    deadline = started + budget_ms / 1000
+    rng = rng or shared_rng()
+    choices = rng.choices
+    payouts = tuple(bet * multiplier for multiplier in OUTCOME_MULTIPLIERS)
+
+    lengths: list[int] = []
+    ruined = 0
+    final_total = 0.0
+    paid_total = 0.0
+    while len(lengths) < sessions and (not lengths or time.perf_counter() < deadline):
+        current = stack
+        spins = 0
+        while spins < max_spins and current >= bet:
+            # The stack cannot run out before this many spins.
+            count = min(max_spins - spins, int(current // bet))
+            for payout in choices(payouts, cum_weights=OUTCOME_CUM_WEIGHTS, k=count):
+                current += payout - bet
+                paid_total += payout
+            spins += count
+        lengths.append(spins)
+        final_total += current
+        if current < bet:
+            ruined += 1
+
+    played = len(lengths)
+    total_spins = sum(lengths)
+    return SessionStatistics(
+        sessions=played,
+        max_spins=max_spins,
+        spins=total_spins,
+        risk_of_ruin=ruined / played,
+        median_spins=float(statistics.median(lengths)),
+        mean_spins=total_spins / played,
+        mean_final_stack=final_total / played,
+        observed_rtp=paid_total / (total_spins * bet) if total_spins else 0.0,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import accumulate
 import random
 
+try:
+    from .rng_service import shared_rng
+except ImportError:  # pragma: no cover - fallback for script execution
+    from rng_service import shared_rng
+
 
 SYMBOLS = ["7", "BAR", "BELL", "CHERRY", "LEMON", "ORANGE"]
 SYMBOL_WEIGHTS = {
@@ -21,6 +27,17 @@ PAYOUT_MULTIPLIERS = {
     "LEMON": 3,
     "ORANGE": 2,
 }
+# Cumulative reel weights in SYMBOLS order, so spins skip rebuilding the table.
+CUM_WEIGHTS = tuple(accumulate(SYMBOL_WEIGHTS[symbol] for symbol in SYMBOLS))
+REEL_COUNT = 3
+MAX_BATCH_SPINS = 1_000
+
+STOP_COUNT = "count"
+STOP_WIN = "win"
+STOP_LOSS_LIMIT = "loss_limit"
+STOP_BELOW_STACK = "stack_below"
+STOP_ABOVE_STACK = "stack_above"
+STOP_STACK_EXHAUSTED = "stack_exhausted"
 
 STATUS_IN_PROGRESS = "in_progress"
 
@@ -61,16 +78,12 @@ def spin_slot(state_str: str, rng: random.Random | None = None) -> dict[str, obj
             "error": str(exc),
         }
 
-    if state.stack <= 0:
-        return _illegal(state, "Stack must be positive.")
-    if state.bet <= 0:
-        return _illegal(state, "Bet must be positive.")
-    if state.bet > state.stack:
-        return _illegal(state, "Bet cannot exceed stack.")
+    error = _spin_error(state)
+    if error:
+        return _illegal(state, error)
 
-    rng = rng or random.Random()
-    weights = [SYMBOL_WEIGHTS[symbol] for symbol in SYMBOLS]
-    reels = rng.choices(SYMBOLS, weights=weights, k=3)
+    rng = rng or shared_rng()
+    reels = rng.choices(SYMBOLS, cum_weights=CUM_WEIGHTS, k=REEL_COUNT)
     payout = _calculate_payout(reels, state.bet)
     new_stack = state.stack - state.bet + payout
     next_state = SlotState(
@@ -93,6 +106,102 @@ def spin_slot(state_str: str, rng: random.Random | None = None) -> dict[str, obj
     }
 
 
+def spin_slot_batch(
+    state_str: str,
+    count: int,
+    *,
+    stop_on_win: bool = False,
+    loss_limit: float | None = None,
+    stop_below: float | None = None,
+    stop_above: float | None = None,
+    rng: random.Random | None = None,
+) -> dict[str, object]:
+    """Spin up to ``count`` times, stopping early when a condition is met.
+
+    Stops after a paying spin (``stop_on_win``), once the session has lost
+    at least ``loss_limit``, once the stack is at or below ``stop_below`` or
+    at or above ``stop_above``, or when the stack can no longer cover the
+    bet. ``stoppedBy`` names the reason.
+    """
+    try:
+        state = parse_state(state_str)
+    except ValueError as exc:
+        return {
+            "legal": False,
+            "state": state_str,
+            "error": str(exc),
+        }
+
+    if not 1 <= count <= MAX_BATCH_SPINS:
+        return _illegal(state, f"Spin count must be between 1 and {MAX_BATCH_SPINS}.")
+    for limit in (loss_limit, stop_below, stop_above):
+        if limit is not None and limit < 0:
+            return _illegal(state, "Stop limits cannot be negative.")
+    error = _spin_error(state)
+    if error:
+        return _illegal(state, error)
+
+    rng = rng or shared_rng()
+    choices = rng.choices
+    bet = state.bet
+    start_stack = stack = state.stack
+    spins: list[dict[str, object]] = []
+    reels: list[str] = []
+    payout = 0.0
+    total_payout = 0.0
+    stopped_by = STOP_COUNT
+    for _ in range(count):
+        if stack < bet:
+            stopped_by = STOP_STACK_EXHAUSTED
+            break
+        reels = choices(SYMBOLS, cum_weights=CUM_WEIGHTS, k=REEL_COUNT)
+        payout = _calculate_payout(reels, bet)
+        stack = stack - bet + payout
+        total_payout += payout
+        spins.append({"reels": reels, "payout": payout})
+        if stop_on_win and payout > 0:
+            stopped_by = STOP_WIN
+            break
+        if loss_limit is not None and start_stack - stack >= loss_limit:
+            stopped_by = STOP_LOSS_LIMIT
+            break
+        if stop_below is not None and stack <= stop_below:
+            stopped_by = STOP_BELOW_STACK
+            break
+        if stop_above is not None and stack >= stop_above:
+            stopped_by = STOP_ABOVE_STACK
+            break
+    else:
+        if stack < bet:
+            stopped_by = STOP_STACK_EXHAUSTED
+
+    next_state = SlotState(
+        reels=reels,
+        stack=stack,
+        bet=bet,
+        payout=payout,
+        status=STATUS_IN_PROGRESS,
+        last_action="spin",
+    )
+    total_bet = bet * len(spins)
+    return {
+        "legal": True,
+        "state": serialize_state(next_state),
+        "reels": reels,
+        "stack": stack,
+        "bet": bet,
+        "payout": payout,
+        "status": next_state.status,
+        "lastAction": next_state.last_action,
+        "spins": spins,
+        "spinCount": len(spins),
+        "totalBet": total_bet,
+        "totalPayout": total_payout,
+        "net": total_payout - total_bet,
+        "stoppedBy": stopped_by,
+    }
+
+
 def serialize_state(state: SlotState) -> str:
     reels = ",".join(state.reels) if state.reels else "-"
     return "|".join(
@@ -136,7 +245,7 @@ def parse_state(state_str: str) -> SlotState:
 
 
 def _calculate_payout(reels: list[str], bet: float) -> float:
-    if len(reels) != 3:
+    if len(reels) != REEL_COUNT:
         return 0.0
     if reels[0] == reels[1] == reels[2]:
         multiplier = PAYOUT_MULTIPLIERS.get(reels[0], 0)
@@ -144,6 +253,16 @@ def _calculate_payout(reels: list[str], bet: float) -> float:
     return 0.0
 
 
+def _spin_error(state: SlotState) -> str | None:
+    if state.stack <= 0:
+        return "Stack must be positive."
+    if state.bet <= 0:
+        return "Bet must be positive."
+    if state.bet > state.stack:
+        return "Bet cannot exceed stack."
+    return None
+
+
 def _validate_stack_bet(stack: float, bet: float) -> None:
     if stack <= 0:
         raise ValueError("Stack must be positive.")
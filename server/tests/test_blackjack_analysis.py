@@ -0,0 +1,90 @@
+from pathlib import Path
+import random
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from blackjack_analysis import analyze_hand  # noqa: E402
+from blackjack_rules import (  # noqa: E402
+    BlackjackHand,
+    BlackjackState,
+    Shoe,
+    serialize_state,
+)
+
+
+def build_state(cards, dealer, *, shoe=None, turn="player", status="in_progress"):
+    state = BlackjackState(
+        shoe=shoe if shoe is not None else Shoe.seeded(7, cursor=4, decks=6, cut=234),
+        player_hands=[
+            BlackjackHand(
+                cards=cards,
+                state="active" if turn == "player" else "stood",
+                doubled=False,
+                bet=10.0,
+            )
+        ],
+        dealer=dealer,
+        stack=1000.0,
+        bet=10.0,
+        turn=turn,
+        hand_index=0,
+        status=status,
+    )
+    return serialize_state(state)
+
+
+def analyze(state, rollouts=4000):
+    return analyze_hand(
+        state, budget_ms=5000, max_rollouts=rollouts, rng=random.Random(11)
+    )
+
+
+def test_doubles_eleven_against_a_six():
+    analysis = analyze(build_state(["5S", "6D"], ["6H", "TC"]))
+    assert analysis.turn == "player"
+    assert analysis.best_action == "double"
+    assert {entry.action for entry in analysis.actions} == {"hit", "stand", "double"}
+    for entry in analysis.actions:
+        assert entry.rollouts == 4000
+        assert entry.ci_low <= entry.ev <= entry.ci_high
+
+
+def test_stands_on_twenty():
+    analysis = analyze(build_state(["TS", "QD"], ["6H", "TC"]))
+    assert analysis.best_action == "stand"
+    assert analysis.actions[0].ev > 0.5
+
+
+def test_hidden_hole_card_excludes_dealer_blackjack():
+    # Every unseen card but the 5 would give the ace upcard a blackjack, so
+    # the hole card must be the 5 and the dealer busts on ten after ten.
+    state = build_state(
+        ["TS", "QD"],
+        ["AS", "5C"],
+        shoe=Shoe.from_cards(["TH", "TD", "KC", "JD"]),
+    )
+    actions = analyze(state, 200).actions
+    stand = next(entry for entry in actions if entry.action == "stand")
+    assert stand.ev == 1.0
+    assert stand.ci_low == stand.ci_high == 1.0
+
+
+def test_dealer_turn_scores_the_forced_action():
+    state = build_state(
+        ["TS", "QD"],
+        ["TD", "6C"],
+        shoe=Shoe.from_cards(["5H", "5C"]),
+        turn="dealer",
+    )
+    analysis = analyze(state, 50)
+    assert analysis.turn == "dealer"
+    assert [entry.action for entry in analysis.actions] == ["hit"]
+    # Either five makes 21 for the dealer.
+    assert analysis.actions[0].ev == -1.0
+
+
+def test_finished_or_invalid_states_have_no_actions():
+    over = build_state(["TS", "QD"], ["TD", "7C"], turn="dealer", status="game_over")
+    assert analyze(over).actions == []
+    assert analyze("not a state").best_action is None
@@ -1,18 +1,25 @@
 from pathlib import Path
+import random
 import sys
 
+import pytest
+
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from blackjack_rules import (  # noqa: E402
     BlackjackHand,
     BlackjackState,
+    Shoe,
     apply_blackjack_action,
+    deal_next_hand,
     hand_value,
+    initial_blackjack_state,
     legal_dealer_actions,
     legal_player_actions,
     parse_state,
     resolve_results,
     serialize_state,
+    shuffled_deck,
 )
 
 
@@ -177,3 +184,166 @@ def test_blackjack_payout_updates_stack():
     parsed = parse_state(result["state"])
     assert parsed.status == "game_over"
     assert parsed.stack == 115.0
+
+
+def test_seeded_shoe_serializes_as_seed_and_cursor():
+    state = initial_blackjack_state(stack=1000, bet=10, rng=random.Random(5))
+    state_str = serialize_state(state)
+    shoe_segment = state_str.split("|")[0]
+    assert shoe_segment == f"S:#{state.shoe.seed:x}.4.1.39"
+    assert len(state_str) < 120
+
+    deck = shuffled_deck(state.shoe.seed)
+    assert state.player_hands[0].cards == list(deck[:2])
+    assert state.dealer == list(deck[2:4])
+    assert len(set(deck)) == 52
+
+
+def test_seeded_shoe_draws_by_advancing_the_cursor():
+    shoe = Shoe.seeded(0xABC, cursor=10)
+    assert shoe.draw() == shuffled_deck(0xABC)[10]
+    assert shoe.cursor == 11
+    assert len(shoe) == 41
+
+    state_str = build_state(
+        shoe=Shoe.seeded(0xABC, cursor=10),
+        player_hands=[
+            BlackjackHand(cards=["TS", "2D"], state="active", doubled=False, bet=10.0)
+        ],
+        dealer=["7C", "8C"],
+    )
+    assert state_str.startswith("S:#abc.10|")
+    result = apply_blackjack_action(state_str, "hit")
+    assert result["state"].startswith("S:#abc.11|")
+    assert parse_state(result["state"]).player_hands[0].cards[-1] == shuffled_deck(0xABC)[10]
+
+
+def test_legacy_card_list_shoe_still_parses():
+    state_str = build_state(
+        shoe=["5H", "2C"],
+        player_hands=[
+            BlackjackHand(cards=["TS", "2D"], state="active", doubled=False, bet=10.0)
+        ],
+        dealer=["7C", "8C"],
+    )
+    assert state_str.startswith("S:5H,2C|")
+    result = apply_blackjack_action(state_str, "hit")
+    assert result["state"].startswith("S:2C|")
+
+
+def test_invalid_or_exhausted_seeded_shoe():
+    state_str = build_state(
+        shoe=Shoe.seeded(1, cursor=52),
+        player_hands=[
+            BlackjackHand(cards=["TS", "2D"], state="active", doubled=False, bet=10.0)
+        ],
+        dealer=["7C", "8C"],
+    )
+    exhausted = apply_blackjack_action(state_str, "hit")
+    assert exhausted == {"legal": False, "state": state_str, "error": "Shoe is empty."}
+    bad = apply_blackjack_action(state_str.replace("#1.52", "#1.99"), "hit")
+    assert bad["legal"] is False
+
+
+def test_multi_deck_shoe_round_trips_with_cut_card():
+    state = initial_blackjack_state(
+        stack=500, bet=25, rng=random.Random(9), decks=6, penetration=0.8
+    )
+    assert state.shoe.decks == 6
+    assert state.shoe.cut == 250
+    assert len(state.shoe.cards) == 312
+    state_str = serialize_state(state)
+    assert state_str.split("|")[0] == f"S:#{state.shoe.seed:x}.4.6.250"
+    assert parse_state(state_str).shoe.remaining() == state.shoe.remaining()
+
+    with pytest.raises(ValueError, match="Decks"):
+        initial_blackjack_state(stack=500, bet=25, decks=9)
+    with pytest.raises(ValueError, match="Penetration"):
+        initial_blackjack_state(stack=500, bet=25, penetration=0.2)
+
+
+def test_deal_next_hand_reuses_shoe_and_stack():
+    finished = build_state(
+        shoe=Shoe.seeded(0xABC, cursor=20, decks=2, cut=78),
+        player_hands=[
+            BlackjackHand(cards=["TS", "9D"], state="stood", doubled=False, bet=10.0)
+        ],
+        dealer=["7C", "8C", "5D"],
+        stack=130.0,
+        turn="dealer",
+        status="game_over",
+    )
+    result = deal_next_hand(finished, bet=20)
+    assert result["legal"] is True
+    assert result["reshuffled"] is False
+    assert result["cardsRemaining"] == 104 - 24
+    parsed = parse_state(result["state"])
+    deck = shuffled_deck(0xABC, 2)
+    assert parsed.player_hands[0].cards == list(deck[20:22])
+    assert parsed.dealer == list(deck[22:24])
+    assert parsed.shoe.cursor == 24
+    assert parsed.stack == 130.0
+    assert parsed.bet == 20.0
+
+
+def test_deal_next_hand_reshuffles_past_the_cut_card():
+    finished = build_state(
+        shoe=Shoe.seeded(0xABC, cursor=80, decks=2, cut=78),
+        player_hands=[
+            BlackjackHand(cards=["TS", "9D"], state="stood", doubled=False, bet=10.0)
+        ],
+        dealer=["7C", "8C", "5D"],
+        turn="dealer",
+        status="game_over",
+    )
+    result = deal_next_hand(finished, rng=random.Random(3))
+    assert result["legal"] is True
+    assert result["reshuffled"] is True
+    shoe = parse_state(result["state"]).shoe
+    assert (shoe.decks, shoe.cut, shoe.cursor) == (2, 78, 4)
+    assert shoe.seed != 0xABC
+
+
+def test_deal_next_hand_requires_a_finished_hand_and_affordable_bet():
+    in_progress = build_state(
+        shoe=Shoe.seeded(1, cursor=4),
+        player_hands=[
+            BlackjackHand(cards=["TS", "2D"], state="active", doubled=False, bet=10.0)
+        ],
+        dealer=["7C", "8C"],
+    )
+    assert deal_next_hand(in_progress)["legal"] is False
+
+    finished = in_progress.replace("ST:in_progress", "ST:game_over")
+    assert deal_next_hand(finished, bet=5000)["error"] == "Bet cannot exceed stack."
+
+
+def test_parsed_states_are_played_on_a_copy():
+    state_str = build_state(
+        shoe=["2S", "3D"],
+        player_hands=[
+            BlackjackHand(cards=["8S", "8D"], state="active", doubled=False, bet=10.0)
+        ],
+        dealer=["5H", "KD"],
+    )
+    parsed = parse_state(state_str)
+    result = apply_blackjack_action(state_str, "split", parsed=parsed)
+    assert result == apply_blackjack_action(state_str, "split") | {
+        "parsed": result["parsed"]
+    }
+    assert serialize_state(parsed) == state_str
+    assert serialize_state(result["parsed"]) == result["state"]
+
+    finished = build_state(
+        shoe=Shoe.seeded(0xABC, cursor=20, decks=2, cut=78),
+        player_hands=[
+            BlackjackHand(cards=["TS", "9D"], state="stood", doubled=False, bet=10.0)
+        ],
+        dealer=["7C", "8C", "5D"],
+        turn="dealer",
+        status="game_over",
+    )
+    parsed = parse_state(finished)
+    result = deal_next_hand(finished, bet=20, parsed=parsed)
+    assert parsed.shoe.cursor == 20
+    assert serialize_state(result["parsed"]) == result["state"]
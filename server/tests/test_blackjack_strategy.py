@@ -0,0 +1,134 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from blackjack_rules import (  # noqa: E402
+    BlackjackHand,
+    BlackjackState,
+    Shoe,
+    hand_value,
+    serialize_state,
+)
+from blackjack_strategy import (  # noqa: E402
+    DEALER_OUTCOMES,
+    advise,
+    composition_of,
+    dealer_distribution,
+    hand_row,
+    strategy_table,
+)
+
+SIX_DECKS = tuple([24] * 9 + [96])
+CARD_FOR_POINTS = {points: f"{rank}S" for points, rank in enumerate("A23456789T", 1)}
+
+
+def brute_force_dealer(counts, cards):
+    """Enumerate every draw sequence without memoisation."""
+    total, _ = hand_value([CARD_FOR_POINTS[points] for points in cards])
+    if total > 21:
+        return {"bust": 1.0}
+    if total >= 17:
+        return {str(total): 1.0}
+    remaining = sum(counts)
+    result = {}
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+        counts[index] -= 1
+        outcomes = brute_force_dealer(counts, cards + [index + 1])
+        for outcome, probability in outcomes.items():
+            result[outcome] = result.get(outcome, 0.0) + probability * count / remaining
+        counts[index] += 1
+    return result
+
+
+def test_dealer_distribution_matches_brute_force_enumeration():
+    composition = (2, 1, 1, 0, 2, 1, 0, 1, 0, 4)
+    for upcard in (1, 6, 10):
+        expected = {name: 0.0 for name in DEALER_OUTCOMES}
+        weight = 0.0
+        counts = list(composition)
+        for index, count in enumerate(counts):
+            hole = index + 1
+            if not count or {upcard, hole} == {1, 10}:
+                continue
+            counts[index] -= 1
+            outcomes = brute_force_dealer(counts, [upcard, hole])
+            for outcome, probability in outcomes.items():
+                expected[outcome] += probability * count / sum(composition)
+            counts[index] += 1
+            weight += count / sum(composition)
+        exact = dict(zip(DEALER_OUTCOMES, dealer_distribution(composition, upcard)))
+        for name in DEALER_OUTCOMES:
+            assert exact[name] == pytest.approx(expected[name] / weight)
+        assert sum(exact.values()) == pytest.approx(1.0)
+
+
+def test_all_tens_dealer_six_always_busts():
+    distribution = dict(zip(DEALER_OUTCOMES, dealer_distribution((0,) * 9 + (8,), 6)))
+    assert distribution["bust"] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    ("row", "upcard", "action"),
+    [
+        ("hard 11", "6", "double"),
+        ("hard 16", "T", "hit"),
+        ("hard 12", "4", "stand"),
+        ("hard 17", "A", "stand"),
+        ("soft 18", "9", "hit"),
+        ("pair 8", "T", "split"),
+        ("pair T", "6", "stand"),
+    ],
+)
+def test_six_deck_table_matches_basic_strategy(row, upcard, action):
+    assert strategy_table(SIX_DECKS)[row][upcard].action == action
+
+
+def test_strategy_table_is_cached_per_composition():
+    assert strategy_table(SIX_DECKS) is strategy_table(SIX_DECKS)
+    assert composition_of(["AS", "KD", "TC", "5H"]) == (1, 0, 0, 0, 1, 0, 0, 0, 0, 2)
+
+
+def test_hand_rows():
+    assert hand_row(["8S", "8D"]) == "pair 8"
+    assert hand_row(["KS", "QD"]) == "hard 20"
+    assert hand_row(["AS", "7D"]) == "soft 18"
+    assert hand_row(["AS", "7D", "9C"]) == "hard 17"
+
+
+def build_state(cards, dealer, stack=1000.0):
+    state = BlackjackState(
+        shoe=Shoe.seeded(3, cursor=8, decks=6, cut=234),
+        player_hands=[
+            BlackjackHand(cards=cards, state="active", doubled=False, bet=10.0)
+        ],
+        dealer=dealer,
+        stack=stack,
+        bet=10.0,
+        turn="player",
+        hand_index=0,
+        status="in_progress",
+    )
+    return serialize_state(state)
+
+
+def test_advice_is_limited_to_legal_actions():
+    advice = advise(build_state(["5S", "6D"], ["6H", "TC"]))
+    assert advice.action == "double"
+    assert advice.row == "hard 11"
+    assert sum(advice.dealer_outcomes.values()) == pytest.approx(1.0, abs=1e-3)
+
+    no_double = advise(build_state(["5S", "6D"], ["6H", "TC"], stack=10.0))
+    assert set(no_double.evs) == {"hit", "stand"}
+    assert no_double.action == "hit"
+
+    three_cards = advise(build_state(["5S", "2D", "4C"], ["6H", "TC"]))
+    assert set(three_cards.evs) == {"hit", "stand"}
+
+
+def test_no_advice_without_a_player_decision():
+    assert advise("not a state") is None
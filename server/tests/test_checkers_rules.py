@@ -8,6 +8,8 @@ from checkers_rules import (  # noqa: E402
     apply_checkers_move,
     initial_checkers_state,
     legal_checkers_moves,
+    parse_position,
+    position_to_state,
 )
 
 
@@ -47,3 +49,41 @@ def test_apply_checkers_move_accepts_capture_separator():
     result = apply_checkers_move(state, "c3xe5")
     assert result.legal is True
     assert result.last_move == "c3e5"
+
+
+def test_king_capture_sequence_can_revisit_vacated_square():
+    state = ".b.b..../B......./.w.....w/w......./.w.w.w.b/..W...../.w.w.b.b/B...w... b"
+    capture_moves, _ = all_checkers_moves(state)
+    assert "a7c5a3c1e3c5" in capture_moves
+    assert "a7c5e3g5" in capture_moves
+
+
+def test_man_capture_stops_on_promotion():
+    state = "......../..b...../.w....../......../......../......../......../........ w"
+    capture_moves, _ = all_checkers_moves(state)
+    assert capture_moves == ["b6d8"]
+
+
+def test_parse_position_round_trip():
+    state = initial_checkers_state()
+    position = parse_position(state)
+    assert bin(position.white_men).count("1") == 12
+    assert bin(position.black_men).count("1") == 12
+    assert position_to_state(position) == state
+
+
+def test_apply_checkers_move_returns_next_legal_moves():
+    state = "......../......../......../..b...../......../w.w...../......../........ b"
+    result = apply_checkers_move(state, "c5b4")
+    assert result.legal is True
+    assert result.must_capture is True
+    assert result.next_legal_moves == legal_checkers_moves(result.state)
+    assert result.next_legal_moves == ["a3c5", "c3a5"]
+
+
+def test_apply_checkers_move_last_capture_ends_game():
+    state = "......../......../......../......../...b..../..w...../......../........ w"
+    result = apply_checkers_move(state, "c3e5")
+    assert result.status == "game_over"
+    assert result.winner == "w"
+    assert result.next_legal_moves == []
@@ -0,0 +1,124 @@
+from pathlib import Path
+import random
+import sys
+
+import chess
+import chess.polyglot
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import chess_book  # noqa: E402
+from chess_book import (  # noqa: E402
+    BOOK_ENV_VAR,
+    DEFAULT_BOOK_PATH,
+    OpeningBook,
+    choose_book_move,
+    encode_move,
+    opening_book,
+    positions_from_games,
+    write_book,
+)
+
+AFTER_E4 = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+
+
+@pytest.fixture
+def book_env(monkeypatch):
+    def use(value):
+        monkeypatch.setenv(BOOK_ENV_VAR, str(value))
+        opening_book.cache_clear()
+
+    yield use
+    opening_book.cache_clear()
+
+
+def test_encode_move_uses_polyglot_castling_and_promotion():
+    board = chess.Board("r3k2r/1P6/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    castle = encode_move(board, chess.Move.from_uci("e1g1"))
+    # King from e1 (file 4, rank 0) onto its rook on h1 (file 7).
+    assert castle == 7 | 4 << 6
+    promote = encode_move(board, chess.Move.from_uci("b7b8q"))
+    assert promote == (1 | 7 << 3 | 1 << 6 | 6 << 9 | 4 << 12)
+
+
+def test_written_book_round_trips_through_python_chess(tmp_path):
+    fen = "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1"
+    path = tmp_path / "book.bin"
+    count = write_book(
+        path,
+        {
+            chess.STARTING_FEN: {"e2e4": 3, "d2d4": 1, "e2e5": 9},
+            fen: {"e1g1": 2, "e1c1": 1},
+        },
+    )
+    assert count == 4
+
+    with chess.polyglot.open_reader(path) as reader:
+        start = {
+            entry.move.uci(): entry.weight for entry in reader.find_all(chess.Board())
+        }
+        castles = {entry.move.uci() for entry in reader.find_all(chess.Board(fen))}
+    assert start == {"e2e4": 3, "d2d4": 1}
+    assert castles == {"e1g1", "e1c1"}
+
+
+def test_weights_are_scaled_to_sixteen_bits(tmp_path):
+    path = tmp_path / "book.bin"
+    write_book(path, {chess.STARTING_FEN: {"e2e4": 200_000, "d2d4": 50_000}})
+    moves = OpeningBook(path).moves(chess.Board())
+    assert [move.uci for move in moves] == ["e2e4", "d2d4"]
+    assert moves[0].weight <= chess_book.MAX_WEIGHT
+    assert moves[0].probability == pytest.approx(0.8, abs=0.01)
+
+
+def test_weighted_choice_is_reproducible_and_follows_weights(tmp_path):
+    path = tmp_path / "book.bin"
+    write_book(path, {chess.STARTING_FEN: {"e2e4": 3, "d2d4": 1}})
+    book = OpeningBook(path)
+    first, moves = book.choose(chess.Board(), random.Random(5))
+    again, _ = book.choose(chess.Board(), random.Random(5))
+    assert first == again
+    assert [move.san for move in moves] == ["e4", "d4"]
+
+    rng = random.Random(1)
+    picks = [book.choose(chess.Board(), rng)[0].uci for _ in range(2000)]
+    assert 0.7 < picks.count("e2e4") / len(picks) < 0.8
+    assert book.choose(chess.Board(AFTER_E4), rng) == (None, [])
+
+
+def test_positions_from_games_merges_transpositions():
+    games = [
+        ["g1f3", "g8f6", "b1c3", "d7d5"],
+        ["b1c3", "g8f6", "g1f3", "d7d5"],
+    ]
+    positions = positions_from_games(games, plies=4)
+    assert positions[chess.Board().epd() + " 0 1"] == {"g1f3": 1, "b1c3": 1}
+    board = chess.Board()
+    for uci in games[0][:3]:
+        board.push_uci(uci)
+    assert positions[board.epd() + " 0 1"] == {"d7d5": 2}
+
+
+def test_bundled_book_covers_the_start_position(book_env, monkeypatch):
+    monkeypatch.delenv(BOOK_ENV_VAR, raising=False)
+    opening_book.cache_clear()
+    assert DEFAULT_BOOK_PATH.is_file()
+    move, moves = choose_book_move(chess.STARTING_FEN, random.Random(0))
+    assert move is not None
+    assert move.uci in {entry.uci for entry in moves}
+    board = chess.Board()
+    assert all(board.is_legal(chess.Move.from_uci(entry.uci)) for entry in moves)
+
+
+def test_book_can_be_disabled_or_replaced(book_env, tmp_path):
+    book_env("")
+    assert opening_book() is None
+    assert choose_book_move(chess.STARTING_FEN) == (None, [])
+
+    path = tmp_path / "book.bin"
+    write_book(path, {AFTER_E4: {"c7c5": 1}})
+    book_env(path)
+    move, _ = choose_book_move(AFTER_E4)
+    assert move.san == "c5"
+    assert choose_book_move("not a fen") == (None, [])
@@ -0,0 +1,141 @@
+from pathlib import Path
+import random
+import sys
+
+import chess
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from chess_endgame import (  # noqa: E402
+    DEFAULT_TABLES_DIR,
+    OUTCOME_DRAW,
+    OUTCOME_LOSS,
+    OUTCOME_WIN,
+    TABLE_SIZES,
+    TABLES_ENV_VAR,
+    EndgameTables,
+    decode_index,
+    endgame_tables,
+    probe_endgame,
+    table_index,
+)
+from chess_engine import ChessSearch  # noqa: E402
+
+TABLES = EndgameTables(DEFAULT_TABLES_DIR)
+
+
+def _random_board(rng, symbol):
+    while True:
+        board = chess.Board(None)
+        king, weak_king, square = rng.sample(chess.SQUARES, 3)
+        color = rng.choice(chess.COLORS)
+        board.set_piece_at(king, chess.Piece(chess.KING, color))
+        board.set_piece_at(weak_king, chess.Piece(chess.KING, not color))
+        piece = chess.Piece.from_symbol(symbol if color else symbol.lower())
+        board.set_piece_at(square, piece)
+        board.turn = rng.choice(chess.COLORS)
+        if board.is_valid():
+            return board
+
+
+def _after(board, move):
+    board.push(move)
+    try:
+        return TABLES.probe(board)
+    finally:
+        board.pop()
+
+
+@pytest.mark.parametrize("material", sorted(TABLE_SIZES))
+def test_tables_ship_with_the_expected_size(material):
+    path = DEFAULT_TABLES_DIR / f"{material.lower()}.bin"
+    assert path.stat().st_size == TABLE_SIZES[material]
+
+
+@pytest.mark.parametrize("material", sorted(TABLE_SIZES))
+def test_index_round_trips(material):
+    for index in range(0, TABLE_SIZES[material], 97):
+        strong_to_move, king, weak_king, piece = decode_index(material, index)
+        assert table_index(material, strong_to_move, king, weak_king, piece) == index
+
+
+@pytest.mark.parametrize("symbol", ["Q", "R", "P"])
+def test_probes_agree_with_every_legal_move(symbol):
+    rng = random.Random(symbol)
+    for _ in range(300):
+        board = _random_board(rng, symbol)
+        probe = TABLES.probe(board)
+        assert probe is not None, board.fen()
+        if board.is_checkmate():
+            assert (probe.outcome, probe.plies) == (OUTCOME_LOSS, 0)
+            continue
+        children = [_after(board, move) for move in board.legal_moves]
+        if probe.outcome == OUTCOME_WIN:
+            losses = [
+                child.plies for child in children if child.outcome == OUTCOME_LOSS
+            ]
+            assert min(losses) + 1 == probe.plies, board.fen()
+        elif probe.outcome == OUTCOME_LOSS:
+            assert all(child.outcome == OUTCOME_WIN for child in children)
+            assert max(child.plies for child in children) + 1 == probe.plies
+        else:
+            assert all(child.outcome != OUTCOME_LOSS for child in children)
+
+
+def test_known_positions():
+    # No KRK mate takes more than 16 moves.
+    krk = TABLES.probe(chess.Board("8/8/8/8/3k4/8/8/R6K w - - 0 1"))
+    assert krk.outcome == OUTCOME_WIN and krk.mate_in <= 16
+    # Black's pawn, so the colours are mirrored before the lookup.
+    promotes = TABLES.probe(chess.Board("8/8/8/8/8/8/p1K5/k7 w - - 0 1"))
+    assert promotes.outcome == OUTCOME_DRAW
+    opposition = TABLES.probe(chess.Board("4k3/8/4K3/4P3/8/8/8/8 w - - 0 1"))
+    assert opposition.outcome == OUTCOME_WIN
+    assert TABLES.probe(chess.Board("4k3/8/4K3/4P3/8/8/8/8 b - - 0 1")).outcome == (
+        OUTCOME_LOSS
+    )
+    assert TABLES.probe(chess.Board("4k3/8/8/4K3/4P3/8/8/8 b - - 0 1")).outcome == (
+        OUTCOME_DRAW
+    )
+
+
+def test_uncovered_positions_are_not_probed():
+    assert TABLES.probe(chess.Board()) is None
+    assert TABLES.probe(chess.Board("4k3/8/8/8/8/8/8/R3K3 w Q - 0 1")) is None
+    assert TABLES.probe(chess.Board("4k3/8/8/8/8/8/8/4KN2 w - - 0 1")).outcome == (
+        OUTCOME_DRAW
+    )
+    assert TABLES.probe(chess.Board("4k3/8/8/8/8/8/8/4K3 w - - 0 1")).outcome == (
+        OUTCOME_DRAW
+    )
+
+
+def test_empty_environment_variable_disables_tables(monkeypatch):
+    monkeypatch.setenv(TABLES_ENV_VAR, "")
+    endgame_tables.cache_clear()
+    try:
+        assert probe_endgame(chess.Board("4k3/8/8/8/8/8/8/R3K3 w - - 0 1")) is None
+        result = ChessSearch().search("4k3/8/8/8/8/8/8/R3K3 w - - 0 1", 50, 1)
+        assert not result.tablebase
+    finally:
+        monkeypatch.delenv(TABLES_ENV_VAR)
+        endgame_tables.cache_clear()
+
+
+def test_search_ranks_covered_roots_from_the_tables():
+    result = ChessSearch().search("4k3/8/4K3/4P3/8/8/8/8 w - - 0 1", 200, 20)
+    assert result.tablebase and result.depth == 0
+    scores = {entry.uci: entry for entry in result.moves}
+    assert result.ranked == [entry.uci for entry in result.moves]
+    assert scores[result.best_move].mate_in > 0
+    # Giving up the opposition with Kf5 only draws.
+    assert scores["e6f5"].score == 0 and scores["e6f5"].mate_in is None
+
+
+def test_search_uses_tables_after_captures():
+    # Taking the rook leaves KQK, which the tables score as a forced mate.
+    fen = "4k3/8/8/8/3r4/8/8/Q3K3 w - - 0 1"
+    result = ChessSearch().search(fen, 500, 1, max_depth=2)
+    assert result.best_move == "a1d4"
+    assert result.moves[0].mate_in is not None and result.moves[0].mate_in > 0
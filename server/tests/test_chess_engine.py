@@ -0,0 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import random
+import sys
+import time
+
+import chess
+import chess.polyglot
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from chess_engine import (  # noqa: E402
+    MATE_SCORE,
+    ChessSearch,
+    TranspositionTable,
+    board_from_fen,
+    evaluate,
+    initial_position,
+    mate_in,
+    play,
+    search_chess,
+)
+
+ITALIAN = "r1bqk1nr/pppp1ppp/2n5/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4"
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        chess.STARTING_FEN,
+        KIWIPETE,
+        # En passant, promotions and castling rights that change mid-game.
+        "r3k2r/1P4P1/8/3pP3/8/8/1p4p1/R3K2R w KQkq d6 0 1",
+    ],
+)
+def test_incremental_updates_match_full_recompute(fen):
+    rng = random.Random(7)
+    for _ in range(20):
+        board = chess.Board(fen)
+        position = initial_position(board)
+        for _ in range(80):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            position = play(board, rng.choice(moves), position)
+            assert position == initial_position(board)
+            assert position[0] == chess.polyglot.zobrist_hash(board)
+
+
+def test_evaluation_is_symmetric():
+    board = chess.Board()
+    assert evaluate(initial_position(board), chess.WHITE) == 0
+    board = chess.Board("4k3/8/8/8/8/8/8/3QK3 w - - 0 1")
+    white_view = evaluate(initial_position(board), chess.WHITE)
+    assert white_view > 800
+    assert evaluate(initial_position(board), chess.BLACK) == -white_view
+
+
+def test_mate_in_reports_moves_for_either_side():
+    assert mate_in(MATE_SCORE - 1) == 1
+    assert mate_in(MATE_SCORE - 3) == 2
+    assert mate_in(-(MATE_SCORE - 2)) == -1
+    assert mate_in(150) is None
+
+
+def test_finds_mate_in_one():
+    result = ChessSearch().search("6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1", 500)
+    assert result.best_move == "d1d8"
+    assert result.moves[0].san == "Rd8#"
+    assert result.moves[0].mate_in == 1
+
+
+def test_finds_mate_in_two():
+    # 1. Kc7 (or Kb6) and the rook mates on the next move.
+    result = ChessSearch().search("k7/8/2K5/8/8/8/8/7R w - - 0 1", 3000)
+    assert result.moves[0].mate_in == 2
+    assert result.best_move in {"c6c7", "c6b6"}
+
+
+def test_takes_hanging_queen_and_avoids_losing_its_own():
+    result = ChessSearch().search("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1", 300)
+    assert result.best_move == "d2d5"
+    result = ChessSearch().search("4k3/8/4p3/3n4/8/8/8/3QK3 w - - 0 1", 300)
+    assert result.best_move != "d1d5"
+
+
+def test_ranks_every_legal_move_and_scores_top_moves():
+    board = chess.Board(KIWIPETE)
+    result = ChessSearch().search(KIWIPETE, 200, top_n=4)
+    assert sorted(result.ranked) == sorted(move.uci() for move in board.legal_moves)
+    assert [entry.uci for entry in result.moves] == result.ranked[:4]
+    scores = [entry.score for entry in result.moves]
+    assert scores == sorted(scores, reverse=True)
+    assert result.depth >= 1
+
+
+def test_search_respects_budget_after_first_iteration():
+    result = ChessSearch().search(chess.STARTING_FEN, 50)
+    assert result.depth >= 1
+    assert result.elapsed_ms < 1000
+
+
+def test_concurrent_searches_do_not_wait_for_each_other():
+    searcher = ChessSearch()
+    budget_ms = 300
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(
+            pool.map(
+                lambda fen: searcher.search(fen, budget_ms, 3),
+                [chess.STARTING_FEN, ITALIAN] * 2,
+            )
+        )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    # Serialized searches would take about four budgets and the later ones
+    # would spend theirs queueing, finishing only the forced first depth.
+    assert elapsed_ms < 3 * budget_ms
+    assert all(result.depth >= 2 for result in results)
+
+
+def test_invalid_and_finished_positions_return_no_moves():
+    assert board_from_fen("not a fen") is None
+    assert board_from_fen("8/8/8/8/8/8/8/8 w - - 0 1") is None
+    for fen in ("not a fen", "7k/6Q1/6K1/8/8/8/8/8 b - - 0 1"):
+        result = search_chess(fen)
+        assert result.best_move is None
+        assert result.ranked == []
+
+
+def test_transposition_table_size_must_be_power_of_two():
+    with pytest.raises(ValueError):
+        TranspositionTable(1000)
+    table = TranspositionTable(16)
+    table.put(5, 3, 0, 42, None)
+    assert table.get(5) == (5, 3, 0, 42, None)
+    assert table.get(21) is None
@@ -1,15 +1,21 @@
 from pathlib import Path
+import random
 import sys
 
 import chess
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+import chess_rules  # noqa: E402
 from chess_rules import (  # noqa: E402
     apply_uci_move,
+    board_from_fen,
+    clear_position_cache,
     legal_moves_uci,
     opponent_move_candidates,
+    position_info,
     revalidate_opponent_choice,
+    san_for_move,
 )
 
 
@@ -98,3 +104,87 @@ def test_revalidate_opponent_choice_rejects_not_allowed():
     assert result["legal"] is False
     assert result["fen"] == fen
     assert result["error"] == "Opponent move not in allowed list"
+
+
+def test_board_cache_hands_out_independent_copies():
+    board = board_from_fen(chess.STARTING_FEN)
+    board.push_uci("e2e4")
+    again = board_from_fen(chess.STARTING_FEN)
+    assert again.fen() == chess.STARTING_FEN
+    assert again is not board
+    assert not again.move_stack
+
+
+def test_position_info_is_shared_across_tools():
+    fen = "7k/8/8/8/8/8/8/K5R1 b - - 0 1"
+    clear_position_cache()
+    info = position_info(fen)
+    assert info.turn == "b"
+    assert info.status == "in_progress"
+    assert info.check is False
+    assert info.game_over is False
+    assert info.valid is True
+
+    legal_moves_uci(fen)
+    apply_uci_move(fen, "h8h7")
+    apply_uci_move(fen, "h8g8")
+    assert chess_rules._POSITIONS.misses == 1
+    assert chess_rules._BOARDS.misses == 1
+    assert list(info.legal_moves) == legal_moves_uci(fen)
+
+
+def test_position_info_reports_finished_games():
+    info = position_info("7k/6Q1/6K1/8/8/8/8/8 b - - 0 1")
+    assert info.status == "checkmate"
+    assert info.check is True
+    assert info.game_over is True
+    assert info.legal_moves == ()
+
+
+def test_apply_reports_next_moves_and_caches_the_new_position():
+    clear_position_cache()
+    result = apply_uci_move(chess.STARTING_FEN, "e2e4")
+    board = chess.Board(result["fen"])
+    assert result["moves"] == [move.uci() for move in board.legal_moves]
+
+    misses = chess_rules._POSITIONS.misses
+    assert legal_moves_uci(result["fen"]) == result["moves"]
+    assert chess_rules._POSITIONS.misses == misses
+
+    illegal = apply_uci_move(result["fen"], "e2e4")
+    assert illegal["legal"] is False
+    assert illegal["moves"] == result["moves"]
+
+
+def test_san_matches_python_chess_over_random_games():
+    rng = random.Random(11)
+    for _ in range(30):
+        board = chess.Board()
+        for _ in range(120):
+            legal = tuple(board.legal_moves)
+            if not legal:
+                break
+            move = rng.choice(legal)
+            expected = board.san(move).rstrip("+#")
+            assert san_for_move(board, move, legal) == expected
+            result = apply_uci_move(board.fen(), move.uci())
+            assert result["san"] == board.san(move)
+            board.push(move)
+
+
+def test_san_disambiguates_by_file_rank_and_square():
+    cases = {
+        # Knights on b1 and f1 can both reach d2.
+        ("4k3/8/8/8/8/8/8/1N2KN2 w - - 0 1", "b1d2"): "Nbd2",
+        # Rooks on a1 and a5 share a file.
+        ("4k3/8/8/R7/8/8/8/R3K3 w - - 0 1", "a1a3"): "R1a3",
+        # Three queens reach d4; the one on a1 needs file and rank.
+        ("7K/8/7k/8/Q7/8/8/Q2Q4 w - - 0 1", "a1d4"): "Qa1d4",
+        ("4k3/1P6/8/8/8/8/8/4K3 w - - 0 1", "b7b8q"): "b8=Q",
+    }
+    for (fen, uci), expected in cases.items():
+        board = chess.Board(fen)
+        legal = tuple(board.legal_moves)
+        move = chess.Move.from_uci(uci)
+        assert san_for_move(board, move, legal) == expected
+        assert board.san(move).rstrip("+#") == expected
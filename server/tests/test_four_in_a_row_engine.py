@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import random
+import sys
+import time
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from four_in_a_row_engine import (  # noqa: E402
+    FourInARowSearch,
+    TranspositionTable,
+    has_four,
+    position_from_state,
+    search_four_in_a_row,
+    winning_cells,
+)
+from four_in_a_row_rules import (  # noqa: E402
+    apply_four_in_a_row_move,
+    initial_four_in_a_row_state,
+    legal_four_in_a_row_moves,
+    parse_state,
+)
+
+EMPTY_ROW = "......."
+
+
+def state_for(rows, turn="player"):
+    grid = "/".join([EMPTY_ROW] * (6 - len(rows)) + rows)
+    return f"G:{grid}|T:{turn}|ST:in_progress|LA:-|W:-"
+
+
+def test_bitboard_matches_grid_layout():
+    position, mask, moves = position_from_state(state_for(["R......"], "opponent"))
+    assert mask == 1
+    assert position == 0
+    assert moves == 1
+    position, mask, _ = position_from_state(state_for(["Y.....Y", "R.....R"]))
+    assert mask == 0b11 | 0b11 << 42
+    assert position == 1 | 1 << 42
+
+
+def test_shift_based_win_detection():
+    horizontal = sum(1 << (col * 7) for col in range(4))
+    vertical = 0b1111
+    diagonal = sum(1 << (col * 7 + col) for col in range(4))
+    anti_diagonal = sum(1 << (col * 7 + 3 - col) for col in range(4))
+    for bits in (horizontal, vertical, diagonal, anti_diagonal):
+        assert has_four(bits)
+    assert not has_four(0b111 | 1 << 7)
+    assert winning_cells(0b111, 0b111) == 0b1000
+
+
+def test_takes_an_immediate_win():
+    result = search_four_in_a_row(state_for(["YYY....", "RRR...."]), 100)
+    assert result.best_column == 4
+    assert result.columns[0].outcome == "win"
+
+
+def test_blocks_the_only_threat():
+    result = search_four_in_a_row(state_for(["YYY....", "RRR...."], "opponent"), 100)
+    assert result.best_column == 4
+    assert all(entry.outcome == "loss" for entry in result.columns[1:])
+
+
+def test_scores_every_legal_column():
+    state = state_for(["...Y...", "...R..."] * 3)
+    result = search_four_in_a_row(state, 50)
+    assert sorted(entry.column for entry in result.columns) == legal_four_in_a_row_moves(state)
+    assert result.depth >= 1
+
+
+def test_finished_or_invalid_positions_have_no_columns():
+    finished = state_for(["RRRR..."]).replace("ST:in_progress", "ST:game_over")
+    assert search_four_in_a_row(finished).columns == []
+    assert search_four_in_a_row(state_for(["R......", EMPTY_ROW])).columns == []
+
+
+def test_transposition_table_is_fixed_size():
+    table = TranspositionTable(size=8)
+    table.put(123, 3, 0, 7, 2)
+    assert table.get(123) == (123, 3, 0, 7, 2)
+    assert table.get(124) is None
+
+
+def test_engine_beats_random_play():
+    rng = random.Random(3)
+    for _ in range(3):
+        state = initial_four_in_a_row_state()
+        while parse_state(state)["status"] == "in_progress":
+            if parse_state(state)["turn"] == "player":
+                column = rng.choice(legal_four_in_a_row_moves(state))
+            else:
+                column = search_four_in_a_row(state, 30).best_column
+            state = apply_four_in_a_row_move(state, column).state
+        assert parse_state(state)["winner"] == "opponent"
+
+
+def test_concurrent_searches_do_not_wait_for_each_other():
+    searcher = FourInARowSearch()
+    state = initial_four_in_a_row_state()
+    budget_ms = 300
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: searcher.search(state, budget_ms), range(4)))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    # Serialized searches would take about four budgets, and the later ones
+    # would find their deadline gone after queueing for the first.
+    assert elapsed_ms < 3 * budget_ms
+    assert all(result.depth >= 4 for result in results)
@@ -0,0 +1,135 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import random
+import sys
+import time
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from mancala_engine import (  # noqa: E402
+    MancalaSearch,
+    board_from_state,
+    flip,
+    play,
+    search_mancala,
+)
+from mancala_rules import (  # noqa: E402
+    apply_mancala_move,
+    initial_mancala_state,
+    legal_mancala_moves,
+    parse_state,
+    serialize_state,
+    sow,
+    to_board,
+)
+
+
+def state_for(player_pits, opponent_pits, player_store=0, opponent_store=0, turn="player"):
+    return serialize_state(
+        player_pits=player_pits,
+        opponent_pits=opponent_pits,
+        player_store=player_store,
+        opponent_store=opponent_store,
+        turn=turn,
+        status="in_progress",
+        last_action="-",
+        winner="-",
+    )
+
+
+def exhaustive_margin(state):
+    parsed = parse_state(state)
+    mover = parsed["turn"]
+    best = None
+    for pit in legal_mancala_moves(state):
+        after = parse_state(apply_mancala_move(state, pit).state)
+        if after["status"] != "in_progress":
+            margin = after["player_store"] - after["opponent_store"]
+            margin = margin if mover == "player" else -margin
+        else:
+            value = exhaustive_margin(apply_mancala_move(state, pit).state)
+            margin = value if after["turn"] == mover else -value
+        best = margin if best is None else max(best, margin)
+    return best
+
+
+def test_sow_wraps_whole_laps_at_once():
+    board = to_board([0, 0, 0, 0, 0, 27], [0] * 6, 0, 0)
+    last_slot, captured = sow(board, 5)
+    assert last_slot == (5 + 27) % 13
+    assert sum(board) == 27
+    assert board[13] == 0
+    assert board[5] == 2
+    assert captured == 0
+
+
+def test_flip_round_trips_and_swaps_sides():
+    board = tuple(to_board([1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12], 13, 14))
+    flipped = flip(board)
+    assert flipped[:6] == (7, 8, 9, 10, 11, 12)
+    assert flipped[6] == 14
+    assert flip(flipped) == board
+
+
+def test_play_matches_rules_module():
+    rng = random.Random(11)
+    state = initial_mancala_state()
+    while parse_state(state)["status"] == "in_progress":
+        pit = rng.choice(legal_mancala_moves(state))
+        child, _ = play(board_from_state(state), pit - 1)
+        state = apply_mancala_move(state, pit).state
+        if parse_state(state)["status"] == "in_progress":
+            expected = board_from_state(state)
+            assert child == expected
+
+
+def test_endgame_scores_are_exact():
+    rng = random.Random(4)
+    for _ in range(40):
+        player_pits = [0] * 6
+        opponent_pits = [0] * 6
+        player_pits[rng.randrange(6)] = 1
+        opponent_pits[rng.randrange(6)] = 1
+        for _ in range(rng.randint(0, 5)):
+            (player_pits if rng.random() < 0.5 else opponent_pits)[rng.randrange(6)] += 1
+        state = state_for(player_pits, opponent_pits, rng.randint(0, 20), rng.randint(0, 20))
+        result = search_mancala(state, 1000)
+        assert result.pits[0].exact
+        assert result.pits[0].score == exhaustive_margin(state)
+
+
+def test_ranks_every_legal_pit_for_either_side():
+    state = state_for([4, 4, 0, 5, 5, 5], [4, 4, 4, 4, 4, 4], 1, 0, turn="opponent")
+    result = search_mancala(state, 50)
+    assert sorted(entry.pit for entry in result.pits) == legal_mancala_moves(state)
+    assert result.best_pit == result.pits[0].pit
+    assert result.depth >= 1
+
+
+def test_prefers_the_capture():
+    state = state_for([1, 0, 0, 0, 2, 0], [0, 0, 0, 0, 9, 1], 10, 10)
+    result = search_mancala(state, 200)
+    assert result.best_pit == 1
+    assert "capture10" in apply_mancala_move(state, 1).last_action
+
+
+def test_finished_game_has_no_pits():
+    state = initial_mancala_state().replace("ST:in_progress", "ST:game_over")
+    assert search_mancala(state).pits == []
+
+
+def test_concurrent_searches_do_not_wait_for_each_other():
+    searcher = MancalaSearch()
+    initial = initial_mancala_state()
+    states = [
+        apply_mancala_move(initial, move).state for move in legal_mancala_moves(initial)
+    ]
+    budget_ms = 300
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(states)) as pool:
+        results = list(pool.map(lambda state: searcher.search(state, budget_ms), states))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    # Serialized searches would take six budgets, and the later ones would
+    # find their deadline gone after queueing for the first.
+    assert elapsed_ms < 3 * budget_ms
+    assert all(result.depth >= 5 for result in results)
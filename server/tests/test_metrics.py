@@ -0,0 +1,164 @@
+import asyncio
+from pathlib import Path
+import sys
+
+from fastmcp import Client, FastMCP
+from starlette.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import app as app_module  # noqa: E402
+from metrics import (  # noqa: E402
+    MetricsRegistry,
+    ToolMetricsMiddleware,
+    create_registry,
+    game_type_of,
+    record_phase,
+    record_resource_read,
+    record_tool_call,
+)
+import run_http  # noqa: E402
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    registry.histogram("latency_seconds", "Latency.", (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        registry.observe("latency_seconds", {"tool": "a"}, value)
+
+    text = registry.render()
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{tool="a",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{tool="a",le="1"} 3' in text
+    assert 'latency_seconds_bucket{tool="a",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{tool="a"} 4' in text
+    assert 'latency_seconds_sum{tool="a"} 3.65' in text
+
+
+def test_counter_escapes_label_values():
+    registry = MetricsRegistry()
+    registry.counter("reads_total", "Reads.")
+    registry.inc("reads_total", {"uri": 'ui://"x"\n'}, 2)
+    assert 'reads_total{uri="ui://\\"x\\"\\n"} 2' in registry.render()
+
+
+def test_game_type_prefers_payload_then_tool_name():
+    assert game_type_of("choose_four_in_a_row_opponent_move") == "four_in_a_row"
+    assert game_type_of("spin_slot_batch") == "slot"
+    assert game_type_of("whatever", {"gameType": "chess"}) == "chess"
+    assert game_type_of("whatever") == "unknown"
+
+
+def test_record_tool_call_counts_errors_and_illegal_moves():
+    registry = create_registry()
+    labels = {"tool": "apply_chess_move", "game_type": "chess"}
+    record_tool_call(
+        "apply_chess_move", {"move": "e2e4"}, {"legal": True}, 0.01, registry=registry
+    )
+    record_tool_call(
+        "apply_chess_move",
+        {"move": "e2e5"},
+        {"legal": False, "error": "Illegal move."},
+        0.02,
+        registry=registry,
+    )
+    record_tool_call("apply_chess_move", {}, None, 0.03, raised=True, registry=registry)
+
+    assert registry.value("mcp_tool_calls_total", labels) == 3
+    assert registry.value("mcp_tool_errors_total", labels) == 2
+    assert registry.value("mcp_tool_illegal_total", labels) == 1
+    assert registry.value("mcp_tool_duration_seconds", labels) == 3
+
+
+def test_phase_and_resource_metrics():
+    registry = create_registry()
+    record_phase("slot_statistics", "compute", 0.2, registry=registry)
+    record_resource_read("ui://widget/a.html", 2048, 0.001, registry=registry)
+    record_resource_read("ui://widget/a.html", 0, 0.001, raised=True, registry=registry)
+
+    phase = {"tool": "slot_statistics", "game_type": "slot", "phase": "compute"}
+    resource = {"uri": "ui://widget/a.html"}
+    assert registry.value("mcp_tool_phase_duration_seconds", phase) == 1
+    assert registry.value("mcp_resource_reads_total", resource) == 2
+    assert registry.value("mcp_resource_errors_total", resource) == 1
+    assert registry.value("mcp_resource_response_bytes", resource) == 1
+
+
+def test_middleware_times_tool_calls():
+    registry = create_registry()
+    server = FastMCP("metrics-test")
+    server.add_middleware(ToolMetricsMiddleware(registry))
+
+    @server.tool()
+    def roll_rpg_dice(sides: int) -> dict:
+        return {"gameType": "rpg_dice", "legal": sides > 0}
+
+    async def call() -> None:
+        async with Client(server) as client:
+            await client.call_tool("roll_rpg_dice", {"sides": 6})
+            await client.call_tool("roll_rpg_dice", {"sides": 0})
+            await client.call_tool("no_such_tool", {}, raise_on_error=False)
+
+    asyncio.run(call())
+
+    labels = {"tool": "roll_rpg_dice", "game_type": "rpg_dice"}
+    assert registry.value("mcp_tool_calls_total", labels) == 2
+    assert registry.value("mcp_tool_illegal_total", labels) == 1
+    unknown = {"tool": "unknown", "game_type": "unknown"}
+    assert registry.value("mcp_tool_errors_total", unknown) == 1
+
+
+def test_middleware_samples_payload_sizes():
+    registry = create_registry()
+    server = FastMCP("metrics-test")
+    server.add_middleware(ToolMetricsMiddleware(registry, size_sample_every=3))
+
+    @server.tool()
+    def roll_rpg_dice(sides: int) -> dict:
+        return {"gameType": "rpg_dice", "legal": True}
+
+    async def call() -> None:
+        async with Client(server) as client:
+            for _ in range(7):
+                await client.call_tool("roll_rpg_dice", {"sides": 6})
+
+    asyncio.run(call())
+
+    labels = {"tool": "roll_rpg_dice", "game_type": "rpg_dice"}
+    assert registry.value("mcp_tool_calls_total", labels) == 7
+    assert registry.value("mcp_tool_request_bytes", labels) == 3
+    assert registry.value("mcp_tool_response_bytes", labels) == 3
+
+
+def test_resource_reads_label_unregistered_uris_as_unknown():
+    widget = app_module.CHESS_WIDGET_URI
+
+    async def read() -> None:
+        async with Client(app_module.app) as client:
+            for uri in (widget, "ui://widget/a.html", "ui://widget/b.html"):
+                try:
+                    await client.read_resource(uri)
+                except Exception:
+                    pass  # unbuilt widgets fail the same way as unknown URIs
+
+    before = {
+        uri: app_module.METRICS.value("mcp_resource_reads_total", {"uri": uri})
+        for uri in (widget, "unknown", "ui://widget/a.html")
+    }
+    asyncio.run(read())
+
+    def reads(uri):
+        value = app_module.METRICS.value("mcp_resource_reads_total", {"uri": uri})
+        return value - before[uri]
+
+    assert reads(widget) == 1
+    assert reads("unknown") == 2
+    assert reads("ui://widget/a.html") == 0
+
+
+def test_metrics_route_serves_text_format():
+    with TestClient(run_http.create_app()) as client:
+        response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE mcp_tool_duration_seconds histogram" in response.text
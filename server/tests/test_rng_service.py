@@ -0,0 +1,145 @@
+import copy
+from pathlib import Path
+import pickle
+import random
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import rng_service  # noqa: E402
+from rng_service import CounterRandom, RngService  # noqa: E402
+from sea_battle_rules import initial_sea_battle_state  # noqa: E402
+from slot_rules import initial_slot_state, serialize_state, spin_slot  # noqa: E402
+
+
+def test_same_key_replays_the_same_stream():
+    first = CounterRandom(b"key")
+    second = CounterRandom(b"key")
+    assert [first.random() for _ in range(20)] == [second.random() for _ in range(20)]
+    assert CounterRandom(b"other").random() != CounterRandom(b"key").random()
+
+
+def test_seek_recomputes_any_draw_without_replaying():
+    rng = CounterRandom(b"key")
+    draws = [rng.random() for _ in range(50)]
+    assert rng.position == 50
+    for position in (0, 7, 8, 49):
+        rng.seek(position)
+        assert rng.random() == draws[position]
+
+    jumper = CounterRandom(b"key")
+    jumper.jumpahead(30)
+    assert jumper.random() == draws[30]
+    assert CounterRandom(b"key", position=12).random() == draws[12]
+
+
+def test_word_at_does_not_move_the_stream():
+    rng = CounterRandom(b"key")
+    word = rng.word_at(1_000_000_000)
+    assert rng.position == 0
+    assert CounterRandom(b"key").word_at(1_000_000_000) == word
+
+
+def test_random_methods_are_reproducible():
+    def sample(rng: random.Random) -> tuple:
+        cards = list(range(52))
+        rng.shuffle(cards)
+        return (
+            cards,
+            rng.choices("abc", k=5),
+            rng.randrange(1000),
+            rng.getrandbits(130),
+            rng.position,
+        )
+
+    assert sample(CounterRandom(b"key")) == sample(CounterRandom(b"key"))
+    rng = CounterRandom(b"key")
+    assert 0 <= rng.getrandbits(7) < 128
+    assert rng.getrandbits(0) == 0
+    assert all(0.0 <= rng.random() < 1.0 for _ in range(1000))
+
+
+def test_state_copy_and_pickle_keep_the_position():
+    rng = CounterRandom(b"key")
+    rng.random()
+    state = rng.getstate()
+    expected = rng.random()
+    rng.setstate(state)
+    assert rng.random() == expected
+
+    rng.seek(5)
+    for clone in (copy.copy(rng), pickle.loads(pickle.dumps(rng))):
+        assert clone.position == 5
+        assert clone.random() == CounterRandom(b"key", 5).random()
+
+
+def test_invalid_keys_and_positions():
+    with pytest.raises(ValueError):
+        CounterRandom(b"")
+    with pytest.raises(ValueError):
+        CounterRandom(b"k", position=-1)
+    with pytest.raises(ValueError):
+        RngService(b"")
+
+
+def test_service_streams_depend_on_secret_game_and_purpose():
+    service = RngService(b"secret")
+    again = RngService(b"secret")
+    assert service.key_for("g_1") == again.key_for("g_1")
+    assert service.key_for("g_1") != service.key_for("g_2")
+    assert service.key_for("g_1") != service.key_for("g_1", "slot")
+    assert service.key_for("g_1") != RngService(b"other").key_for("g_1")
+
+
+def test_game_stream_continues_across_calls_and_replays_from_start():
+    service = RngService(b"secret")
+    live = service.game_stream("g_1", "slot")
+    draws = [live.random() for _ in range(3)]
+    assert service.game_stream("g_1", "slot") is live
+    assert service.game_stream("g_1", "slot").random() == service.stream(
+        "g_1", "slot", position=3
+    ).random()
+    replay = service.stream("g_1", "slot")
+    assert [replay.random() for _ in range(3)] == draws
+
+
+def test_game_streams_are_bounded():
+    service = RngService(b"secret", max_streams=2)
+    first = service.game_stream("g_1")
+    service.game_stream("g_2")
+    service.game_stream("g_3")
+    assert service.game_stream("g_1") is not first
+
+
+def test_rules_replay_from_a_game_stream():
+    service = RngService(b"secret")
+    assert initial_sea_battle_state(service.stream("g_1")) == initial_sea_battle_state(
+        service.stream("g_1")
+    )
+    state = serialize_state(initial_slot_state(stack=100, bet=1))
+    spins = [spin_slot(state, service.stream("g_2", "slot", position=3)) for _ in "ab"]
+    assert spins[0]["legal"]
+    assert spins[0] == spins[1]
+
+
+def test_default_service_uses_the_secret_env(monkeypatch):
+    rng_service.rng_service.cache_clear()
+    monkeypatch.setenv(rng_service.SECRET_ENV_VAR, "replay-me")
+    try:
+        key = rng_service.rng_service().key_for("g_1")
+        assert key == RngService(b"replay-me").key_for("g_1")
+        assert rng_service.game_rng("g_1").key == key
+        assert rng_service.game_rng(None) is rng_service.shared_rng()
+    finally:
+        rng_service.rng_service.cache_clear()
+
+
+def test_fork_is_reproducible_and_advances_the_parent_a_fixed_amount():
+    rng = CounterRandom(b"key")
+    fork = rng.fork()
+    assert rng.position == 4
+    again = CounterRandom(b"key").fork()
+    assert [fork.random() for _ in range(10)] == [again.random() for _ in range(10)]
+    assert pickle.loads(pickle.dumps(fork)).random() == again.random()
@@ -0,0 +1,79 @@
+from collections import Counter
+from itertools import product
+from pathlib import Path
+import sys
+import time
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from rpg_dice_analysis import expression_distribution  # noqa: E402
+from rpg_dice_rules import parse_expression  # noqa: E402
+
+
+def _enumerate(text):
+    expression = parse_expression(text)
+    totals = Counter({expression.modifier: 1})
+    for group in expression.groups:
+        subtotals = Counter()
+        for rolls in product(range(1, group.sides + 1), repeat=group.count):
+            kept = rolls
+            if group.keep:
+                ordered = sorted(rolls, reverse=group.keep == "kh")
+                kept = ordered[: group.keep_count]
+            subtotals[group.sign * sum(kept)] += 1
+        combined = Counter()
+        for total, ways in totals.items():
+            for subtotal, more in subtotals.items():
+                combined[total + subtotal] += ways * more
+        totals = combined
+    outcomes = sum(totals.values())
+    return {total: ways / outcomes for total, ways in totals.items()}
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["4d6kh3+2", "2d20kl1", "3d6+1d4", "2d6-1d4", "4d6kl3", "-3d4kl2+1", "5d4kh2"],
+)
+def test_distribution_matches_enumeration(text):
+    distribution = expression_distribution(text)
+    expected = _enumerate(text)
+    assert distribution.minimum == min(expected)
+    assert distribution.maximum == max(expected)
+    for total in range(distribution.minimum - 1, distribution.maximum + 2):
+        assert distribution.probability(total) == pytest.approx(
+            expected.get(total, 0.0), abs=1e-12
+        )
+
+
+def test_distribution_summaries():
+    distribution = expression_distribution("2d6")
+    assert distribution.mean == pytest.approx(7.0)
+    assert distribution.std_dev == pytest.approx((35 / 6) ** 0.5)
+    assert distribution.probability(7) == pytest.approx(6 / 36)
+    assert distribution.at_least(10) == pytest.approx(6 / 36)
+    assert distribution.at_most(3) == pytest.approx(3 / 36)
+    assert distribution.at_least(2) == pytest.approx(1.0)
+    assert distribution.at_most(1) == 0.0
+
+
+def test_large_plain_groups_use_spectral_path():
+    started = time.perf_counter()
+    distribution = expression_distribution("996d6+4d6kh3")
+    assert time.perf_counter() - started < 2.0
+    assert distribution.minimum == 999
+    assert distribution.maximum == 5994
+    assert sum(distribution.probabilities) == pytest.approx(1.0)
+    assert distribution.mean == pytest.approx(3486 + 12.2446, abs=1e-3)
+    variance = 996 * 35 / 12 + 2.8468**2
+    assert distribution.std_dev == pytest.approx(variance**0.5, abs=1e-2)
+    assert min(distribution.probabilities) >= 0.0
+
+
+def test_distribution_is_cached_per_expression():
+    assert expression_distribution("8d6+1d4") is expression_distribution("8d6 + 1d4")
+
+
+def test_oversized_keep_group_has_no_distribution():
+    assert expression_distribution("1000d100kh500") is None
@@ -1,11 +1,19 @@
 from pathlib import Path
+import random
 import sys
 
 import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from rpg_dice_rules import roll_dice  # noqa: E402
+from rpg_dice_rules import (  # noqa: E402
+    MAX_ROLLS,
+    DiceGroup,
+    dice_expression,
+    parse_expression,
+    roll_dice,
+    roll_expression,
+)
 
 
 def test_roll_dice_valid():
@@ -24,3 +32,65 @@ def test_roll_dice_invalid_sides():
 def test_roll_dice_invalid_count():
     with pytest.raises(ValueError):
         roll_dice(sides=6, count=0)
+
+
+def test_parse_expression_groups_keep_and_modifier():
+    expression = parse_expression("4d6kh3 + 2")
+    assert expression.groups == (DiceGroup(4, 6, "kh", 3, 1),)
+    assert expression.modifier == 2
+    assert str(expression) == "4d6kh3+2"
+
+    expression = parse_expression("8d6+1d4-d20kl1-3")
+    assert [group.notation for group in expression.groups] == ["8d6", "1d4", "1d20"]
+    assert [group.sign for group in expression.groups] == [1, 1, -1]
+    assert expression.modifier == -3
+    assert expression.dice == 10
+
+
+def test_parse_expression_defaults_keep_count_and_drops_full_keep():
+    assert parse_expression("2d20kh").groups[0].keep_count == 1
+    assert parse_expression("3d6kh3").groups[0].keep is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "d", "2d7", "0d6", "4d6kh5", "4d6kh0", "2d6 3", "2d6*2", "abc", "5"],
+)
+def test_parse_expression_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        parse_expression(text)
+
+
+def test_parse_expression_limits_total_dice():
+    parse_expression(f"{MAX_ROLLS}d6")
+    with pytest.raises(ValueError):
+        parse_expression(f"{MAX_ROLLS}d6+1d4")
+
+
+def test_roll_expression_keeps_highest_and_lowest():
+    result = roll_expression("4d6kh3+2", random.Random(3))
+    group = result.groups[0]
+    assert len(group.rolls) == 4
+    assert group.kept == sorted(group.rolls, reverse=True)[:3]
+    assert result.total == sum(group.kept) + 2
+
+    result = roll_expression("2d20kl1-1d4", random.Random(5))
+    lowest, penalty = result.groups
+    assert lowest.kept == [min(lowest.rolls)]
+    assert penalty.subtotal == -sum(penalty.rolls)
+    assert result.total == lowest.kept[0] + penalty.subtotal
+    assert result.rolls == lowest.rolls + penalty.rolls
+
+
+def test_roll_expression_bulk_rolls_stay_in_range():
+    result = roll_expression(f"{MAX_ROLLS}d6", random.Random(1))
+    assert len(result.rolls) == MAX_ROLLS
+    assert set(result.rolls) == {1, 2, 3, 4, 5, 6}
+
+
+def test_dice_expression_validates_like_roll_dice():
+    assert str(dice_expression(sides=20, count=2)) == "2d20"
+    with pytest.raises(ValueError):
+        dice_expression(sides=7)
+    with pytest.raises(ValueError):
+        dice_expression(sides=6, count=0)
@@ -0,0 +1,51 @@
+from pathlib import Path
+import sys
+
+import pytest
+from starlette.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import run_http  # noqa: E402
+
+
+def test_worker_count_reads_environment(monkeypatch):
+    monkeypatch.delenv("HTTP_WORKERS", raising=False)
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    assert run_http.worker_count() == 1
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    assert run_http.worker_count() == 3
+    monkeypatch.setenv("HTTP_WORKERS", "0")
+    assert run_http.worker_count() == 1
+
+
+def test_health_endpoint_and_mcp_route(monkeypatch):
+    monkeypatch.setenv("HTTP_WORKERS", "2")
+    monkeypatch.delenv("MCP_STATELESS_HTTP", raising=False)
+    asgi_app = run_http.create_app()
+    paths = {getattr(route, "path", None) for route in asgi_app.routes}
+    assert {"/healthz", "/mcp"} <= paths
+
+    with TestClient(asgi_app) as client:
+        response = client.get("/healthz")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert body["pendingTools"] == 0
+
+
+def test_several_workers_require_the_rng_secret(monkeypatch):
+    monkeypatch.delenv("GAME_RNG_SECRET", raising=False)
+    run_http.check_worker_environment(1)
+    with pytest.raises(ValueError, match="GAME_RNG_SECRET"):
+        run_http.check_worker_environment(2)
+    monkeypatch.setenv("GAME_RNG_SECRET", "shared")
+    run_http.check_worker_environment(2)
+
+
+def test_main_refuses_to_start_workers_without_the_secret(monkeypatch):
+    monkeypatch.setenv("HTTP_WORKERS", "2")
+    monkeypatch.delenv("GAME_RNG_SECRET", raising=False)
+    monkeypatch.setattr(run_http.uvicorn, "run", pytest.fail)
+    with pytest.raises(SystemExit):
+        run_http.main()
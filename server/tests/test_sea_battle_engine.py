@@ -0,0 +1,77 @@
+from pathlib import Path
+import random
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sea_battle_engine import (  # noqa: E402
+    ALL_PLACEMENTS,
+    placement_densities,
+    target_cells,
+)
+from sea_battle_rules import serialize_state  # noqa: E402
+
+EMPTY_ROW = ".........."
+
+
+def board(rows):
+    grid = [list(row) for row in rows] + [list(EMPTY_ROW)] * (10 - len(rows))
+    return grid
+
+
+def opponent_turn_state(player_rows, fog_rows):
+    return serialize_state(
+        player_board=board(player_rows),
+        opponent_board=board([]),
+        fog_board=board([]),
+        turn="opponent",
+        status="in_progress",
+        last_action="-",
+        winner="-",
+        opponent_fog=board(fog_rows),
+    )
+
+
+def test_placement_counts():
+    assert ALL_PLACEMENTS[5].bit_count() == 2 * 10 * 6
+    assert ALL_PLACEMENTS[2].bit_count() == 2 * 10 * 9
+    hunt, target = placement_densities(0, 0, [2])
+    assert hunt[0] == 2
+    assert hunt[55] == 4
+    assert not any(target)
+
+
+def test_hunt_mode_prefers_the_centre():
+    result = target_cells(opponent_turn_state([], []), random.Random(1))
+    assert result.mode == "hunt"
+    assert len(result.cells) == 100
+    assert result.cells[0].coord in {"E5", "F5", "E6", "F6"}
+    assert abs(sum(cell.weight for cell in result.cells) - 1) < 0.01
+
+
+def test_target_mode_follows_the_hit_line():
+    player_rows = ["..........", "...HSSS..."]
+    fog_rows = ["..........", "..MH......"]
+    result = target_cells(opponent_turn_state(player_rows, fog_rows), random.Random(2))
+    assert result.mode == "target"
+    assert result.cells[0].coord in {"E2", "D1", "D3"}
+    assert "D2" not in {cell.coord for cell in result.cells}
+
+
+def test_sunk_ships_leave_the_fleet():
+    player_rows = ["HH........", "..........", "....SSSSS."]
+    fog_rows = ["HH........"]
+    result = target_cells(opponent_turn_state(player_rows, fog_rows), random.Random(3))
+    assert result.mode == "hunt"
+    assert result.remaining_fleet == [5, 4, 3, 3]
+
+
+def test_ties_are_broken_randomly():
+    state = opponent_turn_state([], [])
+    firsts = {target_cells(state, random.Random(seed)).cells[0].coord for seed in range(20)}
+    assert len(firsts) > 1
+
+
+def test_finished_game_has_no_targets():
+    state = opponent_turn_state([], []).replace("ST:in_progress", "ST:game_over")
+    assert target_cells(state).cells == []
@@ -77,3 +77,15 @@ def _coord_to_index(coord: str) -> tuple[int, int]:
     file = coord[0].upper()
     rank = int(coord[1:])
     return rank - 1, "ABCDEFGHIJ".index(file)
+
+
+def test_parsed_states_are_played_on_a_copy():
+    state = initial_sea_battle_state()
+    parsed = parse_state(state)
+    result = apply_sea_battle_move(state, "A1", parsed=parsed)
+    assert result == apply_sea_battle_move(state, "A1")
+    assert parse_state(state) == parsed
+    assert result.parsed == parse_state(result.state)
+    assert legal_sea_battle_moves(result.state, parsed=result.parsed) == (
+        legal_sea_battle_moves(result.state)
+    )
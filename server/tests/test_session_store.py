@@ -0,0 +1,185 @@
+import logging
+from pathlib import Path
+import sqlite3
+import sys
+import time
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from session_store import (  # noqa: E402
+    InMemorySessionStore,
+    SQLiteSessionStore,
+    create_session_store,
+    decode_state,
+    encode_state,
+)
+
+
+def test_save_and_get_round_trip():
+    store = InMemorySessionStore()
+    store.save("g_1", "chess", "fen-1")
+    session = store.get("g_1")
+    assert session.game_type == "chess"
+    assert session.state == "fen-1"
+    store.save("g_1", "chess", "fen-2")
+    assert store.get("g_1").state == "fen-2"
+    assert len(store) == 1
+
+
+def test_least_recently_used_game_is_evicted():
+    store = InMemorySessionStore(max_sessions=2)
+    store.save("g_1", "chess", "a")
+    store.save("g_2", "chess", "b")
+    store.get("g_1")
+    store.save("g_3", "chess", "c")
+    assert store.get("g_2") is None
+    assert store.get("g_1").state == "a"
+    assert store.get("g_3").state == "c"
+
+
+def test_idle_sessions_expire():
+    now = [0.0]
+    store = InMemorySessionStore(ttl_seconds=10, clock=lambda: now[0])
+    store.save("g_1", "checkers", "state")
+    now[0] = 8.0
+    assert store.get("g_1") is not None
+    now[0] = 16.0
+    assert store.get("g_1") is not None
+    now[0] = 30.0
+    assert store.get("g_1") is None
+    assert len(store) == 0
+
+
+def test_factory_backends():
+    assert create_session_store("none") is None
+    assert isinstance(create_session_store("memory"), InMemorySessionStore)
+    with pytest.raises(ValueError):
+        create_session_store("redis")
+    with pytest.raises(ValueError):
+        create_session_store("sqlite")
+
+
+def test_state_encoding_round_trip():
+    short = "G:.../.../...|T:player"
+    long = "S:" + ",".join(["AS", "KD", "7C"] * 100) + "|ST:in_progress"
+    assert encode_state(short)[:1] == b"\x00"
+    assert encode_state(long)[:1] == b"\x01"
+    assert len(encode_state(long)) < len(long)
+    assert decode_state(encode_state(short)) == short
+    assert decode_state(encode_state(long)) == long
+
+
+def test_sqlite_store_survives_reopen(tmp_path):
+    path = tmp_path / "sessions.db"
+    store = SQLiteSessionStore(path, batch_size=100, flush_interval=60)
+    store.save("g_1", "chess", "fen-1")
+    store.save("g_1", "chess", "fen-2")
+    assert store.get("g_1").state == "fen-2"
+    store.close()
+
+    reopened = SQLiteSessionStore(path)
+    try:
+        session = reopened.get("g_1")
+        assert session.game_type == "chess"
+        assert session.state == "fen-2"
+        reopened.delete("g_1")
+        assert reopened.get("g_1") is None
+    finally:
+        reopened.close()
+
+
+def test_sqlite_batches_are_visible_to_other_connections(tmp_path):
+    path = tmp_path / "sessions.db"
+    writer = SQLiteSessionStore(path, batch_size=2, flush_interval=60)
+    reader = SQLiteSessionStore(path)
+    try:
+        writer.save("g_1", "checkers", "a")
+        assert reader.get("g_1") is None
+        writer.save("g_2", "checkers", "b")
+        assert reader.get("g_1").state == "a"
+        assert reader.get("g_2").state == "b"
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_sqlite_flushes_pending_writes_after_interval(tmp_path):
+    path = tmp_path / "sessions.db"
+    writer = SQLiteSessionStore(path, batch_size=100, flush_interval=0.01)
+    reader = SQLiteSessionStore(path)
+    try:
+        writer.save("g_1", "slot", "state")
+        deadline = time.monotonic() + 2
+        while reader.get("g_1") is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert reader.get("g_1").state == "state"
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_sqlite_sessions_expire(tmp_path):
+    now = [1000.0]
+    store = SQLiteSessionStore(
+        tmp_path / "sessions.db", ttl_seconds=10, batch_size=1, clock=lambda: now[0]
+    )
+    try:
+        store.save("g_1", "mancala", "state")
+        now[0] = 1005.0
+        assert store.get("g_1") is not None
+        now[0] = 1020.0
+        assert store.get("g_1") is None
+        assert len(store) == 0
+    finally:
+        store.close()
+
+
+def test_sqlite_reads_refresh_expiry(tmp_path):
+    now = [1000.0]
+    path = tmp_path / "sessions.db"
+    store = SQLiteSessionStore(path, ttl_seconds=10, batch_size=1, clock=lambda: now[0])
+    try:
+        store.save("g_1", "mancala", "state")
+        now[0] = 1008.0
+        assert store.get("g_1") is not None
+        store.flush()
+        now[0] = 1015.0
+        # Seven seconds after the read, although fifteen after the write.
+        reopened = SQLiteSessionStore(path, ttl_seconds=10, clock=lambda: now[0])
+        try:
+            assert reopened.get("g_1") is not None
+        finally:
+            reopened.close()
+        assert store.get("g_1") is not None
+        now[0] = 1030.0
+        assert store.get("g_1") is None
+    finally:
+        store.close()
+
+
+def test_sqlite_flush_errors_do_not_stop_the_flusher(tmp_path, caplog):
+    store = SQLiteSessionStore(
+        tmp_path / "sessions.db", batch_size=100, flush_interval=0.01
+    )
+    flush = store.flush
+    failures = []
+
+    def flaky_flush():
+        if not failures:
+            failures.append(True)
+            raise sqlite3.OperationalError("database is locked")
+        flush()
+
+    store.flush = flaky_flush
+    try:
+        with caplog.at_level(logging.ERROR, logger="session_store"):
+            store.save("g_1", "slot", "state")
+            deadline = time.monotonic() + 2
+            while store._pending and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert failures and not store._pending
+        assert "Flushing game sessions" in caplog.text
+    finally:
+        store.close()
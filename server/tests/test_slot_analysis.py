@@ -0,0 +1,63 @@
+from itertools import product
+from pathlib import Path
+import random
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from slot_analysis import paytable_statistics, simulate_sessions  # noqa: E402
+from slot_rules import (  # noqa: E402
+    PAYOUT_MULTIPLIERS,
+    SYMBOL_WEIGHTS,
+    SYMBOLS,
+)
+
+
+def test_paytable_statistics_match_reel_enumeration():
+    total_weight = sum(SYMBOL_WEIGHTS.values()) ** 3
+    mean = second = hits = 0.0
+    for reels in product(SYMBOLS, repeat=3):
+        probability = 1.0
+        for symbol in reels:
+            probability *= SYMBOL_WEIGHTS[symbol]
+        probability /= total_weight
+        multiplier = PAYOUT_MULTIPLIERS[reels[0]] if len(set(reels)) == 1 else 0
+        mean += probability * multiplier
+        second += probability * multiplier**2
+        hits += probability if multiplier else 0.0
+
+    stats = paytable_statistics()
+    assert stats.rtp == pytest.approx(mean)
+    assert stats.house_edge == pytest.approx(1 - mean)
+    assert stats.variance == pytest.approx(second - mean * mean)
+    assert stats.hit_frequency == pytest.approx(hits)
+    assert [odds.symbol for odds in stats.outcomes][0] == "7"
+
+
+def test_simulated_return_converges_to_rtp():
+    result = simulate_sessions(
+        1000, 1, sessions=200, max_spins=1000, budget_ms=5000, rng=random.Random(3)
+    )
+    assert result.sessions == 200
+    assert result.spins == 200_000
+    assert result.risk_of_ruin == 0.0
+    assert result.median_spins == 1000
+    assert result.observed_rtp == pytest.approx(paytable_statistics().rtp, abs=0.01)
+    assert result.mean_final_stack == pytest.approx(result.observed_rtp * 1000)
+
+
+def test_small_stacks_are_ruined():
+    result = simulate_sessions(
+        50, 10, sessions=500, max_spins=1000, budget_ms=5000, rng=random.Random(8)
+    )
+    assert result.risk_of_ruin == 1.0
+    # Five losing spins is the shortest possible session.
+    assert result.median_spins >= 5
+    assert result.mean_final_stack < 10
+
+
+def test_simulation_validates_stack_and_bet():
+    with pytest.raises(ValueError, match="exceed"):
+        simulate_sessions(5, 10)
@@ -1,4 +1,5 @@
 from pathlib import Path
+import random
 import sys
 
 import pytest
@@ -7,8 +8,10 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from slot_rules import (  # noqa: E402
     initial_slot_state,
+    parse_state,
     serialize_state,
     spin_slot,
+    spin_slot_batch,
 )
 
 
@@ -45,3 +48,50 @@ def test_initial_slot_state_invalid_inputs():
         initial_slot_state(stack=10, bet=0)
     with pytest.raises(ValueError):
         initial_slot_state(stack=5, bet=10)
+
+
+def test_batch_matches_repeated_single_spins():
+    state_str = serialize_state(initial_slot_state(stack=100, bet=1))
+    batch = spin_slot_batch(state_str, 25, rng=random.Random(4))
+    assert batch["legal"] is True
+    assert batch["spinCount"] == 25
+    assert batch["stoppedBy"] == "count"
+
+    rng = random.Random(4)
+    single = state_str
+    for spin in batch["spins"]:
+        result = spin_slot(single, rng=rng)
+        assert result["reels"] == spin["reels"]
+        assert result["payout"] == spin["payout"]
+        single = result["state"]
+    assert single == batch["state"]
+    assert batch["net"] == batch["totalPayout"] - batch["totalBet"]
+    assert parse_state(batch["state"]).stack == 100 + batch["net"]
+
+
+def test_batch_stop_conditions():
+    state_str = serialize_state(initial_slot_state(stack=1000, bet=10))
+    win = spin_slot_batch(state_str, 1000, stop_on_win=True, rng=random.Random(1))
+    assert win["stoppedBy"] == "win"
+    assert win["spins"][-1]["payout"] > 0
+    assert all(spin["payout"] == 0 for spin in win["spins"][:-1])
+
+    loss = spin_slot_batch(state_str, 1000, loss_limit=50, rng=random.Random(1))
+    assert loss["stoppedBy"] == "loss_limit"
+    assert -loss["net"] >= 50
+
+    below = spin_slot_batch(state_str, 1000, stop_below=900, rng=random.Random(1))
+    assert below["stoppedBy"] == "stack_below"
+    assert below["stack"] <= 900
+
+    small = serialize_state(initial_slot_state(stack=30, bet=10))
+    exhausted = spin_slot_batch(small, 1000, rng=random.Random(2))
+    assert exhausted["stoppedBy"] == "stack_exhausted"
+    assert exhausted["stack"] < 10
+
+
+def test_batch_rejects_invalid_counts_and_limits():
+    state_str = serialize_state(initial_slot_state(stack=100, bet=10))
+    assert spin_slot_batch(state_str, 0)["legal"] is False
+    assert spin_slot_batch(state_str, 1001)["legal"] is False
+    assert spin_slot_batch(state_str, 5, loss_limit=-1)["legal"] is False
@@ -0,0 +1,73 @@
+from pathlib import Path
+import random
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from tic_tac_toe_engine import (  # noqa: E402
+    VALUE_TABLE,
+    choose_move,
+    ranked_moves,
+)
+from tic_tac_toe_rules import (  # noqa: E402
+    apply_tic_tac_toe_move,
+    initial_tic_tac_toe_state,
+    parse_state,
+)
+
+
+def state_for(grid, turn="player", player="X", opponent="O"):
+    return f"G:{grid}|T:{turn}|ST:in_progress|LA:-|W:-|P:{player}|O:{opponent}"
+
+
+def test_table_covers_every_reachable_position():
+    assert len(VALUE_TABLE) == 5478
+    assert VALUE_TABLE[0] == 0
+
+
+def test_empty_board_is_a_draw_for_every_move():
+    ranked = ranked_moves(initial_tic_tac_toe_state())
+    assert len(ranked) == 9
+    assert {move.outcome for move in ranked} == {"draw"}
+
+
+def test_immediate_win_ranks_first():
+    ranked = ranked_moves(state_for("XX./OO./..."))
+    assert ranked[0].coord == "C1"
+    assert ranked[0].outcome == "win"
+    assert ranked[1].coord == "C2"
+    assert ranked[1].outcome == "draw"
+    assert ranked[-1].outcome == "loss"
+
+
+def test_ranking_follows_the_side_to_move():
+    ranked = ranked_moves(state_for("XX./OO./...", turn="opponent"))
+    assert ranked[0].coord == "C2"
+    assert ranked[0].outcome == "win"
+
+
+def test_finished_game_has_no_moves():
+    state = state_for("XXX/OO./...").replace("ST:in_progress", "ST:game_over")
+    assert ranked_moves(state) == []
+    assert choose_move(state) is None
+
+
+def test_perfect_opponent_never_loses():
+    rng = random.Random(7)
+    for game in range(40):
+        state = initial_tic_tac_toe_state("X" if game % 2 else "O")
+        while parse_state(state)["status"] == "in_progress":
+            turn = parse_state(state)["turn"]
+            if turn == "player":
+                move = rng.choice([move.coord for move in ranked_moves(state)])
+            else:
+                move = choose_move(state, "perfect", rng)
+            state = apply_tic_tac_toe_move(state, move).state
+        assert parse_state(state)["winner"] != "player"
+
+
+def test_unknown_difficulty_is_rejected():
+    with pytest.raises(ValueError):
+        choose_move(initial_tic_tac_toe_state(), "impossible")
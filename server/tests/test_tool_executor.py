@@ -0,0 +1,110 @@
+import asyncio
+from pathlib import Path
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from tool_executor import (  # noqa: E402
+    EXECUTOR_INLINE,
+    EXECUTOR_PROCESS,
+    ToolBusyError,
+    ToolExecutor,
+    ToolTimeoutError,
+    create_tool_executor,
+    parse_timeouts,
+)
+
+
+def _wait(event: threading.Event) -> str:
+    event.wait(5)
+    return "done"
+
+
+def test_thread_executor_runs_off_the_event_loop():
+    executor = ToolExecutor(max_workers=2)
+
+    async def main():
+        loop_thread = threading.get_ident()
+        worker_thread = await executor.run("tool", threading.get_ident)
+        return loop_thread, worker_thread
+
+    try:
+        loop_thread, worker_thread = asyncio.run(main())
+    finally:
+        executor.shutdown()
+    assert loop_thread != worker_thread
+    assert executor.pending == 0
+
+
+def test_inline_executor_runs_on_the_caller():
+    executor = create_tool_executor(EXECUTOR_INLINE)
+    assert asyncio.run(executor.run("tool", threading.get_ident)) == threading.get_ident()
+
+
+def test_full_pool_rejects_with_backpressure():
+    executor = ToolExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def main():
+        running = asyncio.ensure_future(executor.run("slow", _wait, release))
+        queued = asyncio.ensure_future(executor.run("slow", _wait, release))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ToolBusyError) as busy:
+            await executor.run("slow", _wait, release)
+        release.set()
+        return busy.value, await running, await queued
+
+    try:
+        busy, first, second = asyncio.run(main())
+    finally:
+        release.set()
+        executor.shutdown()
+    assert busy.retry_after_ms > 0
+    assert (first, second) == ("done", "done")
+    assert executor.pending == 0
+
+
+def test_timeout_keeps_the_slot_until_the_work_finishes():
+    executor = ToolExecutor(max_workers=1, max_queue=0, timeouts={"slow": 0.05})
+    release = threading.Event()
+
+    async def main():
+        with pytest.raises(ToolTimeoutError):
+            await executor.run("slow", _wait, release)
+        with pytest.raises(ToolBusyError):
+            await executor.run("other", _wait, release)
+        release.set()
+        deadline = time.monotonic() + 5
+        while executor.pending and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        return await executor.run("other", str.upper, "ok")
+
+    try:
+        assert asyncio.run(main()) == "OK"
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_process_executor_runs_module_functions():
+    executor = ToolExecutor(EXECUTOR_PROCESS, max_workers=1)
+    try:
+        assert asyncio.run(executor.run("tool", sorted, [3, 1, 2])) == [1, 2, 3]
+    finally:
+        executor.shutdown()
+
+
+def test_timeouts_and_kinds_are_validated():
+    assert parse_timeouts("slot_statistics=20, legal_chess_moves=2.5,") == {
+        "slot_statistics": 20.0,
+        "legal_chess_moves": 2.5,
+    }
+    assert ToolExecutor(EXECUTOR_INLINE, timeouts={"a": 1}).timeout_for("a") == 1
+    with pytest.raises(ValueError):
+        parse_timeouts("slot_statistics")
+    with pytest.raises(ValueError):
+        create_tool_executor("fibers")
@@ -0,0 +1,337 @@
+import asyncio
+from pathlib import Path
+import sys
+import threading
+
+from fastmcp import Client, FastMCP
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import blackjack_analysis  # noqa: E402
+import blackjack_rules  # noqa: E402
+import blackjack_strategy  # noqa: E402
+import rng_service  # noqa: E402
+import sea_battle_engine  # noqa: E402
+import sea_battle_rules  # noqa: E402
+import tools  # noqa: E402
+from rng_service import SECRET_ENV_VAR  # noqa: E402
+from session_store import InMemorySessionStore  # noqa: E402
+from slot_rules import spin_slot  # noqa: E402
+from tool_executor import (  # noqa: E402
+    EXECUTOR_INLINE,
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    ToolExecutor,
+)
+from tools import RNG_STREAM_GAME_TYPE, _stream_session_id, register_tools  # noqa: E402
+
+
+def _app(sessions=None, executor=None):
+    app = FastMCP("test")
+    register_tools(
+        app, sessions=sessions, executor=executor or ToolExecutor(EXECUTOR_INLINE)
+    )
+    return app
+
+
+def _call(app, name, **arguments):
+    async def main():
+        async with Client(app) as client:
+            result = await client.call_tool(name, arguments, raise_on_error=False)
+            return result.structured_content
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def fixed_secret(monkeypatch):
+    monkeypatch.setenv(SECRET_ENV_VAR, "test-secret")
+    rng_service.rng_service.cache_clear()
+    yield
+    rng_service.rng_service.cache_clear()
+
+
+def _stream_position(sessions, game_id, purpose):
+    session = sessions.get(_stream_session_id(game_id, purpose))
+    assert session.game_type == RNG_STREAM_GAME_TYPE
+    return int(session.state)
+
+
+def test_game_stream_resumes_from_the_session_store_after_a_restart(fixed_secret):
+    sessions = InMemorySessionStore()
+    app = _app(sessions)
+    game_id = _call(app, "new_slot_game")["gameId"]
+    first = _call(app, "spin_slot", gameId=game_id)["state"]
+    position = _stream_position(sessions, game_id, "slot")
+    assert position > 0
+
+    # A restart (or another worker) starts with no live streams at all.
+    rng_service.rng_service.cache_clear()
+    second = _call(app, "spin_slot", gameId=game_id)["state"]
+    replay = rng_service.rng_service().stream(game_id, "slot", position)
+    assert second == spin_slot(first, replay)["state"]
+    assert _stream_position(sessions, game_id, "slot") == replay.position
+
+
+def test_game_stream_survives_live_stream_eviction(fixed_secret):
+    sessions = InMemorySessionStore()
+    app = _app(sessions)
+    game_id = _call(app, "new_slot_game")["gameId"]
+    _call(app, "spin_slot", gameId=game_id)
+    position = _stream_position(sessions, game_id, "slot")
+    live = rng_service.rng_service().game_stream(game_id, "slot")
+    live.seek(0)  # what a freshly rebuilt stream would look like
+    _call(app, "spin_slot", gameId=game_id)
+    assert _stream_position(sessions, game_id, "slot") > position
+
+
+def test_opponent_choices_draw_from_the_game_stream(fixed_secret):
+    sessions = InMemorySessionStore()
+    app = _app(sessions)
+    game_id = _call(app, "new_tic_tac_toe_game")["gameId"]
+    choice = _call(
+        app, "choose_tic_tac_toe_opponent_move", gameId=game_id, difficulty="easy"
+    )
+    assert choice["suggestedMove"] in choice["moves"]
+    assert _stream_position(sessions, game_id, "tic_tac_toe") > 0
+
+    game_id = _call(app, "new_sea_battle_game")["gameId"]
+    placed = _stream_position(sessions, game_id, "sea_battle")
+    choice = _call(app, "choose_sea_battle_opponent_move", gameId=game_id)
+    assert choice["suggestedMove"] in choice["moves"]
+    assert _stream_position(sessions, game_id, "sea_battle") > placed
+
+
+def test_game_id_resolves_the_stored_state():
+    sessions = InMemorySessionStore()
+    app = _app(sessions)
+    game = _call(app, "new_tic_tac_toe_game")
+    moves = _call(app, "legal_tic_tac_toe_moves", gameId=game["gameId"])["moves"]
+    assert moves == _call(app, "legal_tic_tac_toe_moves", state=game["state"])["moves"]
+
+    applied = _call(
+        app, "apply_tic_tac_toe_move", gameId=game["gameId"], coord=moves[0]
+    )
+    assert applied["legal"]
+    # The result of a legal move is what the next gameId-only call sees.
+    assert sessions.get(game["gameId"]).state == applied["state"]
+    remaining = _call(app, "legal_tic_tac_toe_moves", gameId=game["gameId"])["moves"]
+    assert moves[0] not in remaining and len(remaining) == len(moves) - 1
+
+
+def test_explicit_state_overrides_the_stored_session():
+    sessions = InMemorySessionStore()
+    app = _app(sessions)
+    game = _call(app, "new_tic_tac_toe_game")
+    coord = _call(app, "legal_tic_tac_toe_moves", gameId=game["gameId"])["moves"][0]
+    _call(app, "apply_tic_tac_toe_move", gameId=game["gameId"], coord=coord)
+
+    # Replaying the first move from the original state is legal again, and
+    # the session now holds that result.
+    replayed = _call(
+        app,
+        "apply_tic_tac_toe_move",
+        gameId=game["gameId"],
+        coord=coord,
+        state=game["state"],
+    )
+    assert replayed["legal"]
+    assert sessions.get(game["gameId"]).state == replayed["state"]
+
+
+def test_illegal_moves_do_not_overwrite_the_session():
+    sessions = InMemorySessionStore()
+    app = _app(sessions)
+    game = _call(app, "new_tic_tac_toe_game")
+    result = _call(app, "apply_tic_tac_toe_move", gameId=game["gameId"], coord="Z9")
+    assert result["legal"] is False
+    assert sessions.get(game["gameId"]).state == game["state"]
+
+
+def test_unknown_and_expired_game_ids_are_rejected():
+    now = [0.0]
+    sessions = InMemorySessionStore(ttl_seconds=10, clock=lambda: now[0])
+    app = _app(sessions)
+    game = _call(app, "new_tic_tac_toe_game")
+
+    unknown = _call(app, "legal_tic_tac_toe_moves", gameId="missing")
+    assert unknown["moves"] == [] and "Unknown or expired gameId" in unknown["error"]
+
+    now[0] = 60.0
+    expired = _call(app, "apply_tic_tac_toe_move", gameId=game["gameId"], coord="A1")
+    assert expired["legal"] is False
+    assert "Unknown or expired gameId" in expired["error"]
+    assert sessions.get(game["gameId"]) is None
+
+
+def test_game_ids_of_another_game_type_are_rejected():
+    sessions = InMemorySessionStore()
+    app = _app(sessions)
+    game_id = _call(app, "new_mancala_game")["gameId"]
+    result = _call(app, "legal_tic_tac_toe_moves", gameId=game_id)
+    assert result["moves"] == [] and "Unknown or expired gameId" in result["error"]
+    assert sessions.get(game_id).game_type == "mancala"
+
+
+def test_stateless_mode_requires_the_state():
+    app = _app()
+    game = _call(app, "new_tic_tac_toe_game")
+    result = _call(app, "legal_tic_tac_toe_moves", gameId=game["gameId"])
+    assert result["moves"] == [] and "sessions are disabled" in result["error"]
+    assert _call(app, "legal_tic_tac_toe_moves", state=game["state"])["moves"]
+
+
+
+def _forbid_parsing(monkeypatch, *targets):
+    def parse_state(state):
+        raise AssertionError("a stored gameId state was parsed again")
+
+    for module, name in targets:
+        monkeypatch.setattr(module, name, parse_state)
+
+
+def test_sea_battle_sessions_keep_the_parsed_state(fixed_secret, monkeypatch):
+    sessions = InMemorySessionStore()
+    app = _app(sessions)
+    game_id = _call(app, "new_sea_battle_game")["gameId"]
+    stored = sessions.get(game_id)
+    assert stored.parsed == sea_battle_rules.parse_state(stored.state)
+
+    _forbid_parsing(
+        monkeypatch,
+        (sea_battle_rules, "parse_state"),
+        (sea_battle_engine, "parse_state"),
+        (tools, "parse_sea_battle_state"),
+    )
+    moves = _call(app, "legal_sea_battle_moves", gameId=game_id)["moves"]
+    assert len(moves) == 100
+    applied = _call(app, "apply_sea_battle_move", gameId=game_id, coord=moves[0])
+    assert applied["legal"] and applied["turn"] == "opponent"
+    choice = _call(app, "choose_sea_battle_opponent_move", gameId=game_id)
+    assert choice["suggestedMove"] in choice["moves"]
+    monkeypatch.undo()
+
+    stored = sessions.get(game_id)
+    assert stored.state == applied["state"]
+    assert stored.parsed == sea_battle_rules.parse_state(stored.state)
+
+
+def test_blackjack_sessions_keep_the_parsed_state(fixed_secret, monkeypatch):
+    sessions = InMemorySessionStore()
+    app = _app(sessions)
+    game_id = _call(app, "new_blackjack_game")["gameId"]
+
+    _forbid_parsing(
+        monkeypatch,
+        (blackjack_rules, "parse_state"),
+        (blackjack_analysis, "parse_state"),
+        (blackjack_strategy, "parse_state"),
+        (tools, "parse_blackjack_state"),
+    )
+    legal = _call(app, "legal_blackjack_actions", gameId=game_id)
+    analysis = _call(app, "analyze_blackjack_hand", gameId=game_id, budgetMs=20)
+    assert "error" not in analysis
+    if legal["actions"]:
+        applied = _call(app, "apply_blackjack_action", gameId=game_id, action="stand")
+        assert applied["legal"]
+    monkeypatch.undo()
+
+    stored = sessions.get(game_id)
+    assert blackjack_rules.serialize_state(stored.parsed) == stored.state
+
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+def test_full_executor_reports_busy_with_a_retry_hint():
+    executor = ToolExecutor(EXECUTOR_THREAD, max_workers=1, max_queue=0)
+    app = _app(executor=executor)
+    release = threading.Event()
+
+    async def main():
+        blocker = asyncio.ensure_future(executor.run("block", release.wait, 5))
+        await asyncio.sleep(0.05)  # let the blocker take the only slot
+        try:
+            async with Client(app) as client:
+                result = await client.call_tool(
+                    "legal_chess_moves", {"fen": START_FEN}, raise_on_error=False
+                )
+                return result.structured_content
+        finally:
+            release.set()
+            await blocker
+
+    try:
+        payload = asyncio.run(main())
+    finally:
+        executor.shutdown()
+    assert payload["busy"] is True and payload["retryAfterMs"] > 0
+    assert payload["movesUci"] == [] and payload["error"]
+
+
+def test_slow_calls_time_out_with_a_flag():
+    executor = ToolExecutor(
+        EXECUTOR_THREAD, timeouts={"choose_four_in_a_row_opponent_move": 0.01}
+    )
+    sessions = InMemorySessionStore()
+    app = _app(sessions, executor)
+    try:
+        game_id = _call(app, "new_four_in_a_row_game")["gameId"]
+        payload = _call(
+            app, "choose_four_in_a_row_opponent_move", gameId=game_id, budgetMs=2000
+        )
+    finally:
+        executor.shutdown()
+    assert payload["timedOut"] is True and payload["error"]
+    # The handler still answers with the plain legal moves.
+    assert payload["moves"]
+
+
+def test_process_executor_runs_every_offloaded_tool(fixed_secret):
+    # Everything handed to a process pool is pickled, so this catches
+    # closures, bound methods or locks slipping into offloaded calls.
+    executor = ToolExecutor(EXECUTOR_PROCESS, max_workers=2)
+    sessions = InMemorySessionStore()
+    app = _app(sessions, executor)
+    try:
+        games = {
+            name: _call(app, f"new_{name}_game")["gameId"]
+            for name in (
+                "checkers",
+                "blackjack",
+                "sea_battle",
+                "slot",
+                "four_in_a_row",
+                "mancala",
+            )
+        }
+        calls = [
+            ("legal_chess_moves", {"fen": START_FEN}),
+            (
+                "choose_chess_opponent_move",
+                {"fen": START_FEN, "budgetMs": 50, "useBook": False},
+            ),
+            ("choose_checkers_opponent_move", {"gameId": games["checkers"]}),
+            ("analyze_blackjack_hand", {"gameId": games["blackjack"], "budgetMs": 50}),
+            ("roll_rpg_dice", {"expression": "2d6+1"}),
+            ("choose_sea_battle_opponent_move", {"gameId": games["sea_battle"]}),
+            (
+                "slot_statistics",
+                {"gameId": games["slot"], "sessionCount": 20, "budgetMs": 50},
+            ),
+            (
+                "choose_four_in_a_row_opponent_move",
+                {"gameId": games["four_in_a_row"], "budgetMs": 50},
+            ),
+            (
+                "choose_mancala_opponent_move",
+                {"gameId": games["mancala"], "budgetMs": 50},
+            ),
+        ]
+        for name, arguments in calls:
+            payload = _call(app, name, **arguments)
+            assert "error" not in payload, (name, payload)
+            assert "distributionError" not in payload, (name, payload)
+    finally:
+        executor.shutdown()
@@ -0,0 +1,74 @@
+from pathlib import Path
+import os
+import sys
+
+import pytest
+from fastmcp.exceptions import ResourceError
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from widget_bundles import WidgetBundleRegistry  # noqa: E402
+
+URI = "ui://widget/test-v1.html"
+
+
+def write_sources(tmp_path, js="console.log(1);"):
+    template = tmp_path / "widget.html"
+    js_path = tmp_path / "widget.js"
+    css_path = tmp_path / "widget.css"
+    template.write_text(
+        "<style>/* INLINE_CSS */</style><script>/* INLINE_JS */</script>",
+        encoding="utf-8",
+    )
+    js_path.write_text(js, encoding="utf-8")
+    css_path.write_text("body{}", encoding="utf-8")
+    return template, js_path, css_path
+
+
+def test_bundle_is_assembled_once(tmp_path):
+    registry = WidgetBundleRegistry(revalidate_seconds=0)
+    registry.register(URI, *write_sources(tmp_path))
+    first = registry.get(URI)
+    second = registry.get(URI)
+    assert first is second
+    assert first.html == "<style>body{}</style><script>console.log(1);</script>"
+    assert len(first.sha256) == 64
+    assert registry.cached(URI) is first
+    assert registry.stats() == {"hits": 1, "misses": 1, "cached": 1}
+
+
+def test_bundle_rebuilds_when_source_mtime_changes(tmp_path):
+    registry = WidgetBundleRegistry(revalidate_seconds=0)
+    template, js_path, css_path = write_sources(tmp_path)
+    registry.register(URI, template, js_path, css_path)
+    first = registry.get(URI)
+
+    js_path.write_text("console.log(2);", encoding="utf-8")
+    stat = js_path.stat()
+    os.utime(js_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = registry.get(URI)
+    assert "console.log(2);" in second.html
+    assert second.sha256 != first.sha256
+    assert registry.misses == 2
+
+
+def test_revalidation_is_skipped_within_interval(tmp_path):
+    now = [0.0]
+    registry = WidgetBundleRegistry(revalidate_seconds=5, clock=lambda: now[0])
+    template, js_path, css_path = write_sources(tmp_path)
+    registry.register(URI, template, js_path, css_path)
+    registry.get(URI)
+    js_path.unlink()
+    assert registry.get(URI).html
+    now[0] = 10.0
+    with pytest.raises(ResourceError):
+        registry.get(URI)
+
+
+def test_missing_artifacts_raise_resource_error(tmp_path):
+    registry = WidgetBundleRegistry()
+    template = tmp_path / "missing.html"
+    registry.register(URI, template, tmp_path / "a.js", tmp_path / "a.css")
+    with pytest.raises(ResourceError):
+        registry.get(URI)
+    assert registry.warm() == [URI]
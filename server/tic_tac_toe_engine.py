@@ -0,0 +1,184 @@
+"""Perfect-play tic-tac-toe opponent backed by a precomputed negamax table."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import random
+
+try:
+    from .tic_tac_toe_rules import (
+        COLS,
+        EMPTY,
+        ROWS,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        parse_state,
+    )
+    from .rng_service import shared_rng
+except ImportError:  # pragma: no cover - fallback for script execution
+    from tic_tac_toe_rules import (
+        COLS,
+        EMPTY,
+        ROWS,
+        STATUS_IN_PROGRESS,
+        TURN_PLAYER,
+        parse_state,
+    )
+    from rng_service import shared_rng
+
+
+OUTCOME_WIN = "win"
+OUTCOME_DRAW = "draw"
+OUTCOME_LOSS = "loss"
+
+DIFFICULTY_EASY = "easy"
+DIFFICULTY_MEDIUM = "medium"
+DIFFICULTY_HARD = "hard"
+DIFFICULTY_PERFECT = "perfect"
+# Probability of deliberately playing a non-best move at each difficulty.
+MISTAKE_RATES = {
+    DIFFICULTY_EASY: 0.6,
+    DIFFICULTY_MEDIUM: 0.3,
+    DIFFICULTY_HARD: 0.1,
+    DIFFICULTY_PERFECT: 0.0,
+}
+
+SQUARES = ROWS * COLS
+FULL_MASK = (1 << SQUARES) - 1
+# Square index is row * 3 + col, with row 0 being rank 1 (A1 = 0, C3 = 8).
+COORDS = tuple(f"{'ABC'[index % COLS]}{index // COLS + 1}" for index in range(SQUARES))
+WIN_MASKS = (
+    0b000000111,
+    0b000111000,
+    0b111000000,
+    0b001001001,
+    0b010010010,
+    0b100100100,
+    0b100010001,
+    0b001010100,
+)
+
+
+@dataclass(frozen=True)
+class RankedMove:
+    coord: str
+    outcome: str
+    score: int
+
+
+def position_key(mine: int, theirs: int) -> int:
+    """Pack a mover-relative position into an 18-bit key."""
+    return mine | (theirs << SQUARES)
+
+
+def is_win(mask: int) -> bool:
+    return any(mask & line == line for line in WIN_MASKS)
+
+
+def _solve(mine: int, theirs: int) -> int:
+    """Negamax score for the side to move; quicker wins score higher."""
+    key = position_key(mine, theirs)
+    cached = VALUE_TABLE.get(key)
+    if cached is not None:
+        return cached
+    empty = FULL_MASK & ~(mine | theirs)
+    if is_win(theirs) or not empty:
+        score = -(bin(empty).count("1") + 1) if is_win(theirs) else 0
+    else:
+        score = -SQUARES - 1
+        bits = empty
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            score = max(score, -_solve(theirs, mine | bit))
+    VALUE_TABLE[key] = score
+    return score
+
+
+VALUE_TABLE: dict[int, int] = {}
+# Every reachable position is a descendant of the empty board.
+_solve(0, 0)
+
+
+def _outcome(score: int) -> str:
+    if score > 0:
+        return OUTCOME_WIN
+    if score < 0:
+        return OUTCOME_LOSS
+    return OUTCOME_DRAW
+
+
+def _side_masks(state: str) -> tuple[int, int] | None:
+    """Return ``(mover, other)`` masks, or ``None`` when nothing can be played."""
+    try:
+        parsed = parse_state(state)
+    except ValueError:
+        return None
+    if parsed["status"] != STATUS_IN_PROGRESS:
+        return None
+    mover = (
+        parsed["player_symbol"]
+        if parsed["turn"] == TURN_PLAYER
+        else parsed["opponent_symbol"]
+    )
+    mine = theirs = 0
+    for row, cells in enumerate(parsed["grid"]):
+        for col, cell in enumerate(cells):
+            if cell == EMPTY:
+                continue
+            bit = 1 << (row * COLS + col)
+            if cell == mover:
+                mine |= bit
+            else:
+                theirs |= bit
+    return mine, theirs
+
+
+def ranked_moves(state: str) -> list[RankedMove]:
+    """Rank every legal move for the side to move, best first.
+
+    Scores are from the mover's point of view: positive wins (larger is
+    faster), zero draws, negative losses (closer to zero holds out longer).
+    Ties keep board order.
+    """
+    masks = _side_masks(state)
+    if masks is None:
+        return []
+    mine, theirs = masks
+    empty = FULL_MASK & ~(mine | theirs)
+    ranked = []
+    for index in range(SQUARES):
+        bit = 1 << index
+        if empty & bit:
+            score = -_solve(theirs, mine | bit)
+            ranked.append(RankedMove(COORDS[index], _outcome(score), score))
+    ranked.sort(key=lambda move: -move.score)
+    return ranked
+
+
+def choose_move(
+    state: str,
+    difficulty: str = DIFFICULTY_PERFECT,
+    rng: random.Random | None = None,
+) -> str | None:
+    """Pick a move: the best one, or a weaker one at the difficulty's mistake rate."""
+    return pick_ranked_move(ranked_moves(state), difficulty, rng)
+
+
+def pick_ranked_move(
+    ranked: list[RankedMove],
+    difficulty: str = DIFFICULTY_PERFECT,
+    rng: random.Random | None = None,
+) -> str | None:
+    """Like :func:`choose_move`, for moves already ranked by :func:`ranked_moves`."""
+    if difficulty not in MISTAKE_RATES:
+        raise ValueError(f"Unknown difficulty: {difficulty}")
+    if not ranked:
+        return None
+    rng = rng or shared_rng()
+    best_score = ranked[0].score
+    best = [move for move in ranked if move.score == best_score]
+    weaker = ranked[len(best):]
+    if weaker and rng.random() < MISTAKE_RATES[difficulty]:
+        return rng.choice(weaker).coord
+    return rng.choice(best).coord
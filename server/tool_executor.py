@@ -0,0 +1,151 @@
+"""Bounded worker pools for CPU-heavy tool handlers."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import os
+import threading
+from typing import Any, Callable, Mapping
+
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTOR_INLINE = "inline"
+EXECUTOR_KINDS = {EXECUTOR_THREAD, EXECUTOR_PROCESS, EXECUTOR_INLINE}
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_MAX_QUEUE = 32
+DEFAULT_TIMEOUT_SECONDS = 10.0
+# Suggested wait before retrying a rejected call, per queued call ahead of it.
+RETRY_AFTER_MS_PER_QUEUED = 50
+MIN_RETRY_AFTER_MS = 100
+
+
+class ToolBusyError(Exception):
+    """The pool is full; the call was rejected without running."""
+
+    def __init__(self, tool: str, retry_after_ms: int) -> None:
+        super().__init__(f"Server is busy; retry {tool} in about {retry_after_ms} ms.")
+        self.tool = tool
+        self.retry_after_ms = retry_after_ms
+
+
+class ToolTimeoutError(Exception):
+    """The call did not finish within its tool's timeout."""
+
+    def __init__(self, tool: str, timeout: float) -> None:
+        super().__init__(f"{tool} did not finish within {timeout:g} seconds.")
+        self.tool = tool
+        self.timeout = timeout
+
+
+class ToolExecutor:
+    """Runs handler work on a thread or process pool with admission control.
+
+    At most ``max_workers`` calls run at once and ``max_queue`` more may
+    wait; beyond that ``run`` raises ``ToolBusyError`` straight away so a
+    burst of heavy calls cannot pile up behind each other. Each call is
+    awaited for its tool's timeout. A timed-out call that already started
+    keeps its slot until it actually finishes, since pool workers cannot be
+    interrupted. ``inline`` runs work directly on the caller's thread.
+    """
+
+    def __init__(
+        self,
+        kind: str = EXECUTOR_THREAD,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        default_timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        timeouts: Mapping[str, float] | None = None,
+    ) -> None:
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown tool executor: {kind}")
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self.default_timeout = default_timeout
+        self.timeouts = dict(timeouts or {})
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._pool: Executor | None = None
+        if kind == EXECUTOR_THREAD:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="tool"
+            )
+        elif kind == EXECUTOR_PROCESS:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    @property
+    def pending(self) -> int:
+        """Calls running or waiting for a worker."""
+        return self._pending
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def timeout_for(self, tool: str) -> float:
+        return self.timeouts.get(tool, self.default_timeout)
+
+    def _admit(self, tool: str) -> None:
+        with self._lock:
+            if self._pending >= self.capacity:
+                queued = self._pending - self.max_workers + 1
+                retry_after = queued * RETRY_AFTER_MS_PER_QUEUED
+                raise ToolBusyError(tool, max(MIN_RETRY_AFTER_MS, retry_after))
+            self._pending += 1
+
+    def _release(self, _future: Future | None = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(
+        self, tool: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``func(*args, **kwargs)`` for ``tool`` and return its result.
+
+        With a process pool ``func`` and its arguments must be picklable, so
+        pass module-level rules functions and plain values.
+        """
+        if self._pool is None:
+            return func(*args, **kwargs)
+        self._admit(tool)
+        try:
+            future = self._pool.submit(func, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        timeout = self.timeout_for(tool)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            raise ToolTimeoutError(tool, timeout) from None
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def parse_timeouts(text: str) -> dict[str, float]:
+    """Parse ``tool=seconds`` pairs separated by commas."""
+    timeouts = {}
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        tool, separator, seconds = item.partition("=")
+        if not separator:
+            raise ValueError(f"Expected tool=seconds, got '{item.strip()}'.")
+        timeouts[tool.strip()] = float(seconds)
+    return timeouts
+
+
+def create_tool_executor(kind: str = EXECUTOR_THREAD, **options: Any) -> ToolExecutor:
+    """Build the executor for ``kind`` (``thread``, ``process`` or ``inline``)."""
+    return ToolExecutor(kind.strip().lower(), **options)
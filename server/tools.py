@@ -2,58 +2,99 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+import time
 import uuid
-from typing import Literal
+from typing import Any, Callable, Iterator, Literal
 
 import chess
 from fastmcp import FastMCP
 from fastmcp.tools.tool import ToolResult
 
 try:
-    from .chess_rules import apply_uci_move, legal_moves_uci, opponent_move_candidates
+    from .chess_rules import apply_uci_move, legal_moves_uci, position_info
+    from .chess_book import choose_book_move
+    from .chess_engine import (
+        DEFAULT_BUDGET_MS as CHESS_BUDGET_MS,
+        DEFAULT_TOP_MOVES as CHESS_TOP_MOVES,
+        search_chess,
+    )
     from .blackjack_rules import (
+        DEFAULT_PENETRATION as BLACKJACK_DEFAULT_PENETRATION,
         apply_blackjack_action as apply_blackjack_action_rule,
+        deal_next_hand as deal_next_blackjack_hand_rule,
         initial_blackjack_state,
         legal_dealer_actions,
         legal_player_actions,
         parse_state as parse_blackjack_state,
         serialize_state as serialize_blackjack_state,
     )
-    from .rpg_dice_rules import roll_dice
+    from .blackjack_analysis import (
+        DEFAULT_BUDGET_MS as BLACKJACK_ANALYSIS_BUDGET_MS,
+        analyze_hand as analyze_blackjack_hand_rule,
+    )
+    from .blackjack_strategy import advise as blackjack_strategy_advice
+    from .rpg_dice_analysis import expression_distribution
+    from .rng_service import CounterRandom, game_rng
+    from .rpg_dice_rules import (
+        dice_expression,
+        parse_expression as parse_dice_expression,
+        roll_expression,
+    )
     from .sea_battle_rules import (
         apply_sea_battle_move as apply_sea_battle_move_rule,
         initial_sea_battle_state,
         legal_sea_battle_moves as legal_sea_battle_moves_rule,
-        opponent_move_candidates as sea_battle_opponent_moves,
         parse_state as parse_sea_battle_state,
     )
+    from .sea_battle_engine import target_cells as sea_battle_target_cells
     from .slot_rules import (
         initial_slot_state,
         parse_state as parse_slot_state,
         serialize_state as serialize_slot_state,
         spin_slot as spin_slot_rule,
+        spin_slot_batch as spin_slot_batch_rule,
+    )
+    from .slot_analysis import (
+        DEFAULT_BUDGET_MS as SLOT_SIMULATION_BUDGET_MS,
+        DEFAULT_MAX_SPINS as SLOT_SIMULATION_MAX_SPINS,
+        DEFAULT_SESSIONS as SLOT_SIMULATION_SESSIONS,
+        paytable_statistics,
+        simulate_sessions as simulate_slot_sessions,
     )
     from .four_in_a_row_rules import (
         apply_four_in_a_row_move as apply_four_in_a_row_move_rule,
         initial_four_in_a_row_state,
         legal_four_in_a_row_moves as legal_four_in_a_row_moves_rule,
-        opponent_move_candidates as four_in_a_row_opponent_moves,
         parse_state as parse_four_in_a_row_state,
     )
+    from .four_in_a_row_engine import (
+        DEFAULT_BUDGET_MS as FOUR_IN_A_ROW_BUDGET_MS,
+        search_four_in_a_row,
+    )
     from .tic_tac_toe_rules import (
         apply_tic_tac_toe_move as apply_tic_tac_toe_move_rule,
         initial_tic_tac_toe_state,
         legal_tic_tac_toe_moves as legal_tic_tac_toe_moves_rule,
-        opponent_move_candidates as tic_tac_toe_opponent_moves,
         parse_state as parse_tic_tac_toe_state,
     )
+    from .tic_tac_toe_engine import (
+        pick_ranked_move as pick_tic_tac_toe_move,
+        ranked_moves as ranked_tic_tac_toe_moves,
+    )
     from .mancala_rules import (
         apply_mancala_move as apply_mancala_move_rule,
         initial_mancala_state,
         legal_mancala_moves as legal_mancala_moves_rule,
-        opponent_move_candidates as mancala_opponent_moves,
         parse_state as parse_mancala_state,
     )
+    from .mancala_engine import (
+        DEFAULT_BUDGET_MS as MANCALA_BUDGET_MS,
+        search_mancala,
+    )
+    from .metrics import record_phase
+    from .session_store import SessionStore
+    from .tool_executor import ToolBusyError, ToolExecutor, ToolTimeoutError
     from .checkers_rules import (
         all_checkers_moves,
         apply_checkers_move as apply_checkers_move_rule,
@@ -63,50 +104,89 @@ try:
         parse_state as parse_checkers_state,
     )
 except ImportError:  # pragma: no cover - fallback for script execution
-    from chess_rules import apply_uci_move, legal_moves_uci, opponent_move_candidates
+    from chess_rules import apply_uci_move, legal_moves_uci, position_info
+    from chess_book import choose_book_move
+    from chess_engine import (
+        DEFAULT_BUDGET_MS as CHESS_BUDGET_MS,
+        DEFAULT_TOP_MOVES as CHESS_TOP_MOVES,
+        search_chess,
+    )
     from blackjack_rules import (
+        DEFAULT_PENETRATION as BLACKJACK_DEFAULT_PENETRATION,
         apply_blackjack_action as apply_blackjack_action_rule,
+        deal_next_hand as deal_next_blackjack_hand_rule,
         initial_blackjack_state,
         legal_dealer_actions,
         legal_player_actions,
         parse_state as parse_blackjack_state,
         serialize_state as serialize_blackjack_state,
     )
-    from rpg_dice_rules import roll_dice
+    from blackjack_analysis import (
+        DEFAULT_BUDGET_MS as BLACKJACK_ANALYSIS_BUDGET_MS,
+        analyze_hand as analyze_blackjack_hand_rule,
+    )
+    from blackjack_strategy import advise as blackjack_strategy_advice
+    from rpg_dice_analysis import expression_distribution
+    from rng_service import CounterRandom, game_rng
+    from rpg_dice_rules import (
+        dice_expression,
+        parse_expression as parse_dice_expression,
+        roll_expression,
+    )
     from sea_battle_rules import (
         apply_sea_battle_move as apply_sea_battle_move_rule,
         initial_sea_battle_state,
         legal_sea_battle_moves as legal_sea_battle_moves_rule,
-        opponent_move_candidates as sea_battle_opponent_moves,
         parse_state as parse_sea_battle_state,
     )
+    from sea_battle_engine import target_cells as sea_battle_target_cells
     from slot_rules import (
         initial_slot_state,
         parse_state as parse_slot_state,
         serialize_state as serialize_slot_state,
         spin_slot as spin_slot_rule,
+        spin_slot_batch as spin_slot_batch_rule,
+    )
+    from slot_analysis import (
+        DEFAULT_BUDGET_MS as SLOT_SIMULATION_BUDGET_MS,
+        DEFAULT_MAX_SPINS as SLOT_SIMULATION_MAX_SPINS,
+        DEFAULT_SESSIONS as SLOT_SIMULATION_SESSIONS,
+        paytable_statistics,
+        simulate_sessions as simulate_slot_sessions,
     )
     from four_in_a_row_rules import (
         apply_four_in_a_row_move as apply_four_in_a_row_move_rule,
         initial_four_in_a_row_state,
         legal_four_in_a_row_moves as legal_four_in_a_row_moves_rule,
-        opponent_move_candidates as four_in_a_row_opponent_moves,
         parse_state as parse_four_in_a_row_state,
     )
+    from four_in_a_row_engine import (
+        DEFAULT_BUDGET_MS as FOUR_IN_A_ROW_BUDGET_MS,
+        search_four_in_a_row,
+    )
     from tic_tac_toe_rules import (
         apply_tic_tac_toe_move as apply_tic_tac_toe_move_rule,
         initial_tic_tac_toe_state,
         legal_tic_tac_toe_moves as legal_tic_tac_toe_moves_rule,
-        opponent_move_candidates as tic_tac_toe_opponent_moves,
         parse_state as parse_tic_tac_toe_state,
     )
+    from tic_tac_toe_engine import (
+        pick_ranked_move as pick_tic_tac_toe_move,
+        ranked_moves as ranked_tic_tac_toe_moves,
+    )
     from mancala_rules import (
         apply_mancala_move as apply_mancala_move_rule,
         initial_mancala_state,
         legal_mancala_moves as legal_mancala_moves_rule,
-        opponent_move_candidates as mancala_opponent_moves,
         parse_state as parse_mancala_state,
     )
+    from mancala_engine import (
+        DEFAULT_BUDGET_MS as MANCALA_BUDGET_MS,
+        search_mancala,
+    )
+    from metrics import record_phase
+    from session_store import SessionStore
+    from tool_executor import ToolBusyError, ToolExecutor, ToolTimeoutError
     from checkers_rules import (
         all_checkers_moves,
         apply_checkers_move as apply_checkers_move_rule,
@@ -126,6 +206,10 @@ FOUR_IN_A_ROW_WIDGET_TEMPLATE_URI = "ui://widget/four-in-a-row-v1.html"
 TIC_TAC_TOE_WIDGET_TEMPLATE_URI = "ui://widget/tic-tac-toe-v1.html"
 MANCALA_WIDGET_TEMPLATE_URI = "ui://widget/mancala-board-v1.html"
 OPPONENT_MOVE_CAP = 20
+# Per-total dice odds are listed only for narrow distributions (e.g. 1d100).
+MAX_LISTED_DICE_TOTALS = 101
+# Session records holding how far each game's random stream has been drawn.
+RNG_STREAM_GAME_TYPE = "rng_stream"
 
 
 def _tool_meta(
@@ -141,8 +225,127 @@ def _tool_meta(
     return meta
 
 
-def register_tools(app: FastMCP) -> None:
-    """Register MCP tools on the provided FastMCP app instance."""
+def _resolve_state(
+    sessions: SessionStore | None,
+    game_id: str | None,
+    state: str | None,
+    game_type: str,
+) -> tuple[str | None, str | None]:
+    """Return (state, error), preferring an explicit state over the session."""
+    resolved, _, error = _resolve_parsed(sessions, game_id, state, game_type)
+    return resolved, error
+
+
+def _resolve_parsed(
+    sessions: SessionStore | None,
+    game_id: str | None,
+    state: str | None,
+    game_type: str,
+) -> tuple[str | None, Any, str | None]:
+    """Return (state, parsed, error) like ``_resolve_state``.
+
+    ``parsed`` is the session's parsed state when the store still has it and
+    no explicit state was passed; otherwise ``None`` and the rules parse the
+    string themselves.
+    """
+    if state:
+        return state, None, None
+    if sessions is None:
+        return None, None, "State is required: server-side game sessions are disabled."
+    if not game_id:
+        return None, None, "Provide the game state or a gameId."
+    session = sessions.get(game_id)
+    if session is None or session.game_type != game_type:
+        return None, None, "Unknown or expired gameId; pass the full state instead."
+    return session.state, session.parsed, None
+
+
+def _remember(
+    sessions: SessionStore | None,
+    game_id: str | None,
+    game_type: str,
+    state: str,
+    parsed: Any = None,
+) -> None:
+    if sessions is not None and game_id:
+        sessions.save(game_id, game_type, state, parsed)
+
+
+def _stream_session_id(game_id: str, purpose: str) -> str:
+    return f"{game_id}\x1frng:{purpose}"
+
+
+@contextmanager
+def _game_stream(
+    sessions: SessionStore | None,
+    game_id: str | None,
+    purpose: str,
+) -> Iterator[CounterRandom]:
+    """The game's random stream, resumed from and saved to the session store.
+
+    The stored position survives restarts, stream eviction and other workers,
+    so a game never sees the same draws twice. Without a store or gameId this
+    is just ``game_rng``.
+    """
+    rng = game_rng(game_id, purpose)
+    if sessions is None or not game_id:
+        yield rng
+        return
+    session_id = _stream_session_id(game_id, purpose)
+    stored = sessions.get(session_id)
+    if stored is not None and stored.game_type == RNG_STREAM_GAME_TYPE:
+        rng.seek(max(rng.position, int(stored.state)))
+    try:
+        yield rng
+    finally:
+        sessions.save(session_id, RNG_STREAM_GAME_TYPE, str(rng.position))
+
+
+async def _offload(
+    executor: ToolExecutor,
+    tool: str,
+    func: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any,
+) -> tuple[Any, dict[str, object] | None]:
+    """Run heavy work on the executor; returns ``(result, failure fields)``.
+
+    A full pool or a timeout yields no result and the payload fields that
+    tell the caller to back off and retry.
+    """
+    started = time.perf_counter()
+    try:
+        result = await executor.run(tool, func, *args, **kwargs)
+        record_phase(tool, "compute", time.perf_counter() - started)
+        return result, None
+    except ToolBusyError as exc:
+        return None, {
+            "error": str(exc),
+            "busy": True,
+            "retryAfterMs": exc.retry_after_ms,
+        }
+    except ToolTimeoutError as exc:
+        return None, {"error": str(exc), "timedOut": True}
+
+
+def register_tools(
+    app: FastMCP,
+    sessions: SessionStore | None = None,
+    executor: ToolExecutor | None = None,
+) -> None:
+    """Register MCP tools on the provided FastMCP app instance.
+
+    When ``sessions`` is provided, ``new_*`` and ``apply_*`` record the latest
+    state per gameId so later calls may pass just the gameId instead of the
+    full state string. Sea Battle and blackjack also store the parsed state,
+    which their rules and engines use instead of parsing the string again.
+    Without a store the tools are fully stateless.
+
+    Search and simulation tools are async and run their heavy work on
+    ``executor`` (a thread pool by default), so they never block the event
+    loop; cheap tools still run inline.
+    """
+    executor = executor or ToolExecutor()
 
     @app.tool(
         name="new_chess_game",
@@ -165,13 +368,15 @@ def register_tools(app: FastMCP) -> None:
             "status": "in_progress",
             "turn": "w",
         }
+        _remember(sessions, game_id, "chess", board.fen())
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="apply_chess_move",
         description=(
-            "Validate and apply a UCI move to the provided FEN. Intended for the "
-            "model to call after the user types a move in chat."
+            "Validate and apply a UCI move to the provided FEN (or the stored "
+            "position for gameId). Intended for the model to call after the user "
+            "types a move in chat."
         ),
         meta=_tool_meta(output_template_uri=CHESS_WIDGET_TEMPLATE_URI),
         annotations={
@@ -180,18 +385,35 @@ def register_tools(app: FastMCP) -> None:
             "destructiveHint": False,
         },
     )
-    def apply_chess_move(gameId: str, fen: str, moveUci: str) -> ToolResult:  # noqa: N803
-        result = apply_uci_move(fen, moveUci)
+    def apply_chess_move(
+        gameId: str,
+        moveUci: str,
+        fen: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, fen, "chess")
+        if resolved is None:
+            payload = {
+                "type": "chess_snapshot",
+                "gameType": "chess",
+                "gameId": gameId,
+                "legal": False,
+                "fen": "",
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        result = apply_uci_move(resolved, moveUci)
         if not result["legal"]:
-            board = chess.Board(result["fen"])
+            info = position_info(result["fen"])
             payload = {
                 "type": "chess_snapshot",
                 "gameType": "chess",
                 "gameId": gameId,
                 "legal": False,
                 "fen": result["fen"],
-                "status": "game_over" if board.is_game_over() else "in_progress",
-                "turn": "w" if board.turn else "b",
+                "status": "game_over" if info.game_over else "in_progress",
+                "turn": info.turn,
+                "nextLegalMovesUci": result["moves"],
                 "error": result["error"],
             }
             return ToolResult(content=[], structured_content=payload)
@@ -206,35 +428,80 @@ def register_tools(app: FastMCP) -> None:
             "turn": result["turn"],
             "lastMove": {"uci": result["uci"], "san": result["san"]},
             "check": result["check"],
+            "nextLegalMovesUci": result["moves"],
         }
+        _remember(sessions, gameId, "chess", result["fen"])
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="legal_chess_moves",
         description=(
-            "List legal moves for a given FEN so the model can interpret chat input."
+            "List legal moves for a given FEN (or gameId) so the model can interpret "
+            "chat input."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def legal_chess_moves(fen: str) -> ToolResult:
+    async def legal_chess_moves(
+        fen: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, fen, "chess")
+        moves, failure = None, None
+        if resolved:
+            moves, failure = await _offload(
+                executor, "legal_chess_moves", legal_moves_uci, resolved
+            )
         payload = {
             "type": "legal_moves",
-            "movesUci": legal_moves_uci(fen),
+            "movesUci": moves or [],
         }
+        if error:
+            payload["error"] = error
+        if failure:
+            payload.update(failure)
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="choose_chess_opponent_move",
         description=(
-            "Return legal moves and opponent selection policy for the "
-            "model-driven opponent turn loop."
+            "Return legal moves ranked by an alpha-beta search (best first), the "
+            "top moves with scores, a suggested move, and the opponent selection "
+            "policy for the model-driven opponent turn loop."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def choose_chess_opponent_move(fen: str) -> ToolResult:
-        moves = opponent_move_candidates(fen, limit=OPPONENT_MOVE_CAP)
+    async def choose_chess_opponent_move(
+        fen: str | None = None,
+        gameId: str | None = None,
+        budgetMs: int = CHESS_BUDGET_MS,
+        topMoves: int = CHESS_TOP_MOVES,
+        useBook: bool = True,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, fen, "chess")
+        book_move, book_moves = None, []
+        if resolved and useBook:
+            with _game_stream(sessions, gameId, "chess") as rng:
+                book_move, book_moves = choose_book_move(resolved, rng)
+        search, failure = None, None
+        if resolved and book_move is None:
+            search, failure = await _offload(
+                executor,
+                "choose_chess_opponent_move",
+                search_chess,
+                resolved,
+                budgetMs,
+                topMoves,
+            )
+        # Positions the engine rejects still get the plain legal list.
+        moves = (search.ranked if search else []) or (
+            legal_moves_uci(resolved) if resolved and not failure else []
+        )
+        if book_moves:
+            # Book moves lead the list; the rest stay available to the model.
+            book_ucis = [entry.uci for entry in book_moves]
+            moves = book_ucis + [move for move in moves if move not in book_ucis]
         content = []
         if not moves:
             content = [
@@ -246,11 +513,39 @@ def register_tools(app: FastMCP) -> None:
         payload = {
             "type": "opponent_choice",
             "movesUci": moves,
+            "scoredMoves": [
+                {
+                    "uci": entry.uci,
+                    "san": entry.san,
+                    "score": entry.score,
+                    "mateIn": entry.mate_in,
+                }
+                for entry in (search.moves if search else [])
+            ],
+            "bookMoves": [
+                {
+                    "uci": entry.uci,
+                    "san": entry.san,
+                    "weight": entry.weight,
+                    "probability": round(entry.probability, 4),
+                }
+                for entry in book_moves
+            ],
+            "fromBook": book_move is not None,
+            "fromTablebase": bool(search and search.tablebase),
+            "suggestedMove": (
+                book_move.uci if book_move else search.best_move if search else None
+            ),
+            "searchDepth": search.depth if search else 0,
             "policy": {
                 "mustChooseFromMovesUci": True,
                 "chooseExactlyOne": True,
             },
         }
+        if error:
+            payload["error"] = error
+        if failure:
+            payload.update(failure)
         return ToolResult(content=content, structured_content=payload)
 
     @app.tool(
@@ -273,13 +568,15 @@ def register_tools(app: FastMCP) -> None:
             "status": "in_progress",
             "turn": "w",
         }
+        _remember(sessions, game_id, "checkers", payload["state"])
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="apply_checkers_move",
         description=(
-            "Validate and apply a checkers move to the provided state. Intended for the "
-            "model to call after the user types a move in chat."
+            "Validate and apply a checkers move to the provided state (or the stored "
+            "state for gameId). Intended for the model to call after the user types "
+            "a move in chat."
         ),
         meta=_tool_meta(output_template_uri=CHECKERS_WIDGET_TEMPLATE_URI),
         annotations={
@@ -288,8 +585,24 @@ def register_tools(app: FastMCP) -> None:
             "destructiveHint": False,
         },
     )
-    def apply_checkers_move(gameId: str, state: str, move: str) -> ToolResult:  # noqa: N803
-        result = apply_checkers_move_rule(state, move)
+    def apply_checkers_move(
+        gameId: str,
+        move: str,
+        state: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "checkers")
+        if resolved is None:
+            payload = {
+                "type": "checkers_snapshot",
+                "gameType": "checkers",
+                "gameId": gameId,
+                "legal": False,
+                "state": "",
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        result = apply_checkers_move_rule(resolved, move)
         if not result.legal:
             status = "in_progress"
             turn = None
@@ -318,22 +631,40 @@ def register_tools(app: FastMCP) -> None:
             "status": result.status,
             "turn": result.turn,
             "lastMove": {"notation": result.last_move},
+            "nextLegalMoves": result.next_legal_moves,
+            "mustCapture": result.must_capture,
         }
         if result.winner:
             payload["winner"] = result.winner
+        _remember(sessions, gameId, "checkers", result.state)
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="legal_checkers_moves",
         description=(
-            "List legal checkers moves for a given state so the model can interpret chat "
-            "input."
+            "List legal checkers moves for a given state (or gameId) so the model can "
+            "interpret chat input."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def legal_checkers_moves(state: str) -> ToolResult:
-        capture_moves, simple_moves = all_checkers_moves(state)
+    def legal_checkers_moves(
+        state: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "checkers")
+        if resolved is None:
+            payload = {
+                "type": "legal_moves",
+                "gameType": "checkers",
+                "moves": [],
+                "forcedCaptures": [],
+                "mustCapture": False,
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        capture_moves, simple_moves = all_checkers_moves(resolved)
         must_capture = bool(capture_moves)
         all_moves = capture_moves + [
             move for move in simple_moves if move not in capture_moves
@@ -356,8 +687,21 @@ def register_tools(app: FastMCP) -> None:
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def choose_checkers_opponent_move(state: str) -> ToolResult:
-        moves = checkers_opponent_move_candidates(state, limit=OPPONENT_MOVE_CAP)
+    async def choose_checkers_opponent_move(
+        state: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "checkers")
+        moves, failure = None, None
+        if resolved:
+            moves, failure = await _offload(
+                executor,
+                "choose_checkers_opponent_move",
+                checkers_opponent_move_candidates,
+                resolved,
+                limit=OPPONENT_MOVE_CAP,
+            )
+        moves = moves or []
         content = []
         if not moves:
             content = [
@@ -375,6 +719,10 @@ def register_tools(app: FastMCP) -> None:
                 "chooseExactlyOne": True,
             },
         }
+        if error:
+            payload["error"] = error
+        if failure:
+            payload.update(failure)
         return ToolResult(content=content, structured_content=payload)
 
     @app.tool(
@@ -390,6 +738,8 @@ def register_tools(app: FastMCP) -> None:
     def new_blackjack_game(
         stack: int | float | None = None,
         bet: int | float | None = None,
+        decks: int = 1,
+        penetration: float = BLACKJACK_DEFAULT_PENETRATION,
     ) -> ToolResult:
         resolved_stack = 1000.0 if stack is None else float(stack)
         if resolved_stack <= 0:
@@ -432,12 +782,35 @@ def register_tools(app: FastMCP) -> None:
             return ToolResult(content=[], structured_content=payload)
 
         game_id = f"g_{uuid.uuid4().hex}"
-        state = initial_blackjack_state(stack=resolved_stack, bet=resolved_bet)
+        try:
+            with _game_stream(sessions, game_id, "blackjack") as rng:
+                state = initial_blackjack_state(
+                    stack=resolved_stack,
+                    bet=resolved_bet,
+                    decks=decks,
+                    penetration=penetration,
+                    rng=rng,
+                )
+        except ValueError as exc:
+            payload = {
+                "type": "blackjack_snapshot",
+                "gameType": "blackjack",
+                "gameId": "unknown",
+                "state": "",
+                "status": "in_progress",
+                "turn": "player",
+                "legal": False,
+                "error": str(exc),
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        serialized = serialize_blackjack_state(state)
+        _remember(sessions, game_id, "blackjack", serialized, state)
         payload = {
             "type": "blackjack_snapshot",
             "gameType": "blackjack",
             "gameId": game_id,
-            "state": serialize_blackjack_state(state),
+            "state": serialized,
             "status": state.status,
             "turn": state.turn,
             "lastAction": state.last_action,
@@ -449,8 +822,9 @@ def register_tools(app: FastMCP) -> None:
     @app.tool(
         name="apply_blackjack_action",
         description=(
-            "Validate and apply a blackjack action to the provided state. Intended for "
-            "the model to call after the user types an action in chat."
+            "Validate and apply a blackjack action to the provided state (or the "
+            "stored state for gameId). Intended for the model to call after the user "
+            "types an action in chat."
         ),
         meta=_tool_meta(output_template_uri=BLACKJACK_WIDGET_TEMPLATE_URI),
         annotations={
@@ -459,8 +833,26 @@ def register_tools(app: FastMCP) -> None:
             "destructiveHint": False,
         },
     )
-    def apply_blackjack_action(gameId: str, state: str, action: str) -> ToolResult:  # noqa: N803
-        result = apply_blackjack_action_rule(state, action)
+    def apply_blackjack_action(
+        gameId: str,
+        action: str,
+        state: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, parsed, error = _resolve_parsed(
+            sessions, gameId, state, "blackjack"
+        )
+        if resolved is None:
+            payload = {
+                "type": "blackjack_snapshot",
+                "gameType": "blackjack",
+                "gameId": gameId,
+                "legal": False,
+                "state": "",
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        result = apply_blackjack_action_rule(resolved, action, parsed=parsed)
         if not result["legal"]:
             turn = "player"
             status = "in_progress"
@@ -495,23 +887,95 @@ def register_tools(app: FastMCP) -> None:
         }
         if result.get("results"):
             payload["results"] = result["results"]
+        _remember(sessions, gameId, "blackjack", result["state"], result["parsed"])
+        return ToolResult(content=[], structured_content=payload)
+
+    @app.tool(
+        name="deal_next_blackjack_hand",
+        description=(
+            "Deal the next blackjack hand for a finished game (gameId or state), "
+            "keeping its stack and continuing from the same shoe until the cut "
+            "card comes out."
+        ),
+        meta=_tool_meta(output_template_uri=BLACKJACK_WIDGET_TEMPLATE_URI),
+        annotations={
+            "readOnlyHint": False,
+            "openWorldHint": False,
+            "destructiveHint": False,
+        },
+    )
+    def deal_next_blackjack_hand(
+        gameId: str,
+        state: str | None = None,
+        bet: int | float | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, parsed, error = _resolve_parsed(
+            sessions, gameId, state, "blackjack"
+        )
+        if resolved is None:
+            payload = {
+                "type": "blackjack_snapshot",
+                "gameType": "blackjack",
+                "gameId": gameId,
+                "legal": False,
+                "state": "",
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        with _game_stream(sessions, gameId, "blackjack") as rng:
+            result = deal_next_blackjack_hand_rule(resolved, bet, rng, parsed=parsed)
+        if not result["legal"]:
+            payload = {
+                "type": "blackjack_snapshot",
+                "gameType": "blackjack",
+                "gameId": gameId,
+                "legal": False,
+                "state": result["state"],
+                "error": result.get("error") or "Cannot deal the next hand.",
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        payload = {
+            "type": "blackjack_snapshot",
+            "gameType": "blackjack",
+            "gameId": gameId,
+            "legal": True,
+            "state": result["state"],
+            "status": result["status"],
+            "turn": result["turn"],
+            "lastAction": result.get("lastAction"),
+            "handIndex": result.get("handIndex"),
+            "reshuffled": result["reshuffled"],
+            "cardsRemaining": result["cardsRemaining"],
+        }
+        if result.get("results"):
+            payload["results"] = result["results"]
+        _remember(sessions, gameId, "blackjack", result["state"], result["parsed"])
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="legal_blackjack_actions",
         description=(
-            "List legal blackjack actions for the current state so the model can "
-            "interpret chat input."
+            "List legal blackjack actions for the current state (or gameId) so the "
+            "model can interpret chat input."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def legal_blackjack_actions(state: str) -> ToolResult:
+    def legal_blackjack_actions(
+        state: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, parsed, error = _resolve_parsed(
+            sessions, gameId, state, "blackjack"
+        )
         actions: list[str] = []
         turn = "player"
         hand_index = 0
         try:
-            parsed = parse_blackjack_state(state)
+            if parsed is None:
+                parsed = parse_blackjack_state(resolved or "")
             actions = legal_player_actions(parsed)
             turn = parsed.turn
             hand_index = parsed.hand_index
@@ -524,6 +988,8 @@ def register_tools(app: FastMCP) -> None:
             "turn": turn,
             "handIndex": hand_index,
         }
+        if error:
+            payload["error"] = error
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
@@ -535,11 +1001,18 @@ def register_tools(app: FastMCP) -> None:
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def choose_blackjack_dealer_action(state: str) -> ToolResult:
+    def choose_blackjack_dealer_action(
+        state: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, parsed, error = _resolve_parsed(
+            sessions, gameId, state, "blackjack"
+        )
         actions: list[str] = []
         content = []
         try:
-            parsed = parse_blackjack_state(state)
+            if parsed is None:
+                parsed = parse_blackjack_state(resolved or "")
             actions = legal_dealer_actions(parsed)
         except ValueError:
             actions = []
@@ -561,11 +1034,92 @@ def register_tools(app: FastMCP) -> None:
                 "dealerHoleCardVisibility": "hidden_until_dealer_turn_or_game_over",
             },
         }
+        if error:
+            payload["error"] = error
+        return ToolResult(content=content, structured_content=payload)
+
+    @app.tool(
+        name="analyze_blackjack_hand",
+        description=(
+            "Estimate the expected value of each legal blackjack action for the "
+            "current state (or gameId) by simulating the rest of the hand from "
+            "the unseen cards. The dealer's hole card stays hidden."
+        ),
+        meta=_tool_meta(),
+        annotations={"readOnlyHint": True},
+    )
+    async def analyze_blackjack_hand(
+        state: str | None = None,
+        gameId: str | None = None,
+        budgetMs: int = BLACKJACK_ANALYSIS_BUDGET_MS,
+    ) -> ToolResult:  # noqa: N803
+        resolved, parsed, error = _resolve_parsed(
+            sessions, gameId, state, "blackjack"
+        )
+        analysis, advice, failure = None, None, None
+        if resolved:
+            analysis, failure = await _offload(
+                executor,
+                "analyze_blackjack_hand",
+                analyze_blackjack_hand_rule,
+                resolved,
+                budget_ms=budgetMs,
+                parsed=parsed,
+            )
+        if resolved and not failure:
+            advice, failure = await _offload(
+                executor,
+                "analyze_blackjack_hand",
+                blackjack_strategy_advice,
+                resolved,
+                parsed=parsed,
+            )
+        estimates = analysis.actions if analysis else []
+        content = []
+        if not estimates:
+            content = [
+                {
+                    "type": "text",
+                    "text": "No legal actions to analyze; the game is over.",
+                }
+            ]
+        payload = {
+            "type": "blackjack_analysis",
+            "gameType": "blackjack",
+            "turn": analysis.turn if analysis else None,
+            "actions": [
+                {
+                    "action": entry.action,
+                    "ev": entry.ev,
+                    "ciLow": entry.ci_low,
+                    "ciHigh": entry.ci_high,
+                    "rollouts": entry.rollouts,
+                }
+                for entry in estimates
+            ],
+            "bestAction": analysis.best_action if analysis else None,
+            "rollouts": analysis.rollouts if analysis else 0,
+        }
+        if advice is not None:
+            payload["strategy"] = {
+                "action": advice.action,
+                "row": advice.row,
+                "evs": advice.evs,
+            }
+            payload["dealerOutcomes"] = advice.dealer_outcomes
+        if error:
+            payload["error"] = error
+        if failure:
+            payload.update(failure)
         return ToolResult(content=content, structured_content=payload)
 
     @app.tool(
         name="roll_rpg_dice",
-        description="Roll one or more RPG dice (d4, d6, d8, d10, d12, d20, d100).",
+        description=(
+            "Roll RPG dice (d4, d6, d8, d10, d12, d20, d100) by sides and count, "
+            "or by an expression such as 4d6kh3+2, 2d20kl1 or 8d6+1d4, with the "
+            "exact odds of the total."
+        ),
         meta=_tool_meta(output_template_uri=RPG_DICE_WIDGET_TEMPLATE_URI),
         annotations={
             "readOnlyHint": False,
@@ -573,9 +1127,18 @@ def register_tools(app: FastMCP) -> None:
             "destructiveHint": False,
         },
     )
-    def roll_rpg_dice(sides: int, count: int = 1) -> ToolResult:
+    async def roll_rpg_dice(
+        sides: int | None = None,
+        count: int = 1,
+        expression: str | None = None,
+    ) -> ToolResult:
         try:
-            result = roll_dice(sides=sides, count=count)
+            if expression is not None:
+                parsed = parse_dice_expression(expression)
+            elif sides is None:
+                raise ValueError("Provide sides or a dice expression.")
+            else:
+                parsed = dice_expression(sides=sides, count=count)
         except ValueError as exc:
             payload = {
                 "type": "rpg_dice_roll",
@@ -583,21 +1146,57 @@ def register_tools(app: FastMCP) -> None:
                 "legal": False,
                 "sides": sides,
                 "count": count,
+                "expression": expression,
                 "rolls": [],
                 "total": 0,
                 "error": str(exc),
             }
             return ToolResult(content=[], structured_content=payload)
 
+        result = roll_expression(parsed)
+        all_sides = {group.sides for group in parsed.groups}
         payload = {
             "type": "rpg_dice_roll",
             "gameType": "rpg_dice",
             "legal": True,
-            "sides": result.sides,
-            "count": result.count,
+            "sides": all_sides.pop() if len(all_sides) == 1 else None,
+            "count": parsed.dice,
+            "expression": str(parsed),
             "rolls": result.rolls,
-            "total": sum(result.rolls),
+            "total": result.total,
+            "groups": [
+                {
+                    "notation": group.group.notation,
+                    "sign": group.group.sign,
+                    "rolls": group.rolls,
+                    "kept": group.kept,
+                    "subtotal": group.subtotal,
+                }
+                for group in result.groups
+            ],
+            "modifier": parsed.modifier,
+            "distribution": None,
         }
+        distribution, failure = await _offload(
+            executor, "roll_rpg_dice", expression_distribution, parsed
+        )
+        if failure:
+            payload["distributionError"] = failure["error"]
+        if distribution is not None:
+            payload["distribution"] = {
+                "min": distribution.minimum,
+                "max": distribution.maximum,
+                "mean": round(distribution.mean, 4),
+                "stdDev": round(distribution.std_dev, 4),
+                "probabilityOfTotal": round(distribution.probability(result.total), 6),
+                "atLeast": round(distribution.at_least(result.total), 6),
+                "atMost": round(distribution.at_most(result.total), 6),
+            }
+            if len(distribution.probabilities) <= MAX_LISTED_DICE_TOTALS:
+                payload["distribution"]["probabilities"] = [
+                    {"total": distribution.minimum + offset, "probability": round(p, 6)}
+                    for offset, p in enumerate(distribution.probabilities)
+                ]
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
@@ -612,7 +1211,8 @@ def register_tools(app: FastMCP) -> None:
     )
     def new_sea_battle_game() -> ToolResult:
         game_id = f"g_{uuid.uuid4().hex}"
-        state = initial_sea_battle_state()
+        with _game_stream(sessions, game_id, "sea_battle") as rng:
+            state = initial_sea_battle_state(rng)
         payload = {
             "type": "sea_battle_snapshot",
             "gameType": "sea_battle",
@@ -621,13 +1221,18 @@ def register_tools(app: FastMCP) -> None:
             "status": "in_progress",
             "turn": "player",
         }
+        if sessions is not None:
+            # Parsed once here so later gameId calls never parse the four boards.
+            parsed = parse_sea_battle_state(state)
+            _remember(sessions, game_id, "sea_battle", state, parsed)
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="apply_sea_battle_move",
         description=(
-            "Validate and apply a Sea Battle move to the provided state. Intended for "
-            "the model to call after the user types a coordinate in chat."
+            "Validate and apply a Sea Battle move to the provided state (or the stored "
+            "state for gameId). Intended for the model to call after the user types "
+            "a coordinate in chat."
         ),
         meta=_tool_meta(output_template_uri=SEA_BATTLE_WIDGET_TEMPLATE_URI),
         annotations={
@@ -636,8 +1241,26 @@ def register_tools(app: FastMCP) -> None:
             "destructiveHint": False,
         },
     )
-    def apply_sea_battle_move(gameId: str, state: str, coord: str) -> ToolResult:  # noqa: N803
-        result = apply_sea_battle_move_rule(state, coord)
+    def apply_sea_battle_move(
+        gameId: str,
+        coord: str,
+        state: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, parsed, error = _resolve_parsed(
+            sessions, gameId, state, "sea_battle"
+        )
+        if resolved is None:
+            payload = {
+                "type": "sea_battle_snapshot",
+                "gameType": "sea_battle",
+                "gameId": gameId,
+                "legal": False,
+                "state": "",
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        result = apply_sea_battle_move_rule(resolved, coord, parsed=parsed)
         if not result.legal:
             turn = "player"
             status = "in_progress"
@@ -671,36 +1294,68 @@ def register_tools(app: FastMCP) -> None:
         }
         if result.winner:
             payload["winner"] = result.winner
+        _remember(sessions, gameId, "sea_battle", result.state, result.parsed)
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="legal_sea_battle_moves",
         description=(
-            "List legal Sea Battle moves for a given state so the model can interpret "
-            "chat input."
+            "List legal Sea Battle moves for a given state (or gameId) so the model can "
+            "interpret chat input."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def legal_sea_battle_moves(state: str) -> ToolResult:
+    def legal_sea_battle_moves(
+        state: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, parsed, error = _resolve_parsed(
+            sessions, gameId, state, "sea_battle"
+        )
         payload = {
             "type": "legal_moves",
             "gameType": "sea_battle",
-            "moves": legal_sea_battle_moves_rule(state),
+            "moves": (
+                legal_sea_battle_moves_rule(resolved, parsed=parsed) if resolved else []
+            ),
         }
+        if error:
+            payload["error"] = error
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="choose_sea_battle_opponent_move",
         description=(
-            "Return legal moves and opponent selection policy for the model-driven "
-            "Sea Battle opponent turn loop."
+            "Return the most likely ship locations (ranked by placement density, "
+            "with hunt/target mode), a suggested coordinate, and the opponent "
+            "selection policy for the model-driven Sea Battle opponent turn loop."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def choose_sea_battle_opponent_move(state: str) -> ToolResult:
-        moves = sea_battle_opponent_moves(state, limit=OPPONENT_MOVE_CAP)
+    async def choose_sea_battle_opponent_move(
+        state: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, parsed, error = _resolve_parsed(
+            sessions, gameId, state, "sea_battle"
+        )
+        targeting, failure = None, None
+        if resolved:
+            # Ties are broken by a fork, so the pool never advances the game stream.
+            with _game_stream(sessions, gameId, "sea_battle") as rng:
+                shot_rng = rng.fork()
+            targeting, failure = await _offload(
+                executor,
+                "choose_sea_battle_opponent_move",
+                sea_battle_target_cells,
+                resolved,
+                shot_rng,
+                parsed,
+            )
+        ranked = targeting.cells[:OPPONENT_MOVE_CAP] if targeting else []
+        moves = [cell.coord for cell in ranked]
         content = []
         if not moves:
             content = [
@@ -713,11 +1368,21 @@ def register_tools(app: FastMCP) -> None:
             "type": "opponent_choice",
             "gameType": "sea_battle",
             "moves": moves,
+            "rankedMoves": [
+                {"coord": cell.coord, "weight": cell.weight} for cell in ranked
+            ],
+            "mode": targeting.mode if targeting else None,
+            "remainingFleet": targeting.remaining_fleet if targeting else [],
+            "suggestedMove": moves[0] if moves else None,
             "policy": {
                 "mustChooseFromMoves": True,
                 "chooseExactlyOne": True,
             },
         }
+        if error:
+            payload["error"] = error
+        if failure:
+            payload.update(failure)
         return ToolResult(content=content, structured_content=payload)
 
     @app.tool(
@@ -748,10 +1413,14 @@ def register_tools(app: FastMCP) -> None:
             }
             return ToolResult(content=[], structured_content=payload)
 
+        game_id = f"g_{uuid.uuid4().hex}"
+        serialized = serialize_slot_state(state)
+        _remember(sessions, game_id, "slot", serialized)
         payload = {
             "type": "slot_snapshot",
             "gameType": "slot",
-            "state": serialize_slot_state(state),
+            "gameId": game_id,
+            "state": serialized,
             "stack": state.stack,
             "bet": state.bet,
             "reels": state.reels,
@@ -763,7 +1432,7 @@ def register_tools(app: FastMCP) -> None:
 
     @app.tool(
         name="spin_slot",
-        description="Spin the slot reels for the given state.",
+        description="Spin the slot reels for the given state (or gameId).",
         meta=_tool_meta(output_template_uri=SLOT_WIDGET_TEMPLATE_URI),
         annotations={
             "readOnlyHint": False,
@@ -771,8 +1440,23 @@ def register_tools(app: FastMCP) -> None:
             "destructiveHint": False,
         },
     )
-    def spin_slot(state: str) -> ToolResult:
-        result = spin_slot_rule(state)
+    def spin_slot(
+        state: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "slot")
+        if resolved is None:
+            payload = {
+                "type": "slot_snapshot",
+                "gameType": "slot",
+                "legal": False,
+                "state": "",
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        with _game_stream(sessions, gameId, "slot") as rng:
+            result = spin_slot_rule(resolved, rng)
         if not result["legal"]:
             status = "in_progress"
             try:
@@ -802,6 +1486,173 @@ def register_tools(app: FastMCP) -> None:
             "status": result["status"],
             "lastAction": result["lastAction"],
         }
+        if gameId:
+            payload["gameId"] = gameId
+        _remember(sessions, gameId, "slot", result["state"])
+        return ToolResult(content=[], structured_content=payload)
+
+    @app.tool(
+        name="spin_slot_batch",
+        description=(
+            "Spin the slot reels up to `count` times (max 1000) in one call for "
+            "the given state (or gameId), optionally stopping on a win, after a "
+            "loss limit, or when the stack crosses a threshold."
+        ),
+        meta=_tool_meta(output_template_uri=SLOT_WIDGET_TEMPLATE_URI),
+        annotations={
+            "readOnlyHint": False,
+            "openWorldHint": False,
+            "destructiveHint": False,
+        },
+    )
+    def spin_slot_batch(
+        count: int,
+        state: str | None = None,
+        gameId: str | None = None,
+        stopOnWin: bool = False,
+        lossLimit: int | float | None = None,
+        stopBelowStack: int | float | None = None,
+        stopAboveStack: int | float | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "slot")
+        if resolved is None:
+            payload = {
+                "type": "slot_snapshot",
+                "gameType": "slot",
+                "legal": False,
+                "state": "",
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        with _game_stream(sessions, gameId, "slot") as rng:
+            result = spin_slot_batch_rule(
+                resolved,
+                count,
+                stop_on_win=stopOnWin,
+                loss_limit=lossLimit,
+                stop_below=stopBelowStack,
+                stop_above=stopAboveStack,
+                rng=rng,
+            )
+        if not result["legal"]:
+            payload = {
+                "type": "slot_snapshot",
+                "gameType": "slot",
+                "legal": False,
+                "state": result["state"],
+                "error": result.get("error") or "Illegal spin.",
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        payload = {
+            "type": "slot_snapshot",
+            "gameType": "slot",
+            "legal": True,
+            "state": result["state"],
+            "stack": result["stack"],
+            "bet": result["bet"],
+            "reels": result["reels"],
+            "payout": result["payout"],
+            "status": result["status"],
+            "lastAction": result["lastAction"],
+            "spins": [
+                {"reels": ",".join(spin["reels"]), "payout": spin["payout"]}
+                for spin in result["spins"]
+            ],
+            "spinCount": result["spinCount"],
+            "totalBet": result["totalBet"],
+            "totalPayout": result["totalPayout"],
+            "net": result["net"],
+            "stoppedBy": result["stoppedBy"],
+        }
+        if gameId:
+            payload["gameId"] = gameId
+        _remember(sessions, gameId, "slot", result["state"])
+        return ToolResult(content=[], structured_content=payload)
+
+    @app.tool(
+        name="slot_statistics",
+        description=(
+            "Report the slot machine's theoretical return (RTP, house edge, "
+            "volatility, hit frequency) and simulate flat-bet sessions for a "
+            "stack and bet (or those of a state/gameId) to estimate risk of "
+            "ruin and session length."
+        ),
+        meta=_tool_meta(),
+        annotations={"readOnlyHint": True},
+    )
+    async def slot_statistics(
+        state: str | None = None,
+        gameId: str | None = None,
+        stack: int | float | None = None,
+        bet: int | float | None = None,
+        sessionCount: int = SLOT_SIMULATION_SESSIONS,
+        maxSpins: int = SLOT_SIMULATION_MAX_SPINS,
+        budgetMs: int = SLOT_SIMULATION_BUDGET_MS,
+    ) -> ToolResult:  # noqa: N803
+        resolved_stack = 1000.0 if stack is None else float(stack)
+        resolved_bet = float(bet) if bet is not None else min(10.0, resolved_stack)
+        if state or gameId:
+            resolved, error = _resolve_state(sessions, gameId, state, "slot")
+            try:
+                parsed = parse_slot_state(resolved or "")
+            except ValueError as exc:
+                payload = {
+                    "type": "slot_statistics",
+                    "gameType": "slot",
+                    "error": error or str(exc),
+                }
+                return ToolResult(content=[], structured_content=payload)
+            resolved_stack, resolved_bet = parsed.stack, parsed.bet
+
+        paytable = paytable_statistics()
+        payload = {
+            "type": "slot_statistics",
+            "gameType": "slot",
+            "stack": resolved_stack,
+            "bet": resolved_bet,
+            "rtp": round(paytable.rtp, 6),
+            "houseEdge": round(paytable.house_edge, 6),
+            "variance": round(paytable.variance, 6),
+            "stdDev": round(paytable.std_dev, 6),
+            "hitFrequency": round(paytable.hit_frequency, 6),
+            "outcomes": [
+                {
+                    "symbol": odds.symbol,
+                    "probability": odds.probability,
+                    "multiplier": odds.multiplier,
+                }
+                for odds in paytable.outcomes
+            ],
+        }
+        try:
+            simulation, failure = await _offload(
+                executor,
+                "slot_statistics",
+                simulate_slot_sessions,
+                resolved_stack,
+                resolved_bet,
+                sessions=sessionCount,
+                max_spins=maxSpins,
+                budget_ms=budgetMs,
+            )
+        except ValueError as exc:
+            payload["error"] = str(exc)
+            return ToolResult(content=[], structured_content=payload)
+        if failure:
+            payload.update(failure)
+            return ToolResult(content=[], structured_content=payload)
+        payload["simulation"] = {
+            "sessions": simulation.sessions,
+            "maxSpins": simulation.max_spins,
+            "spins": simulation.spins,
+            "riskOfRuin": round(simulation.risk_of_ruin, 4),
+            "medianSpins": simulation.median_spins,
+            "meanSpins": round(simulation.mean_spins, 2),
+            "meanFinalStack": round(simulation.mean_final_stack, 2),
+            "observedRtp": round(simulation.observed_rtp, 4),
+        }
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
@@ -825,13 +1676,15 @@ def register_tools(app: FastMCP) -> None:
             "status": "in_progress",
             "turn": "player",
         }
+        _remember(sessions, game_id, "four_in_a_row", state)
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="apply_four_in_a_row_move",
         description=(
-            "Validate and apply a Four-in-a-Row move to the provided state. Intended for "
-            "the model to call after the user types a column number in chat."
+            "Validate and apply a Four-in-a-Row move to the provided state (or the "
+            "stored state for gameId). Intended for the model to call after the user "
+            "types a column number in chat."
         ),
         meta=_tool_meta(output_template_uri=FOUR_IN_A_ROW_WIDGET_TEMPLATE_URI),
         annotations={
@@ -842,10 +1695,22 @@ def register_tools(app: FastMCP) -> None:
     )
     def apply_four_in_a_row_move(
         gameId: str,
-        state: str,
         column: int,
+        state: str | None = None,
     ) -> ToolResult:  # noqa: N803
-        result = apply_four_in_a_row_move_rule(state, column)
+        resolved, error = _resolve_state(sessions, gameId, state, "four_in_a_row")
+        if resolved is None:
+            payload = {
+                "type": "four_in_a_row_snapshot",
+                "gameType": "four_in_a_row",
+                "gameId": gameId,
+                "legal": False,
+                "state": "",
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        result = apply_four_in_a_row_move_rule(resolved, column)
         if not result.legal:
             turn = "player"
             status = "in_progress"
@@ -879,36 +1744,62 @@ def register_tools(app: FastMCP) -> None:
         }
         if result.winner:
             payload["winner"] = result.winner
+        _remember(sessions, gameId, "four_in_a_row", result.state)
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="legal_four_in_a_row_moves",
         description=(
-            "List legal Four-in-a-Row moves for a given state so the model can interpret "
-            "chat input."
+            "List legal Four-in-a-Row moves for a given state (or gameId) so the model "
+            "can interpret chat input."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def legal_four_in_a_row_moves(state: str) -> ToolResult:
+    def legal_four_in_a_row_moves(
+        state: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "four_in_a_row")
         payload = {
             "type": "legal_moves",
             "gameType": "four_in_a_row",
-            "moves": legal_four_in_a_row_moves_rule(state),
+            "moves": legal_four_in_a_row_moves_rule(resolved) if resolved else [],
         }
+        if error:
+            payload["error"] = error
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="choose_four_in_a_row_opponent_move",
         description=(
-            "Return legal moves and opponent selection policy for the model-driven "
-            "Four-in-a-Row opponent turn loop."
+            "Return legal columns scored by an alpha-beta search (best first), a "
+            "suggested column, and the opponent selection policy for the "
+            "model-driven Four-in-a-Row opponent turn loop."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def choose_four_in_a_row_opponent_move(state: str) -> ToolResult:
-        moves = four_in_a_row_opponent_moves(state, limit=OPPONENT_MOVE_CAP)
+    async def choose_four_in_a_row_opponent_move(
+        state: str | None = None,
+        gameId: str | None = None,
+        budgetMs: int = FOUR_IN_A_ROW_BUDGET_MS,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "four_in_a_row")
+        search, failure = None, None
+        if resolved:
+            search, failure = await _offload(
+                executor,
+                "choose_four_in_a_row_opponent_move",
+                search_four_in_a_row,
+                resolved,
+                budgetMs,
+            )
+        scored = search.columns if search else []
+        # Positions the bitboard engine rejects still get the plain legal list.
+        moves = [entry.column for entry in scored] or (
+            legal_four_in_a_row_moves_rule(resolved) if resolved else []
+        )
         content = []
         if not moves:
             content = [
@@ -921,11 +1812,21 @@ def register_tools(app: FastMCP) -> None:
             "type": "opponent_choice",
             "gameType": "four_in_a_row",
             "moves": moves,
+            "scoredMoves": [
+                {"column": entry.column, "score": entry.score, "outcome": entry.outcome}
+                for entry in scored
+            ],
+            "suggestedMove": search.best_column if search else None,
+            "searchDepth": search.depth if search else 0,
             "policy": {
                 "mustChooseFromMoves": True,
                 "chooseExactlyOne": True,
             },
         }
+        if error:
+            payload["error"] = error
+        if failure:
+            payload.update(failure)
         return ToolResult(content=content, structured_content=payload)
 
     @app.tool(
@@ -961,13 +1862,15 @@ def register_tools(app: FastMCP) -> None:
             "status": "in_progress",
             "turn": "player",
         }
+        _remember(sessions, game_id, "tic_tac_toe", state)
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="apply_tic_tac_toe_move",
         description=(
-            "Validate and apply a Tic-Tac-Toe move to the provided state. Intended for "
-            "the model to call after the user types a coordinate in chat."
+            "Validate and apply a Tic-Tac-Toe move to the provided state (or the stored "
+            "state for gameId). Intended for the model to call after the user types "
+            "a coordinate in chat."
         ),
         meta=_tool_meta(output_template_uri=TIC_TAC_TOE_WIDGET_TEMPLATE_URI),
         annotations={
@@ -978,10 +1881,22 @@ def register_tools(app: FastMCP) -> None:
     )
     def apply_tic_tac_toe_move(
         gameId: str,
-        state: str,
         coord: str,
+        state: str | None = None,
     ) -> ToolResult:  # noqa: N803
-        result = apply_tic_tac_toe_move_rule(state, coord)
+        resolved, error = _resolve_state(sessions, gameId, state, "tic_tac_toe")
+        if resolved is None:
+            payload = {
+                "type": "tic_tac_toe_snapshot",
+                "gameType": "tic_tac_toe",
+                "gameId": gameId,
+                "legal": False,
+                "state": "",
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        result = apply_tic_tac_toe_move_rule(resolved, coord)
         if not result.legal:
             turn = "player"
             status = "in_progress"
@@ -1015,36 +1930,54 @@ def register_tools(app: FastMCP) -> None:
         }
         if result.winner:
             payload["winner"] = result.winner
+        _remember(sessions, gameId, "tic_tac_toe", result.state)
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="legal_tic_tac_toe_moves",
         description=(
-            "List legal Tic-Tac-Toe moves for a given state so the model can interpret "
-            "chat input."
+            "List legal Tic-Tac-Toe moves for a given state (or gameId) so the model "
+            "can interpret chat input."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def legal_tic_tac_toe_moves(state: str) -> ToolResult:
+    def legal_tic_tac_toe_moves(
+        state: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "tic_tac_toe")
         payload = {
             "type": "legal_moves",
             "gameType": "tic_tac_toe",
-            "moves": legal_tic_tac_toe_moves_rule(state),
+            "moves": legal_tic_tac_toe_moves_rule(resolved) if resolved else [],
         }
+        if error:
+            payload["error"] = error
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="choose_tic_tac_toe_opponent_move",
         description=(
-            "Return legal moves and opponent selection policy for the model-driven "
-            "Tic-Tac-Toe opponent turn loop."
+            "Return legal moves ranked by perfect-play outcome, a suggested move for "
+            "the requested difficulty, and the opponent selection policy for the "
+            "model-driven Tic-Tac-Toe opponent turn loop."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def choose_tic_tac_toe_opponent_move(state: str) -> ToolResult:
-        moves = tic_tac_toe_opponent_moves(state, limit=OPPONENT_MOVE_CAP)
+    def choose_tic_tac_toe_opponent_move(
+        state: str | None = None,
+        gameId: str | None = None,
+        difficulty: Literal["easy", "medium", "hard", "perfect"] = "perfect",
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "tic_tac_toe")
+        ranked = ranked_tic_tac_toe_moves(resolved) if resolved else []
+        suggested = None
+        if ranked:
+            with _game_stream(sessions, gameId, "tic_tac_toe") as rng:
+                suggested = pick_tic_tac_toe_move(ranked, difficulty, rng)
+        moves = [move.coord for move in ranked]
         content = []
         if not moves:
             content = [
@@ -1057,11 +1990,19 @@ def register_tools(app: FastMCP) -> None:
             "type": "opponent_choice",
             "gameType": "tic_tac_toe",
             "moves": moves,
+            "rankedMoves": [
+                {"move": move.coord, "outcome": move.outcome, "score": move.score}
+                for move in ranked
+            ],
+            "difficulty": difficulty,
+            "suggestedMove": suggested,
             "policy": {
                 "mustChooseFromMoves": True,
                 "chooseExactlyOne": True,
             },
         }
+        if error:
+            payload["error"] = error
         return ToolResult(content=content, structured_content=payload)
 
     @app.tool(
@@ -1084,13 +2025,15 @@ def register_tools(app: FastMCP) -> None:
             "status": "in_progress",
             "turn": "player",
         }
+        _remember(sessions, game_id, "mancala", payload["state"])
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="apply_mancala_move",
         description=(
-            "Validate and apply a Mancala move to the provided state. Intended for "
-            "the model to call after the user types a pit number in chat."
+            "Validate and apply a Mancala move to the provided state (or the stored "
+            "state for gameId). Intended for the model to call after the user types "
+            "a pit number in chat."
         ),
         meta=_tool_meta(output_template_uri=MANCALA_WIDGET_TEMPLATE_URI),
         annotations={
@@ -1101,10 +2044,22 @@ def register_tools(app: FastMCP) -> None:
     )
     def apply_mancala_move(
         gameId: str,
-        state: str,
         pit: int,
+        state: str | None = None,
     ) -> ToolResult:  # noqa: N803
-        result = apply_mancala_move_rule(state, pit)
+        resolved, error = _resolve_state(sessions, gameId, state, "mancala")
+        if resolved is None:
+            payload = {
+                "type": "mancala_snapshot",
+                "gameType": "mancala",
+                "gameId": gameId,
+                "legal": False,
+                "state": "",
+                "error": error,
+            }
+            return ToolResult(content=[], structured_content=payload)
+
+        result = apply_mancala_move_rule(resolved, pit)
         if not result.legal:
             turn = "player"
             status = "in_progress"
@@ -1138,37 +2093,60 @@ def register_tools(app: FastMCP) -> None:
         }
         if result.winner:
             payload["winner"] = result.winner
+        _remember(sessions, gameId, "mancala", result.state)
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="legal_mancala_moves",
         description=(
-            "List legal Mancala pit moves for a given state so the model can "
-            "interpret chat input."
+            "List legal Mancala pit moves for a given state (or gameId) so the model "
+            "can interpret chat input."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def legal_mancala_moves(state: str) -> ToolResult:
-        moves = legal_mancala_moves_rule(state)
+    def legal_mancala_moves(
+        state: str | None = None,
+        gameId: str | None = None,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "mancala")
+        moves = legal_mancala_moves_rule(resolved) if resolved else []
         payload = {
             "type": "legal_moves",
             "gameType": "mancala",
             "moves": moves,
         }
+        if error:
+            payload["error"] = error
         return ToolResult(content=[], structured_content=payload)
 
     @app.tool(
         name="choose_mancala_opponent_move",
         description=(
-            "Return legal moves and opponent selection policy for the model-driven "
+            "Return legal pits ranked by an alpha-beta search (best first), a "
+            "suggested pit, and the opponent selection policy for the model-driven "
             "Mancala opponent turn loop."
         ),
         meta=_tool_meta(),
         annotations={"readOnlyHint": True},
     )
-    def choose_mancala_opponent_move(state: str) -> ToolResult:
-        moves = mancala_opponent_moves(state, limit=OPPONENT_MOVE_CAP)
+    async def choose_mancala_opponent_move(
+        state: str | None = None,
+        gameId: str | None = None,
+        budgetMs: int = MANCALA_BUDGET_MS,
+    ) -> ToolResult:  # noqa: N803
+        resolved, error = _resolve_state(sessions, gameId, state, "mancala")
+        search, failure = None, None
+        if resolved:
+            search, failure = await _offload(
+                executor,
+                "choose_mancala_opponent_move",
+                search_mancala,
+                resolved,
+                budgetMs,
+            )
+        ranked = search.pits if search else []
+        moves = [entry.pit for entry in ranked]
         content = []
         if not moves:
             content = [
@@ -1181,9 +2159,19 @@ def register_tools(app: FastMCP) -> None:
             "type": "opponent_choice",
             "gameType": "mancala",
             "moves": moves,
+            "rankedMoves": [
+                {"pit": entry.pit, "score": entry.score, "exact": entry.exact}
+                for entry in ranked
+            ],
+            "suggestedMove": search.best_pit if search else None,
+            "searchDepth": search.depth if search else 0,
             "policy": {
                 "mustChooseFromMoves": True,
                 "chooseExactlyOne": True,
             },
         }
+        if error:
+            payload["error"] = error
+        if failure:
+            payload.update(failure)
         return ToolResult(content=content, structured_content=payload)
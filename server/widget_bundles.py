@@ -0,0 +1,169 @@
+"""In-memory registry of assembled widget HTML bundles."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from fastmcp.exceptions import ResourceError
+
+
+CSS_PLACEHOLDER = "/* INLINE_CSS */"
+JS_PLACEHOLDER = "/* INLINE_JS */"
+DEFAULT_REVALIDATE_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class WidgetSources:
+    template_path: Path
+    js_path: Path
+    css_path: Path
+
+
+@dataclass(frozen=True)
+class WidgetBundle:
+    html: str
+    sha256: str
+    size: int
+    mtimes: tuple[int, int, int]
+
+
+def assemble_widget_html(template_path: Path, js_path: Path, css_path: Path) -> str:
+    """Inline the built widget JS and CSS into the skybridge template."""
+    if not template_path.exists():
+        raise ResourceError(
+            f"Widget template not found at {template_path}. "
+            "Ensure the template exists and the URI version matches."
+        )
+    if not js_path.exists() or not css_path.exists():
+        raise ResourceError(
+            "Widget build artifacts are missing. "
+            "Run `npm install && npm run build` in the web/ directory "
+            "to generate web/widgets/<game>/dist/widget.js and widget.css."
+        )
+
+    template = template_path.read_text(encoding="utf-8")
+    css = css_path.read_text(encoding="utf-8")
+    js = js_path.read_text(encoding="utf-8")
+
+    if CSS_PLACEHOLDER not in template or JS_PLACEHOLDER not in template:
+        raise ResourceError(
+            "Widget template placeholders are missing. "
+            "Expected /* INLINE_CSS */ and /* INLINE_JS */ markers."
+        )
+
+    return template.replace(CSS_PLACEHOLDER, css).replace(JS_PLACEHOLDER, js)
+
+
+class WidgetBundleRegistry:
+    """Assemble each widget once and serve it from memory.
+
+    Source files are re-stat'ed at most once per ``revalidate_seconds``; a
+    bundle is rebuilt only when one of its source mtimes changes.
+    """
+
+    def __init__(
+        self,
+        *,
+        revalidate_seconds: float = DEFAULT_REVALIDATE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._revalidate_seconds = revalidate_seconds
+        self._clock = clock
+        self._sources: dict[str, WidgetSources] = {}
+        self._bundles: dict[str, WidgetBundle] = {}
+        self._checked_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def register(
+        self,
+        uri: str,
+        template_path: Path,
+        js_path: Path,
+        css_path: Path,
+    ) -> None:
+        with self._lock:
+            self._sources[uri] = WidgetSources(template_path, js_path, css_path)
+            self._bundles.pop(uri, None)
+            self._checked_at.pop(uri, None)
+
+    def uris(self) -> list[str]:
+        return list(self._sources)
+
+    def get(self, uri: str) -> WidgetBundle:
+        sources = self._sources.get(uri)
+        if sources is None:
+            raise ResourceError(f"Unknown widget resource: {uri}")
+
+        now = self._clock()
+        with self._lock:
+            bundle = self._bundles.get(uri)
+            if bundle is not None:
+                if now - self._checked_at.get(uri, 0.0) < self._revalidate_seconds:
+                    self.hits += 1
+                    return bundle
+                mtimes = _source_mtimes(sources)
+                if mtimes == bundle.mtimes:
+                    self._checked_at[uri] = now
+                    self.hits += 1
+                    return bundle
+
+            self.misses += 1
+            self._bundles.pop(uri, None)
+            mtimes = _source_mtimes(sources)
+            html = assemble_widget_html(
+                sources.template_path, sources.js_path, sources.css_path
+            )
+            encoded = html.encode("utf-8")
+            bundle = WidgetBundle(
+                html=html,
+                sha256=hashlib.sha256(encoded).hexdigest(),
+                size=len(encoded),
+                mtimes=mtimes or (0, 0, 0),
+            )
+            self._bundles[uri] = bundle
+            self._checked_at[uri] = now
+            return bundle
+
+    def cached(self, uri: str) -> WidgetBundle | None:
+        """The bundle last assembled for ``uri``, without revalidating it."""
+        with self._lock:
+            return self._bundles.get(uri)
+
+    def html(self, uri: str) -> str:
+        return self.get(uri).html
+
+    def warm(self) -> list[str]:
+        """Build every registered bundle; return the URIs that failed to build."""
+        failed = []
+        for uri in self.uris():
+            try:
+                self.get(uri)
+            except ResourceError:
+                failed.append(uri)
+        return failed
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cached": len(self._bundles),
+            }
+
+
+def _source_mtimes(sources: WidgetSources) -> tuple[int, int, int] | None:
+    try:
+        return (
+            sources.template_path.stat().st_mtime_ns,
+            sources.js_path.stat().st_mtime_ns,
+            sources.css_path.stat().st_mtime_ns,
+        )
+    except OSError:
+        return None
@@ -47,8 +47,8 @@ export default function App() {
         <div>
           <h1>RPG Dice MCP</h1>
           <p className="app__subtitle">
-            Type a roll in chat (e.g., roll 2d6). The widget updates only from tool
-            output.
+            Type a roll in chat (e.g., roll 2d6 or 4d6kh3+2). The widget updates
+            only from tool output.
           </p>
         </div>
       </header>
@@ -63,6 +63,17 @@ export default function App() {
         <div>
           <strong>Total:</strong> {roll?.total ?? "-"}
         </div>
+        {roll?.expression ? (
+          <div>
+            <strong>Roll:</strong> {roll.expression}
+          </div>
+        ) : null}
+        {roll?.distribution ? (
+          <div>
+            <strong>Odds of {roll.total} or more:</strong>{" "}
+            {(roll.distribution.atLeast * 100).toFixed(1)}%
+          </div>
+        ) : null}
       </section>
 
       <section className="tray">